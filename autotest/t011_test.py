@@ -125,8 +125,137 @@ def test_mflist_reducedpumping_fail():
     return
 
 
+def test_mflist_index_file():
+    pth = os.path.join("..", "examples", "data", "preserve_unitnums")
+    opth = os.path.join("temp", "t011")
+    os.makedirs(opth, exist_ok=True)
+    list_file = os.path.join(opth, "testsfr2_tab.lst")
+    with open(os.path.join(pth, "testsfr2_tab.lst")) as src:
+        with open(list_file, "w") as dst:
+            dst.write(src.read())
+    index_file = f"{list_file}.fpidx"
+    if os.path.isfile(index_file):
+        os.remove(index_file)
+
+    mflist = flopy.utils.MfListBudget(list_file)
+    inc = mflist.get_incremental()
+    assert len(inc) == 51
+    assert inc["STORAGE_IN"].dtype == np.float64
+    assert np.allclose(inc["totim"][[0, -1]], [2.9066, 1500.0])
+    assert np.allclose(inc["STORAGE_IN"][0], 2.0057)
+
+    # the budgets are written to the index file and read from it
+    mflist1 = flopy.utils.MfListBudget(list_file, index_file=True)
+    assert os.path.isfile(index_file)
+    mflist2 = flopy.utils.MfListBudget(list_file, index_file=True)
+    for lst in (mflist1, mflist2):
+        assert lst.get_record_names() == mflist.get_record_names()
+        assert lst.get_kstpkper() == mflist.get_kstpkper()
+        assert np.array_equal(lst.get_incremental(), inc)
+        assert np.array_equal(lst.get_cumulative(), mflist.get_cumulative())
+
+    # the index file is not used if the list file is changed
+    with open(list_file, "a") as f:
+        f.write("\n")
+    mflist3 = flopy.utils.MfListBudget(list_file, index_file=True)
+    assert np.array_equal(mflist3.get_incremental(), inc)
+    return
+
+
+def test_mflist_refresh():
+    pth = os.path.join("..", "examples", "data", "mt3d_test", "mf2kmt3d")
+    src_file = os.path.join(pth, "mnw", "t5.lst")
+    opth = os.path.join("temp", "t011")
+    os.makedirs(opth, exist_ok=True)
+    list_file = os.path.join(opth, "t5_refresh.lst")
+    with open(src_file, "rb") as f:
+        src = f.read()
+    mflist = flopy.utils.MfListBudget(src_file)
+
+    # the file is short and then ends in the first budget table, so no
+    # budgets are read until the table has been written
+    i = src.find(b"VOLUMETRIC BUDGET FOR ENTIRE MODEL") + 200
+    with open(list_file, "wb") as f:
+        f.write(src[:100])
+    lst = flopy.utils.MfListBudget(list_file)
+    with open(list_file, "wb") as f:
+        f.write(src[:i])
+    assert lst.refresh() == 0
+    assert lst._nreload == 0
+    assert not lst.isvalid()
+    assert list(lst.follow(timeout=0)) == []
+    with open(list_file, "wb") as f:
+        f.write(src)
+    assert lst.refresh() == len(mflist.inc)
+    assert lst.isvalid()
+    assert lst.get_kstpkper() == mflist.get_kstpkper()
+
+    # write the list file as it would be written by a running model, the
+    # file ends in the middle of a time summary
+    i = src.find(b"TIME SUMMARY AT END", 30000) + 40
+    with open(list_file, "wb") as f:
+        f.write(src[:i])
+    lst = flopy.utils.MfListBudget(list_file)
+    budgets = list(lst.follow(timeout=0))
+    nbudgets = len(budgets)
+    assert 0 < nbudgets < len(mflist.inc)
+    assert lst.refresh() == 0
+
+    exceeded = []
+    with open(list_file, "ab") as f:
+        f.write(src[i : i + 20000])
+    n = lst.refresh(
+        threshold=0.05, callback=lambda inc, cum: exceeded.append(inc)
+    )
+    assert n > 0
+    with open(list_file, "ab") as f:
+        f.write(src[i + 20000 :])
+    n += lst.refresh(
+        threshold=0.05, callback=lambda inc, cum: exceeded.append(inc)
+    )
+    assert nbudgets + n == len(mflist.inc)
+    assert len(exceeded) > 0
+    for inc in exceeded:
+        assert abs(inc["PERCENT_DISCREPANCY"]) > 0.05
+
+    for name in mflist.inc.dtype.names:
+        assert np.array_equal(lst.inc[name], mflist.inc[name])
+        assert np.array_equal(lst.cum[name], mflist.cum[name])
+    assert lst.get_kstpkper() == mflist.get_kstpkper()
+
+    # a new model run truncates the list file, the budgets are read again
+    # from the start of the file
+    i = src.find(b"TIME SUMMARY AT END", 30000) + 40
+    with open(list_file, "wb") as f:
+        f.write(src[:i])
+    assert lst.refresh() == nbudgets
+    assert len(lst.get_kstpkper()) == nbudgets + 1
+    assert lst.get_kstpkper()[:nbudgets] == mflist.get_kstpkper()[:nbudgets]
+    with open(list_file, "ab") as f:
+        f.write(src[i:])
+    assert lst.refresh() == len(mflist.inc) - nbudgets
+    for name in mflist.inc.dtype.names:
+        assert np.array_equal(lst.inc[name], mflist.inc[name])
+
+    # a rewritten file that is longer than the budgets that were read,
+    # follow() yields the budgets of the new file from the start
+    follower = lst.follow(interval=0.0)
+    for _ in range(len(mflist.inc)):
+        next(follower)
+    with open(list_file, "wb") as f:
+        f.write(src.replace(b"MODFLOW", b"modflow"))
+    inc, cum = next(follower)
+    assert inc["totim"] == mflist.inc["totim"][0]
+    assert lst.refresh() == 0
+    for name in mflist.inc.dtype.names:
+        assert np.array_equal(lst.inc[name], mflist.inc[name])
+    return
+
+
 if __name__ == "__main__":
     test_mflistfile()
     test_mflist_reducedpumping()
     test_mflist_reducedpumping_fail()
     test_mf6listfile()
+    test_mflist_index_file()
+    test_mflist_refresh()
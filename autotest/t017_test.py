@@ -1,6 +1,7 @@
 # Test binary and formatted data readers
 import pytest
 import os
+import shutil
 import numpy as np
 import flopy
 from ci_framework import base_test_dir, FlopyTestSetup
@@ -109,6 +110,196 @@ def test_binaryfile_read_context():
     assert str(e.value) == "seek of closed file", str(e.value)
 
 
+def test_binaryfile_read_mmap():
+    fpth = os.path.join(
+        "..",
+        "examples",
+        "data",
+        "mt3d_test",
+        "mf2kmt3d",
+        "MultiDiffusion",
+        "MT3D001.UCN",
+    )
+    ucn = flopy.utils.UcnFile(fpth)
+    ucn_mmap = flopy.utils.UcnFile(fpth, mmap=True)
+    assert ucn.get_times() == ucn_mmap.get_times()
+
+    for totim in ucn.get_times():
+        c0 = ucn.get_data(totim=totim)
+        c1 = ucn_mmap.get_data(totim=totim)
+        assert np.array_equal(c0, c1), "mmap data != data read from file"
+        for k in range(ucn.nlay):
+            c1 = ucn_mmap.get_data(totim=totim, mflay=k)
+            assert not c1.flags.writeable, "mmap layer is not a view"
+            assert np.array_equal(c0[k], c1)
+
+    c0 = ucn.get_alldata()
+    c1 = ucn_mmap.get_alldata()
+    assert np.array_equal(c0, c1, equal_nan=True)
+
+    # nodata=None returns a view of the memory-mapped file
+    c2 = ucn_mmap.get_alldata(nodata=None)
+    assert c2.shape == c0.shape
+    assert not c2.flags.writeable, "get_alldata(nodata=None) is not a view"
+    assert np.array_equal(ucn.get_alldata(mflay=1), c2[:, 1])
+
+    ucn.close()
+    ucn_mmap.close()
+    return
+
+
+def test_binaryfile_read_single_cell():
+    # layers with a single cell keep their two-dimensional shape
+    fpth = os.path.join(
+        "..",
+        "examples",
+        "data",
+        "mf6",
+        "create_tests",
+        "test_transport",
+        "expected_output",
+        "gwf_mst03.hds",
+    )
+    for kwargs in ({}, {"mmap": True}, {"cache_size": 1000}):
+        with flopy.utils.HeadFile(fpth, **kwargs) as h:
+            ntimes = len(h.get_times())
+            assert h.get_data(idx=0).shape == (1, 1, 1)
+            assert h.get_data(idx=0, mflay=0).shape == (1, 1)
+            assert h.get_alldata(mflay=0).shape == (ntimes, 1, 1)
+    return
+
+
+def test_binaryfile_get_ts_multiple_cells():
+    fpth = os.path.join(
+        "..",
+        "examples",
+        "data",
+        "mt3d_test",
+        "mf2kmt3d",
+        "MultiDiffusion",
+        "MT3D001.UCN",
+    )
+    kijlist = [(0, 0, 0), (7, 0, 20), (3, 0, 10), (0, 0, 5), (3, 0, 2)]
+    for mmap in (False, True):
+        ucn = flopy.utils.UcnFile(fpth, mmap=mmap)
+        ts = ucn.get_ts(kijlist)
+        assert ts.shape == (len(ucn.get_times()), len(kijlist) + 1)
+        for itim, totim in enumerate(ucn.get_times()):
+            assert ts[itim, 0] == totim
+            c = ucn.get_data(totim=totim)
+            for istat, (k, i, j) in enumerate(kijlist):
+                assert ts[itim, istat + 1] == c[k, i, j], (
+                    f"time series value for {(k, i, j)} at {totim} "
+                    f"({ts[itim, istat + 1]}) != {c[k, i, j]}"
+                )
+        ucn.close()
+    return
+
+
+def test_binaryfile_index_file():
+    from flopy.utils.binaryfile import read_index_file
+
+    model_ws = f"{base_dir}_test_binaryfile_index_file"
+    test_setup = FlopyTestSetup(verbose=True, test_dirs=model_ws)
+
+    files = (
+        (
+            os.path.join("mf2005_test", "test1tr.gitcbc"),
+            flopy.utils.CellBudgetFile,
+        ),
+        (os.path.join("freyberg", "freyberg.githds"), flopy.utils.HeadFile),
+    )
+    for fname, cls in files:
+        fpth = os.path.join(model_ws, os.path.basename(fname))
+        shutil.copy(os.path.join("..", "examples", "data", fname), fpth)
+        index_file = f"{fpth}.fpidx"
+
+        v0 = cls(fpth)
+        v1 = cls(fpth, index_file=True)
+        assert os.path.isfile(index_file), f"{index_file} was not written"
+        v2 = cls(fpth, index_file=True)
+        for v in (v1, v2):
+            assert np.array_equal(v0.recordarray, v.recordarray)
+            assert np.array_equal(v0.iposarray, v.iposarray)
+            assert v0.get_times() == v.get_times()
+            assert v0.get_kstpkper() == v.get_kstpkper()
+            assert v0.nlay == v.nlay
+        if cls is flopy.utils.CellBudgetFile:
+            assert v0.get_unique_record_names() == v2.get_unique_record_names()
+            for idx in range(v0.get_nrecords()):
+                assert np.array_equal(v0.get_record(idx), v2.get_record(idx))
+        else:
+            assert np.array_equal(v0.get_alldata(), v2.get_alldata())
+        for v in (v0, v1, v2):
+            v.close()
+
+        # a stale index file is ignored and rewritten
+        mtime = os.path.getmtime(fpth) + 10.0
+        os.utime(fpth, (mtime, mtime))
+        assert read_index_file(index_file, fpth) is None
+        v3 = cls(fpth, index_file=True)
+        assert v0.get_times() == v3.get_times()
+        assert read_index_file(index_file, fpth) is not None
+        v3.close()
+    return
+
+
+def test_binaryfile_refresh():
+    model_ws = f"{base_dir}_test_binaryfile_refresh"
+    test_setup = FlopyTestSetup(verbose=True, test_dirs=model_ws)
+
+    files = (
+        (
+            os.path.join("mt3d_test", "mf2kmt3d", "MultiDiffusion"),
+            "MT3D001.UCN",
+            flopy.utils.UcnFile,
+        ),
+        ("mf2005_test", "test1tr.gitcbc", flopy.utils.CellBudgetFile),
+    )
+    for pth, fname, cls in files:
+        fpth = os.path.join("..", "examples", "data", pth, fname)
+        with open(fpth, "rb") as f:
+            data = f.read()
+        v0 = cls(fpth)
+
+        # write the file in pieces that end part way through a record
+        opth = os.path.join(model_ws, fname)
+        nbytes = len(data) // 3 + 7
+        with open(opth, "wb") as f:
+            f.write(data[:nbytes])
+        v1 = cls(opth)
+        nrecords = v1.recordarray.shape[0]
+        assert 0 < nrecords < v0.recordarray.shape[0]
+        assert v1.refresh() == 0, "refresh found records in unchanged file"
+        for nbytes in (2 * len(data) // 3 + 11, len(data)):
+            with open(opth, "ab") as f:
+                f.write(data[f.tell() : nbytes])
+            nrecords += v1.refresh()
+        assert nrecords == v0.recordarray.shape[0]
+        assert np.array_equal(v0.recordarray, v1.recordarray)
+        assert np.array_equal(v0.iposarray, v1.iposarray)
+        assert v0.get_times() == v1.get_times()
+        assert v0.get_kstpkper() == v1.get_kstpkper()
+
+        # follow yields the records that are already in the file
+        if cls is flopy.utils.CellBudgetFile:
+            text = "STREAM LEAKAGE"
+            records = list(v1.follow(text=text, interval=0.0, timeout=0.0))
+            assert len(records) == len(v0.get_data(text=text))
+            kstpkper, totim, text, q = records[-1]
+            assert kstpkper == v0.get_kstpkper()[-1]
+            assert np.array_equal(q, v0.get_data(text=text)[-1])
+        else:
+            records = list(v1.follow(interval=0.0, timeout=0.0))
+            assert len(records) == len(v0.get_times())
+            kstpkper, totim, c = records[-1]
+            assert totim == v0.get_times()[-1]
+            assert np.array_equal(c, v0.get_data(totim=totim))
+        v0.close()
+        v1.close()
+    return
+
+
 def test_cellbudgetfile_read_context():
     cbc_path = os.path.join(
         "..", "examples", "data", "mf2005_test", "mnw1.gitcbc"
@@ -327,6 +518,334 @@ def test_cellbudgetfile_readrecord_waux():
     return
 
 
+def test_binaryfile_iter_records():
+    fpth = os.path.join(
+        "..", "examples", "data", "mt3d_test", "mf2kmt3d", "MultiDiffusion"
+    )
+    ucn = flopy.utils.UcnFile(os.path.join(fpth, "MT3D001.UCN"))
+    alldata = ucn.get_alldata(nodata=1e30)
+    ntimes = 0
+    for kstpkper, totim, conc in ucn.iter_records():
+        assert kstpkper == ucn.get_kstpkper()[ntimes]
+        assert totim == ucn.times[ntimes]
+        assert np.array_equal(conc, ucn.get_data(totim=totim))
+        ntimes += 1
+    assert ntimes == len(ucn.times), "iter_records did not return all times"
+    layers = [data for _, _, data in ucn.iter_records(mflay=2)]
+    assert np.array_equal(np.array(layers), ucn.get_alldata(mflay=2))
+
+    threshold = np.nanmean(alldata)
+    stats = ucn.get_stats(nodata=1e30, threshold=threshold)
+    assert np.allclose(stats["min"], np.nanmin(alldata, axis=0))
+    assert np.allclose(stats["max"], np.nanmax(alldata, axis=0))
+    assert np.allclose(stats["mean"], np.nanmean(alldata, axis=0))
+    assert np.array_equal(stats["count"], np.sum(~np.isnan(alldata), axis=0))
+    assert np.array_equal(
+        stats["exceedance"], np.sum(alldata > threshold, axis=0)
+    )
+    ucn.close()
+
+    hds = flopy.utils.HeadFile(
+        os.path.join("..", "examples", "data", "freyberg", "freyberg.githds")
+    )
+    stats = hds.get_stats(mflay=0)
+    assert "exceedance" not in stats
+    assert np.array_equal(stats["max"], hds.get_data(mflay=0))
+    hds.close()
+    return
+
+
+def test_cellbudgetfile_iter_records():
+    fpth = os.path.join(
+        "..", "examples", "data", "mf2005_test", "test1tr.gitcbc"
+    )
+    v = flopy.utils.CellBudgetFile(fpth)
+    records = list(v.iter_records())
+    assert len(records) == v.get_nrecords()
+    for idx, (kstpkper, totim, text, rec) in enumerate(records):
+        header = v.recordarray[idx]
+        assert kstpkper == (header["kstp"] - 1, header["kper"] - 1)
+        assert totim == header["totim"]
+        assert text == header["text"].decode()
+
+    text = "FLOW RIGHT FACE"
+    frf = v.get_data(text=text)
+    records = [rec for _, _, _, rec in v.iter_records(text=text)]
+    assert len(records) == len(frf)
+    for rec0, rec1 in zip(frf, records):
+        assert np.array_equal(rec0, rec1)
+
+    stats = v.get_stats(text, threshold=0.0)
+    frf = np.array(frf)
+    assert np.allclose(stats["min"], frf.min(axis=0))
+    assert np.allclose(stats["max"], frf.max(axis=0))
+    assert np.allclose(stats["mean"], frf.mean(axis=0))
+    assert np.array_equal(stats["exceedance"], np.sum(frf > 0.0, axis=0))
+    v.close()
+    return
+
+
+def test_ensemble_headfile():
+    model_ws = f"{base_dir}_test_ensemble_headfile"
+    test_setup = FlopyTestSetup(verbose=True, test_dirs=model_ws)
+
+    fpth = os.path.join(
+        "..", "examples", "data", "freyberg", "freyberg.githds"
+    )
+    hds = flopy.utils.HeadFile(fpth)
+    filenames = []
+    for ireal in range(3):
+        fname = os.path.join(model_ws, f"real{ireal}.hds")
+        shutil.copyfile(fpth, fname)
+        # scale the heads in each realization
+        data = np.memmap(fname, dtype=np.uint8, mode="r+")
+        nbytes = hds.nrow * hds.ncol * 4
+        for ipos in hds.iposarray:
+            data[ipos : ipos + nbytes].view(np.float32)[:] *= ireal + 1
+        data.flush()
+        del data
+        filenames.append(fname)
+
+    idx = [(0, 10, 10), (0, 20, 5), (0, 39, 19)]
+    for executor in ("thread", "process"):
+        ens = flopy.utils.EnsembleHeadFile(
+            os.path.join(model_ws, "real*.hds"), workers=2, executor=executor
+        )
+        assert ens.filenames == filenames
+        assert ens.get_times() == hds.get_times()
+        ts = ens.get_ts(idx)
+        assert ts.shape == (3, len(hds.get_times()), len(idx))
+        data = ens.get_data()
+        assert data.shape == (3, hds.nlay, hds.nrow, hds.ncol)
+        for ireal, fname in enumerate(filenames):
+            with flopy.utils.HeadFile(fname) as v:
+                assert np.array_equal(ts[ireal], v.get_ts(idx)[:, 1:])
+                assert np.array_equal(data[ireal], v.get_data())
+                assert np.array_equal(
+                    ens.get_data(kstpkper=(0, 0), mflay=0)[ireal],
+                    v.get_data(kstpkper=(0, 0), mflay=0),
+                )
+        assert np.allclose(ts[2], 3.0 * ts[0])
+        ens.close()
+
+    # times are matched to the times in the file with a tolerance
+    ens = flopy.utils.EnsembleHeadFile(filenames, workers=1)
+    times = hds.get_times()
+    totim = [t * (1.0 + 1e-9) for t in times]
+    assert np.array_equal(ens.get_ts(idx, totim=totim), ens.get_ts(idx))
+    assert np.array_equal(ens.get_data(totim=totim[-1]), ens.get_data())
+    assert np.all(np.isnan(ens.get_ts(idx, totim=2.0 * times[-1] + 1.0)))
+    ens.close()
+
+    # members must have the same structure as the first file
+    fname = os.path.join(model_ws, "real9.hds")
+    with open(fpth, "rb") as f:
+        contents = f.read()
+    with open(fname, "wb") as f:
+        f.write(contents[: len(contents) // 2])
+    ens = flopy.utils.EnsembleHeadFile(filenames + [fname], workers=1)
+    try:
+        ens.get_ts(idx)
+        raise AssertionError("get_ts() did not fail for a truncated file")
+    except ValueError:
+        pass
+    ens.close()
+
+    # members with the same size and different record headers
+    with open(fname, "wb") as f:
+        f.write(contents)
+    data = np.memmap(fname, dtype=np.uint8, mode="r+")
+    ipos = hds.iposarray[-1] - hds.header_dtype.itemsize
+    data[ipos : ipos + 4].view(np.int32)[:] += 1
+    data.flush()
+    del data
+    ens = flopy.utils.EnsembleHeadFile(filenames + [fname], workers=1)
+    with pytest.raises(ValueError):
+        ens.get_data()
+    ens.close()
+    os.remove(fname)
+
+    # glob patterns are sorted in natural order
+    fname = os.path.join(model_ws, "real10.hds")
+    shutil.copyfile(fpth, fname)
+    ens = flopy.utils.EnsembleHeadFile(os.path.join(model_ws, "real*.hds"))
+    assert ens.filenames == filenames + [fname]
+    ens.close()
+    hds.close()
+    return
+
+
+def test_ensemble_cellbudgetfile():
+    model_ws = f"{base_dir}_test_ensemble_cellbudgetfile"
+    test_setup = FlopyTestSetup(verbose=True, test_dirs=model_ws)
+
+    fpth = os.path.join(
+        "..", "examples", "data", "mf2005_test", "test1tr.gitcbc"
+    )
+    filenames = []
+    for ireal in range(2):
+        fname = os.path.join(model_ws, f"real{ireal}.cbc")
+        shutil.copyfile(fpth, fname)
+        filenames.append(fname)
+
+    idx = [(0, 1, 1), (0, 14, 9)]
+    ens = flopy.utils.EnsembleCellBudgetFile(filenames)
+    with flopy.utils.CellBudgetFile(fpth) as v:
+        for text in ("FLOW RIGHT FACE", "STORAGE", "WELLS"):
+            ts = ens.get_ts(idx, text=text)
+            assert ts.shape == (2, len(v.get_kstpkper()), len(idx))
+            ts0 = v.get_ts(idx, text=text)[:, 1:]
+            for ireal in range(2):
+                assert np.allclose(ts[ireal], ts0, equal_nan=True)
+    ens.close()
+    return
+
+
+def test_cellbudgetfile_get_ts():
+    fpth = os.path.join(
+        "..", "examples", "data", "mf2005_test", "test1tr.gitcbc"
+    )
+    v = flopy.utils.CellBudgetFile(fpth)
+    idx = [(0, 0, 0), (0, 7, 4), (0, 14, 9)]
+    for text in ("STORAGE", "CONSTANT HEAD", "WELLS", "STREAM LEAKAGE", "ET"):
+        ts = v.get_ts(idx, text=text)
+        assert ts.shape == (len(v.get_kstpkper()), len(idx) + 1)
+        for itim, kstpkper in enumerate(v.get_kstpkper()):
+            data = v.get_data(kstpkper=kstpkper, text=text, full3D=True)
+            if len(data) == 0:
+                assert np.all(np.isnan(ts[itim, 1:]))
+                continue
+            data = np.ma.filled(data[0].astype(np.float64), np.nan)
+            if data.ndim == 2:
+                data = data[np.newaxis]
+            for istat, (k, i, j) in enumerate(idx):
+                assert np.allclose(
+                    ts[itim, istat + 1], data[k, i, j], equal_nan=True
+                ), f"get_ts() value for {text} differs from get_data()"
+
+    # cells with more than one entry in a list record are summed
+    idx = v.get_indices(text="WELLS")[0]
+    record = v.get_record(idx)
+    node, counts = np.unique(record["node"], return_counts=True)
+    k, i, j = np.unravel_index(node[0] - 1, (v.nlay, v.nrow, v.ncol))
+    ts = v.get_ts((k, i, j), text="WELLS")
+    itim = v.get_kstpkper().index(
+        (v.recordarray["kstp"][idx] - 1, v.recordarray["kper"][idx] - 1)
+    )
+    q = record["q"][record["node"] == node[0]].sum()
+    assert np.isclose(ts[itim, 1], q)
+    v.close()
+    return
+
+
+def test_binaryfile_to_chunked():
+    model_ws = f"{base_dir}_test_binaryfile_to_chunked"
+    test_setup = FlopyTestSetup(verbose=True, test_dirs=model_ws)
+
+    fpth = os.path.join(
+        "..", "examples", "data", "mt3d_test", "mf2kmt3d", "MultiDiffusion"
+    )
+    ucn = flopy.utils.UcnFile(os.path.join(fpth, "MT3D001.UCN"))
+    data = np.array([conc for _, _, conc in ucn.iter_records()])
+    pth = os.path.join(model_ws, "ucn")
+    arr = ucn.to_chunked(pth, chunks=(4, 1, 10, 10))
+    assert arr.shape == data.shape
+    assert arr.get_times() == ucn.get_times()
+    assert arr.get_kstpkper() == ucn.get_kstpkper()
+    assert np.array_equal(arr[:], data)
+    assert np.array_equal(arr[-1, 2], data[-1, 2])
+    assert np.array_equal(arr[[1, 5], :, 3:, -1], data[[1, 5], :, 3:, -1])
+
+    # only the chunks with the requested values are read
+    arr = flopy.utils.open_chunked(pth)
+    assert np.array_equal(arr[:, 0, 0, 5], data[:, 0, 0, 5])
+    assert arr.nchunks_read == 3
+    idx = [(0, 0, 5), (7, 0, 20)]
+    assert np.allclose(arr.get_ts(idx), ucn.get_ts(idx))
+    ucn.close()
+
+    fpth = os.path.join(
+        "..", "examples", "data", "mf2005_test", "test1tr.gitcbc"
+    )
+    v = flopy.utils.CellBudgetFile(fpth)
+    pth = os.path.join(model_ws, "cbc")
+    arrays = v.to_chunked(pth, text=["FLOW RIGHT FACE", "WELLS", "ET"])
+    assert sorted(arrays) == ["ET", "FLOW RIGHT FACE", "WELLS"]
+    arrays = flopy.utils.open_chunked(pth)
+    for text, arr in arrays.items():
+        records = v.get_data(text=text, full3D=True)
+        assert arr.shape == (len(records), v.nlay, v.nrow, v.ncol)
+        assert arr.attrs["text"] == text
+        for idx, record in enumerate(records):
+            record = np.ma.filled(record.astype(np.float32), np.nan)
+            assert np.array_equal(
+                arr[idx], record.reshape(arr.shape[1:]), equal_nan=True
+            )
+    kstpkper = [
+        (kstp - 1, kper - 1)
+        for kstp, kper, text in v.recordarray[["kstp", "kper", "text"]]
+        if text == b"           WELLS"
+    ]
+    assert arrays["WELLS"].get_kstpkper() == kstpkper
+    v.close()
+    return
+
+
+def test_binaryfile_cache():
+    fpth = os.path.join(
+        "..", "examples", "data", "freyberg", "freyberg.githds"
+    )
+    h0 = flopy.utils.HeadFile(fpth)
+    h = flopy.utils.HeadFile(fpth, cache_size=h0.nrow * h0.ncol * 4)
+    assert h0.cache is None
+    kstpkper = h.get_kstpkper()[-1]
+    head = h.get_data(kstpkper=kstpkper)
+    assert h.cache.misses == h.nlay and h.cache.hits == 0
+    head[:] = -999.0
+    for _ in range(3):
+        assert np.array_equal(
+            h.get_data(kstpkper=kstpkper), h0.get_data(kstpkper=kstpkper)
+        ), "cached record was modified"
+    assert h.cache.hits == 3 * h.nlay and h.cache.misses == h.nlay
+    assert np.array_equal(h.get_ts((0, 10, 10)), h0.get_ts((0, 10, 10)))
+    assert h.cache.nbytes <= h.cache.maxbytes
+    h.close()
+    h0.close()
+
+    fpth = os.path.join(
+        "..", "examples", "data", "mf2005_test", "test1tr.gitcbc"
+    )
+    v0 = flopy.utils.CellBudgetFile(fpth)
+    v = flopy.utils.CellBudgetFile(fpth, cache_size=1000)
+    idx = v.get_indices(text="WELLS")[0]
+    for full3D in (False, True, False, True):
+        assert np.array_equal(
+            v.get_record(idx, full3D=full3D), v0.get_record(idx, full3D)
+        )
+    assert v.cache.info()["hits"] == 2 and v.cache.misses == 2
+    # the least recently used records are removed from the cache
+    for text in ("STORAGE", "FLOW RIGHT FACE", "FLOW FRONT FACE"):
+        v.get_data(kstpkper=(0, 0), text=text)
+    assert v.cache.nbytes <= 1000
+    assert len(v.cache) == 1
+    v.close()
+    v0.close()
+    return
+
+
+def test_cellbudgetfile_double_precision_index():
+    cbc_fname = os.path.join(
+        "..", "examples", "data", "preserve_unitnums", "testsfr2.ghb.cbc"
+    )
+    v = flopy.utils.CellBudgetFile(cbc_fname)
+    assert v.realtype == np.float64, "precision was not determined"
+    assert v.get_nrecords() == 12, "number of records != 12"
+    assert v.get_unique_record_names(decode=True) == [" HEAD DEP BOUNDS"]
+    assert len(v.get_kstpkper()) == 12, "length of kstpkper != 12"
+    v.close()
+    return
+
+
 def test_binaryfile_writeread():
     model_ws = f"{base_dir}_test_binaryfile_writeread"
     test_setup = FlopyTestSetup(verbose=True, test_dirs=model_ws)
@@ -408,6 +927,19 @@ if __name__ == "__main__":
     test_binaryfile_writeread()
     test_formattedfile_read()
     test_binaryfile_read()
+    test_binaryfile_read_mmap()
+    test_binaryfile_read_single_cell()
+    test_binaryfile_get_ts_multiple_cells()
+    test_binaryfile_index_file()
+    test_binaryfile_refresh()
     test_cellbudgetfile_read()
     test_cellbudgetfile_readrecord()
     test_cellbudgetfile_readrecord_waux()
+    test_cellbudgetfile_double_precision_index()
+    test_binaryfile_iter_records()
+    test_cellbudgetfile_iter_records()
+    test_cellbudgetfile_get_ts()
+    test_binaryfile_to_chunked()
+    test_binaryfile_cache()
+    test_ensemble_headfile()
+    test_ensemble_cellbudgetfile()
@@ -1,5 +1,6 @@
 import os
 import numpy as np
+import pytest
 import flopy
 from ci_framework import base_test_dir, FlopyTestSetup
 
@@ -226,8 +227,130 @@ def test_mf6obsfile_read():
     return
 
 
+def test_mf6obsfile_iter_records():
+    files = ["maw_obs.gitbin", "maw_obs.gitcsv"]
+    binfile = [True, False]
+
+    for idx in range(len(files)):
+        pth = os.path.join("..", "examples", "data", "mf6_obs", files[idx])
+        h = flopy.utils.Mf6Obs(pth, isBinary=binfile[idx])
+        data = h.get_data()
+        obsname = h.get_obsnames()[0]
+
+        records = list(h.iter_records())
+        assert len(records) == h.get_ntimes()
+        for (totim, values), row in zip(records, data):
+            assert totim == row["totim"]
+            assert values.shape == (h.get_nobs(),)
+            assert values[0] == row[obsname]
+
+        stats = h.get_stats(obsname=obsname, threshold=data[obsname][0])
+        assert np.isclose(stats["min"][0], data[obsname].min())
+        assert np.isclose(stats["max"][0], data[obsname].max())
+        assert np.isclose(stats["mean"][0], data[obsname].mean())
+        assert stats["count"][0] == h.get_ntimes()
+        assert stats["exceedance"][0] == np.sum(
+            data[obsname] > data[obsname][0]
+        )
+
+    return
+
+
+def test_mf6obsfile_projection():
+    files = ["maw_obs.gitbin", "maw_obs.gitcsv"]
+    binfile = [True, False]
+
+    for idx in range(len(files)):
+        pth = os.path.join("..", "examples", "data", "mf6_obs", files[idx])
+        data = flopy.utils.Mf6Obs(pth, isBinary=binfile[idx]).get_data()
+        obsname = data.dtype.names[1]
+
+        h = flopy.utils.Mf6Obs(pth, isBinary=binfile[idx], obsname=obsname)
+        assert h.get_obsnames() == [obsname]
+        assert h.get_nobs() == 1
+
+        # data are streamed from the file in chunks before they are read
+        chunks = list(h.iter_chunks(chunksize=2))
+        assert [len(chunk) for chunk in chunks] == [2, 1]
+        assert h._data is None
+        for name in ("totim", obsname):
+            values = np.concatenate([chunk[name] for chunk in chunks])
+            assert np.array_equal(values, data[name])
+            assert np.array_equal(h.get_data()[name], data[name])
+
+        try:
+            flopy.utils.Mf6Obs(pth, isBinary=binfile[idx], obsname="BAD")
+            raise AssertionError("invalid obsname did not raise")
+        except ValueError:
+            pass
+
+    pth = os.path.join("..", "examples", "data", "mf6_obs", "maw_obs.gitbin")
+    h = flopy.utils.Mf6Obs(pth, isBinary=True, mmap=True)
+    assert isinstance(h.data, np.memmap)
+    assert h.get_ntimes() == 3
+
+    return
+
+
+def test_mf6obsfile_csv_names():
+    pth = os.path.join(
+        "..", "examples", "data", "mf6", "test045_lake2tr", "bud.lak.csv"
+    )
+    # column names are validated the same way as numpy.genfromtxt
+    expected = np.genfromtxt(pth, delimiter=",", names=True)
+    h = flopy.utils.Mf6Obs(pth, isBinary=False)
+    obsnames = h.get_obsnames()
+    assert obsnames[0] == "EXTINFLOW"
+    assert obsnames == list(expected.dtype.names[1:])
+    data = h.get_data()
+    assert data.dtype.names[1:] == expected.dtype.names[1:]
+    for name in obsnames:
+        assert np.allclose(data[name], expected[name], equal_nan=True)
+
+    h = flopy.utils.Mf6Obs(pth, isBinary=False, obsname=obsnames[0])
+    assert h.get_obsnames() == ["EXTINFLOW"]
+    assert np.allclose(
+        h.get_data(obsname=h.get_obsnames()[0])["EXTINFLOW"],
+        expected["EXTINFLOW"],
+    )
+    chunks = list(h.iter_chunks(chunksize=5))
+    values = np.concatenate([chunk["EXTINFLOW"] for chunk in chunks])
+    assert np.allclose(values, expected["EXTINFLOW"])
+
+    return
+
+
+def test_csvfile_columns():
+    # files without a time column can not be read
+    pth = os.path.join(
+        "..",
+        "examples",
+        "data",
+        "mt3d_example_sft_lkt_uzt",
+        "sfr_data",
+        "no3_reachinput.csv",
+    )
+    with pytest.raises(ValueError):
+        flopy.utils.observationfile.CsvFile(pth)
+
+    # values are parsed the same way as numpy.genfromtxt
+    pth = os.path.join(
+        "..", "examples", "data", "zonbud_examples", "zonebudget6.csv"
+    )
+    expected = np.genfromtxt(pth, delimiter=",", names=True)
+    data = flopy.utils.observationfile.CsvFile(pth).data
+    for name in expected.dtype.names:
+        assert np.array_equal(data[name], expected[name])
+
+    return
+
+
 if __name__ == "__main__":
     test_mf6obsfile_read()
+    test_mf6obsfile_iter_records()
+    test_mf6obsfile_projection()
+    test_mf6obsfile_csv_names()
+    test_csvfile_columns()
     test_hydmodfile_create()
     test_hydmodfile_load()
     test_hydmodfile_read()
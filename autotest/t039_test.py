@@ -2,10 +2,12 @@
 Test zonbud utility
 """
 import os
+import shutil
 import numpy as np
 import flopy
 from flopy.utils import (
     ZoneBudget,
+    ZoneBudgetBatch,
     ZoneBudget6,
     ZoneFile6,
 )
@@ -288,6 +290,186 @@ def test_zonbud_active_areas_zone_zero(rtol=1e-2):
     return
 
 
+def test_zonbud_zone_interfaces():
+    # flow between zones is the face flow across the zone interfaces
+    fpth = os.path.join("..", "examples", "data", "mf2005_test")
+    cbc = flopy.utils.CellBudgetFile(os.path.join(fpth, "test1tr.gitcbc"))
+    zon = np.ones((1, 15, 10), dtype=int)
+    zon[:, :, 5:] = 2
+    zon[:, 10:, :] = 3
+    zb = ZoneBudget(cbc, zon, kstpkper=(0, 0))
+    cbf = zb.get_budget()
+    frf = cbc.get_data(text="FLOW RIGHT FACE", kstpkper=(0, 0))[0][0]
+    fff = cbc.get_data(text="FLOW FRONT FACE", kstpkper=(0, 0))[0][0]
+    q12 = frf[:10, 4]
+    q13 = fff[9, :5]
+    for name, zone, q in (
+        ("FROM_ZONE_1", "ZONE_2", q12[q12 > 0].sum()),
+        ("TO_ZONE_1", "ZONE_2", -q12[q12 < 0].sum()),
+        ("FROM_ZONE_1", "ZONE_3", q13[q13 > 0].sum()),
+        ("TO_ZONE_1", "ZONE_3", -q13[q13 < 0].sum()),
+    ):
+        v = cbf[cbf["name"] == name][zone][0]
+        assert np.allclose(v, q, rtol=1e-5), f"{name} {zone} {v} != {q}"
+    return
+
+
+def test_zonbud_batch():
+    fpth = os.path.join(
+        "..", "examples", "data", "mf2005_test", "test1tr.gitcbc"
+    )
+    zon1 = np.ones((1, 15, 10), dtype=int)
+    zon1[:, :, 5:] = 2
+    zon2 = np.zeros((1, 15, 10), dtype=int)
+    zon2[:, 10:, :] = 3
+    zones = {"east_west": zon1, "south": zon2}
+    zbb = ZoneBudgetBatch(fpth, zones, kstpkper=[(0, 0), (0, 1)])
+    assert zbb.names == ["east_west", "south"]
+    budgets = zbb.get_budget()
+    for name, zon in zones.items():
+        zb = ZoneBudget(fpth, zon, kstpkper=[(0, 0), (0, 1)])
+        bud = zb.get_budget()
+        for field in bud.dtype.names:
+            if field == "name":
+                assert np.all(budgets[name][field] == bud[field])
+            else:
+                assert np.allclose(
+                    budgets[name][field], bud[field], equal_nan=True
+                ), f"{name} {field}"
+
+    df = zbb.get_dataframes()
+    assert df.index.names[0] == "zonation"
+    assert np.allclose(
+        df.loc["south"]["ZONE_3"].values, budgets["south"]["ZONE_3"]
+    )
+    return
+
+
+def test_zonbud_n_workers():
+    fpth = os.path.join(
+        "..", "examples", "data", "mf2005_test", "test1tr.gitcbc"
+    )
+    zon = np.ones((1, 15, 10), dtype=int)
+    zon[:, :, 5:] = 2
+    zon[:, 10:, :] = 3
+    zb = ZoneBudget(fpth, zon)
+    zbp = ZoneBudget(fpth, zon, n_workers=2)
+    bud = zb.get_budget()
+    budp = zbp.get_budget()
+    assert budp.dtype == bud.dtype
+    assert budp.tobytes() == bud.tobytes(), "parallel budget is different"
+
+    # the processes use the model grid of the cell budget file
+    modelgrid = flopy.discretization.StructuredGrid(
+        delc=np.ones(15),
+        delr=np.ones(10),
+        top=np.ones((15, 10)),
+        botm=np.zeros((1, 15, 10)),
+    )
+    cbc = flopy.utils.CellBudgetFile(fpth, modelgrid=modelgrid)
+    zbp = ZoneBudget(cbc, zon, n_workers=2)
+    assert zbp.get_budget().tobytes() == bud.tobytes()
+
+    # cell budget files opened with a model are read in one process
+    m = flopy.modflow.Modflow.load(
+        "test1tr.nam",
+        model_ws=os.path.dirname(fpth),
+        load_only=["dis"],
+        check=False,
+    )
+    cbc = flopy.utils.CellBudgetFile(fpth, model=m)
+    zbp = ZoneBudget(cbc, zon, n_workers=2)
+    assert zbp.get_budget().tobytes() == bud.tobytes()
+    return
+
+
+def test_zonebudget6_compute_budget():
+    # compare the budget computed in python with the zbud6 output for
+    # test005_advgw_tidal with a zone for each layer
+    try:
+        import pandas as pd
+    except ImportError:
+        return
+
+    cpth = os.path.join(".", "temp", "t039_advgw_tidal")
+    if os.path.isdir(cpth):
+        shutil.rmtree(cpth)
+    shutil.copytree(
+        os.path.join("..", "examples", "data", "mf6", "test005_advgw_tidal"),
+        cpth,
+    )
+    sim = flopy.mf6.MFSimulation.load(
+        sim_ws=cpth, exe_name="mf6", verbosity_level=0
+    )
+    success, _ = sim.run_simulation()
+    if not success:
+        raise AssertionError("MODFLOW 6 run failed")
+
+    izone = np.ones((3, 15, 10), dtype=int)
+    izone[1] = 2
+    izone[2] = 3
+    zb = ZoneBudget6(model_ws=cpth)
+    ZoneFile6(zb, izone)
+    zb.grb = os.path.join(cpth, "AdvGW_tidal.dis.grb")
+    zb.cbc = os.path.join(cpth, "advgw_tidal.cbc")
+    zb.compute_budget()
+    bud = zb.get_budget()
+    ref = zb.get_budget(f=os.path.join(loadpth, "zonebudget6.csv"))
+
+    budget = {
+        (row["time_step"], row["stress_period"], row["name"]): row
+        for row in bud
+    }
+    assert len(budget) == len(ref)
+    for row in ref:
+        key = (row["time_step"], row["stress_period"], row["name"])
+        assert key in budget, f"{key} is not in the computed budget"
+        for zone in ("ZONE_1", "ZONE_2", "ZONE_3"):
+            assert np.allclose(
+                budget[key][zone], row[zone], rtol=1e-4, atol=1e-3
+            ), f"{key} {zone}: {budget[key][zone]} != {row[zone]}"
+
+
+def test_zonebudget6_compute_budget_balance():
+    try:
+        import pandas as pd
+    except ImportError:
+        return
+
+    ws = os.path.join("..", "examples", "data", "mf6-freyberg")
+    izone = np.ones((1, 40, 20), dtype=int)
+    izone[:, 20:, :] = 2
+    izone[:, :, :5] = 0
+    izone[:, 30:, 10:] = 3
+
+    zb = ZoneBudget6(model_ws=outpth)
+    ZoneFile6(zb, izone)
+    zb.grb = os.path.join(ws, "freyberg.dis.grb")
+    zb.cbc = os.path.join(ws, "freyberg.cbc")
+    zb.compute_budget()
+
+    bud = zb.get_budget()
+    names = list(bud["name"])
+    assert names[:2] == ["STO_SS_IN", "STO_SY_IN"]
+    assert "FROM_ZONE_0" in names and "TO_ZONE_3" in names
+    innames = [n for n in names if n.endswith("_IN") or "FROM_" in n]
+    outnames = [n for n in names if n.endswith("_OUT") or "TO_" in n]
+    for zone in ("ZONE_1", "ZONE_2", "ZONE_3"):
+        qin = bud[zone][np.isin(bud["name"], innames)].sum()
+        qout = bud[zone][np.isin(bud["name"], outnames)].sum()
+        assert np.allclose(qin, qout, rtol=1e-5), f"{zone} does not balance"
+
+    # flow from zone 1 to zone 2 is flow to zone 2 from zone 1
+    q = bud[bud["name"] == "FROM_ZONE_1"]["ZONE_2"][0]
+    assert q > 0.0
+    assert np.allclose(bud[bud["name"] == "TO_ZONE_2"]["ZONE_1"][0], q)
+
+    df = zb.get_dataframes()
+    assert isinstance(df, pd.DataFrame)
+    assert df.shape == (len(names), 3)
+    return
+
+
 def test_zonebudget_6():
     try:
         import pandas as pd
@@ -368,4 +550,9 @@ if __name__ == "__main__":
     test_get_budget()
     test_get_model_shape()
     test_zonbud_active_areas_zone_zero()
+    test_zonbud_zone_interfaces()
+    test_zonbud_batch()
+    test_zonbud_n_workers()
+    test_zonebudget6_compute_budget()
+    test_zonebudget6_compute_budget_balance()
     test_zonebudget_6()
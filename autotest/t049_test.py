@@ -344,6 +344,113 @@ def test_mp6_timeseries_load():
     return
 
 
+def test_modpath_lazy():
+    pth = os.path.join("..", "examples", "data")
+    files = [
+        (flopy.utils.PathlineFile, os.path.join(pth, "mp5", "m.ptl")),
+        (
+            flopy.utils.PathlineFile,
+            os.path.join(pth, "mp6", "EXAMPLE-3.pathline"),
+        ),
+        (
+            flopy.utils.TimeseriesFile,
+            os.path.join(pth, "mp6", "EXAMPLE-4.timeseries"),
+        ),
+        (
+            flopy.utils.TimeseriesFile,
+            os.path.join(pth, "mp5", "Timesers.s4.timeseries"),
+        ),
+        (flopy.utils.EndpointFile, os.path.join(pth, "mp5", "m.ept")),
+        (
+            flopy.utils.EndpointFile,
+            os.path.join(pth, "mp6", "EXAMPLE-3.endpoint"),
+        ),
+    ]
+    for cls, file in files:
+        print(file)
+        obj = cls(file)
+        lazyobj = cls(file, lazy=True)
+        assert lazyobj._alldata is None
+        assert lazyobj.get_maxid() == obj.get_maxid()
+
+        # the data for a particle match the records for the particle
+        data = obj._data
+        for partid in range(obj.get_maxid() + 1):
+            d0 = data[data["particleid"] == partid]
+            d1 = obj.get_data(partid=partid)
+            d2 = lazyobj.get_data(partid=partid)
+            assert d1.shape[0] == d2.shape[0] == d0.shape[0]
+            for name in d1.dtype.names:
+                assert np.array_equal(d1[name], d2[name])
+                if cls is flopy.utils.EndpointFile:
+                    assert np.array_equal(d1[name], d0[name])
+                else:
+                    assert np.array_equal(
+                        d1[name],
+                        np.sort(d0, order=["particleid", "time"])[name],
+                    )
+        assert lazyobj._alldata is None
+
+        # the data for all particles are read when they are needed
+        if cls is flopy.utils.EndpointFile:
+            assert np.array_equal(lazyobj.get_alldata(), obj.get_alldata())
+        else:
+            d1 = obj.get_alldata()
+            d2 = lazyobj.get_alldata()
+            assert len(d1) == len(d2)
+            for a, b in zip(d1, d2):
+                assert np.array_equal(a, b)
+        assert lazyobj._alldata is not None
+    return
+
+
+def test_modpath_destination():
+    pth = os.path.join("..", "examples", "data", "mp6")
+    pthobj = flopy.utils.PathlineFile(os.path.join(pth, "EXAMPLE-3.pathline"))
+    endobj = flopy.utils.EndpointFile(os.path.join(pth, "EXAMPLE-3.endpoint"))
+
+    pthdata = pthobj._data
+    epdata = endobj.get_alldata()
+    cells = {
+        "well": [(4, 12, 12)],
+        "river": [(0, 2, 24), (0, 7, 24), (0, 11, 24)],
+        "none": [(99, 99, 99)],
+    }
+    pthdest = pthobj.get_destination_pathline_data(cells, to_recarray=True)
+    pthpartids = pthobj.get_destination_particleids(cells)
+    epdest = endobj.get_destination_endpoint_data(cells)
+    eppartids = endobj.get_destination_particleids(cells)
+    assert list(pthdest.keys()) == list(cells.keys())
+    for key, dest_cells in cells.items():
+        # particles that pass through the cells
+        sel = np.zeros(pthdata.shape[0], dtype=bool)
+        for k, i, j in dest_cells:
+            sel |= (
+                (pthdata["k"] == k) & (pthdata["i"] == i) & (pthdata["j"] == j)
+            )
+        partids = np.unique(pthdata["particleid"][sel])
+        assert np.array_equal(pthpartids[key], partids)
+        sel = np.isin(pthdata["particleid"], partids)
+        assert np.array_equal(pthdest[key], pthdata[sel])
+
+        # particles that terminate in the cells
+        sel = np.zeros(epdata.shape[0], dtype=bool)
+        for k, i, j in dest_cells:
+            sel |= (epdata["k"] == k) & (epdata["i"] == i) & (epdata["j"] == j)
+        assert np.array_equal(epdest[key], epdata[sel])
+        partids = np.unique(epdata["particleid"][sel])
+        assert np.array_equal(eppartids[key], partids)
+    assert epdest["well"].shape[0] == 19
+    assert epdest["river"].shape[0] == 3
+    assert pthdest["none"].shape[0] == 0
+    assert epdest["none"].shape[0] == 0
+
+    # a single set of destination cells
+    epdest = endobj.get_destination_endpoint_data(cells["river"])
+    assert np.array_equal(epdest["particleid"], eppartids["river"])
+    return
+
+
 def eval_timeseries(file):
     ts = flopy.utils.TimeseriesFile(file)
     msg = (
@@ -433,3 +540,5 @@ if __name__ == "__main__":
     test_mp5_load()
     test_mp5_timeseries_load()
     test_mp6_timeseries_load()
+    test_modpath_lazy()
+    test_modpath_destination()
@@ -147,6 +147,65 @@ def test_endpoint_output():
     return
 
 
+def write_mp7_pathline_file(fpth, npart=20):
+    """
+    Write a MODPATH 7 pathline file with particle i having i + 1 points.
+
+    """
+    with open(fpth, "w") as f:
+        f.write("MODPATH_PATHLINE_FILE         7         2\n")
+        f.write(f"{1:10d}{1:10d}{0.0:25.16E}{0.0:25.16E}{0.0:25.16E}\n")
+        f.write("END HEADER\n")
+        for n in range(npart):
+            f.write(f"{n + 1:10d}{n % 2 + 1:10d}{n + 101:10d}{n + 1:10d}\n")
+            for i in range(n + 1):
+                f.write(
+                    f"{10 * n + i + 1:10d}"
+                    f"{100.0 * n:25.16E}{1.5 * i:25.16E}{0.25:25.16E}"
+                    f"{10.0 * i:25.16E}{0.5:25.16E}{0.5:25.16E}{0.5:25.16E}"
+                    f"{i % 3 + 1:10d}{1:10d}{i + 1:10d}\n"
+                )
+    return
+
+
+def test_pathline_mp7_read():
+    model_ws = f"{base_dir}_test_pathline_mp7_read"
+    test_setup = FlopyTestSetup(verbose=True, test_dirs=model_ws)
+    os.makedirs(model_ws, exist_ok=True)
+
+    npart = 20
+    fpth = os.path.join(model_ws, "synthetic.mppth")
+    write_mp7_pathline_file(fpth, npart)
+
+    p = flopy.utils.PathlineFile(fpth, cache_file=True)
+    assert os.path.isfile(f"{fpth}.npz")
+    assert p._data.shape[0] == npart * (npart + 1) // 2
+    assert p.get_maxid() == npart - 1
+    assert p.get_maxtime() == 10.0 * (npart - 1)
+    for n in range(npart):
+        pd = p._data[p._data["particleid"] == n]
+        assert pd.shape[0] == n + 1
+        assert np.all(pd["particlegroup"] == n % 2)
+        assert np.all(pd["sequencenumber"] == n)
+        assert np.all(pd["particleidloc"] == n + 100)
+        assert np.array_equal(pd["node"], 10 * n + np.arange(n + 1))
+        assert np.array_equal(pd["x"], np.full(n + 1, 100.0 * n))
+        assert np.array_equal(pd["y"], 1.5 * np.arange(n + 1))
+        assert np.array_equal(pd["k"], np.arange(n + 1) % 3)
+        assert np.array_equal(pd["timestep"], np.arange(n + 1) + 1)
+
+    # the pathline data are read from the cache file
+    p2 = flopy.utils.PathlineFile(fpth, cache_file=True)
+    assert p2._data.dtype == p._data.dtype
+    assert np.array_equal(p2._data, p._data)
+
+    # the cache file is not used if the pathline file changes
+    write_mp7_pathline_file(fpth, npart - 5)
+    p3 = flopy.utils.PathlineFile(fpth, cache_file=True)
+    assert p3.get_maxid() == npart - 6
+    return
+
+
 def build_mf2005(model_ws):
     """
     MODPATH 7 example 1 for MODFLOW-2005
@@ -369,3 +428,4 @@ def build_mf6(model_ws):
 if __name__ == "__main__":
     test_pathline_output()
     test_endpoint_output()
+    test_pathline_mp7_read()
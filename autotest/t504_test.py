@@ -1,11 +1,13 @@
-import os, copy
+import os, copy, shutil, time
 
 import numpy as np
+import pytest
 
 import flopy
 import flopy.utils.binaryfile as bf
 from flopy.utils.datautil import PyListUtil
 from flopy.mf6.modflow.mfsimulation import MFSimulation
+from flopy.mf6.data.mffileaccess import MFFileAccessArray
 from ci_framework import base_test_dir, FlopyTestSetup
 
 try:
@@ -1167,6 +1169,323 @@ def eval_replace_ims_package():
     assert success, f"simulation {sim.name} did not run"
 
 
+def test_lazy_load():
+    # init paths
+    test_ex_name = "test006_gwf3"
+    pth = os.path.join("..", "examples", "data", "mf6", test_ex_name)
+    run_folder = f"{base_dir}_{test_ex_name}_lazy"
+    test_setup = FlopyTestSetup(verbose=True, test_dirs=run_folder)
+
+    sim = MFSimulation.load(sim_ws=pth, verbosity_level=0)
+    sim_lazy = MFSimulation.load(sim_ws=pth, verbosity_level=0, lazy=True)
+    gwf = sim.get_model()
+    gwf_lazy = sim_lazy.get_model()
+    assert gwf_lazy.dis.is_loaded
+    npf = gwf_lazy.npf
+    assert not npf.is_loaded
+    assert type(npf) is flopy.mf6.ModflowGwfnpf
+    assert [name for name, _, _ in npf.block_offsets] == [
+        "options",
+        "griddata",
+    ]
+
+    # packages that are not used are copied when the simulation is written
+    sim_lazy.set_sim_path(run_folder)
+    sim_lazy.write_simulation(silent=True)
+    with open(os.path.join(pth, npf.filename)) as f:
+        original = f.read()
+    with open(os.path.join(run_folder, npf.filename)) as f:
+        assert f.read() == original
+
+    # copies of packages that are not loaded load their own data
+    sim_copy = copy.deepcopy(sim_lazy)
+    npf_copy = sim_copy.get_model().npf
+    assert not npf_copy.is_loaded
+    assert np.array_equal(npf_copy.k.array, gwf.npf.k.array)
+    assert npf_copy.is_loaded
+    assert not npf.is_loaded
+
+    # data are loaded the first time they are used
+    assert np.array_equal(npf.k.array, gwf.npf.k.array)
+    assert npf.is_loaded
+    assert type(npf) is flopy.mf6.ModflowGwfnpf
+    for data, data_lazy in zip(gwf.ic.data_list, gwf_lazy.ic.data_list):
+        assert str(data.get_data()) == str(data_lazy.get_data())
+
+    # changed packages are written by flopy
+    npf.k = 2.0
+    sim_lazy.write_simulation(silent=True)
+    sim2 = MFSimulation.load(sim_ws=run_folder, verbosity_level=0)
+    assert np.allclose(sim2.get_model().npf.k.array, 2.0)
+    assert np.array_equal(sim2.get_model().ic.strt.array, gwf.ic.strt.array)
+
+
+def test_list_block_load():
+    # init paths
+    run_folder = f"{base_dir}_list_block_load"
+    test_setup = FlopyTestSetup(verbose=True, test_dirs=run_folder)
+
+    sim = MFSimulation(sim_ws=run_folder)
+    flopy.mf6.ModflowTdis(sim, nper=3)
+    flopy.mf6.ModflowIms(sim)
+    gwf = flopy.mf6.ModflowGwf(sim, modelname="gwf")
+    flopy.mf6.ModflowGwfdis(gwf, nlay=2, nrow=10, ncol=10)
+    cells = [(k, i, j) for k in range(2) for i in range(10) for j in range(10)]
+    spd = {
+        kper: [
+            (cell, -float(idx + kper), 0.5 * idx, f"Well{idx}")
+            for idx, cell in enumerate(cells)
+        ]
+        for kper in range(3)
+    }
+    flopy.mf6.ModflowGwfwel(
+        gwf, auxiliary=["conc"], boundnames=True, stress_period_data=spd
+    )
+    sim.write_simulation(silent=True)
+
+    # add a comment to the second stress period, which is loaded one line
+    # at a time, and a fortran style double to the third
+    fpth = os.path.join(run_folder, "gwf.wel")
+    with open(fpth) as f:
+        lines = f.readlines()
+    idx = [i for i, line in enumerate(lines) if "BEGIN period" in line]
+    lines.insert(idx[1] + 2, "# comment\n")
+    lines[idx[2] + 2] = lines[idx[2] + 2].replace("0.00000000", "0.0d0")
+    with open(fpth, "w") as f:
+        f.writelines(lines)
+
+    sim2 = MFSimulation.load(sim_ws=run_folder, verbosity_level=0)
+    data = sim2.get_model().wel.stress_period_data.get_data()
+    for kper in range(3):
+        assert data[kper].dtype.names == ("cellid", "q", "conc", "boundname")
+        assert list(data[kper]["cellid"]) == cells
+        assert np.allclose(data[kper]["q"], -np.arange(200.0) - kper)
+        assert np.allclose(data[kper]["conc"], 0.5 * np.arange(200.0))
+        assert list(data[kper]["boundname"]) == [
+            f"well{idx}" for idx in range(200)
+        ]
+
+
+def test_array_text_load():
+    # init paths
+    run_folder = f"{base_dir}_array_text_load"
+    test_setup = FlopyTestSetup(verbose=True, test_dirs=run_folder)
+
+    nlay, nrow, ncol = 3, 15, 12
+    sim = MFSimulation(sim_ws=run_folder)
+    flopy.mf6.ModflowTdis(sim)
+    flopy.mf6.ModflowIms(sim)
+    gwf = flopy.mf6.ModflowGwf(sim, modelname="gwf")
+    top = np.linspace(50.0, 60.0, nrow * ncol).reshape(nrow, ncol)
+    idomain = np.ones((nlay, nrow, ncol), dtype=int)
+    idomain[:, 0, :] = 0
+    botm = (
+        np.ones((nlay, nrow, ncol))
+        * np.array([40.0, 30.0, 20.0])[:, None, None]
+    )
+    flopy.mf6.ModflowGwfdis(
+        gwf,
+        nlay=nlay,
+        nrow=nrow,
+        ncol=ncol,
+        top={"filename": "top.txt", "data": top, "factor": 2.0},
+        botm={"filename": "botm.txt", "data": botm},
+        idomain=idomain,
+    )
+    k = np.arange(nlay * nrow * ncol, dtype=float).reshape(nlay, nrow, ncol)
+    flopy.mf6.ModflowGwfnpf(gwf, k={"data": k, "factor": 0.5, "iprn": 1})
+    sim.write_simulation(silent=True)
+
+    # add a comment to the internal k array and use commas in the
+    # open/close top array, which are split one line at a time
+    fpth = os.path.join(run_folder, "gwf.npf")
+    with open(fpth) as f:
+        lines = f.readlines()
+    idx = [i for i, line in enumerate(lines) if "INTERNAL" in line][0]
+    lines.insert(idx + 2, "# comment\n")
+    with open(fpth, "w") as f:
+        f.writelines(lines)
+    np.savetxt(os.path.join(run_folder, "top.txt"), top, delimiter=", ")
+
+    sim2 = MFSimulation.load(sim_ws=run_folder, verbosity_level=0)
+    gwf2 = sim2.get_model()
+    assert np.allclose(gwf2.dis.top.array, 2.0 * top)
+    assert np.array_equal(gwf2.dis.botm.array, botm)
+    assert np.array_equal(gwf2.dis.idomain.array, idomain)
+    assert np.allclose(gwf2.npf.k.array, 0.5 * k)
+    assert np.allclose(gwf2.npf.k.get_data(apply_mult=False), k)
+    assert gwf2.npf.k.get_file_entry().split()[1:5] == [
+        "INTERNAL",
+        "FACTOR",
+        "0.5",
+        "IPRN",
+    ]
+
+
+def _array_text_load(run_folder, nlay, nrow, ncol):
+    # write a simulation with INTERNAL and OPEN/CLOSE text arrays, load it
+    # and return the load time and the arrays
+    rng = np.random.default_rng(0)
+    sim = MFSimulation(sim_ws=run_folder)
+    flopy.mf6.ModflowTdis(sim)
+    flopy.mf6.ModflowIms(sim)
+    gwf = flopy.mf6.ModflowGwf(sim, modelname="gwf")
+    top = 100.0 + rng.random((nrow, ncol))
+    botm = top - 10.0 * np.arange(1, nlay + 1)[:, None, None]
+    flopy.mf6.ModflowGwfdis(
+        gwf,
+        nlay=nlay,
+        nrow=nrow,
+        ncol=ncol,
+        top=top,
+        botm={"filename": "botm.txt", "data": botm},
+        idomain=rng.integers(0, 2, (nlay, nrow, ncol)),
+    )
+    flopy.mf6.ModflowGwfnpf(gwf, k=rng.random((nlay, nrow, ncol)))
+    sim.write_simulation(silent=True)
+
+    t0 = time.perf_counter()
+    sim = MFSimulation.load(
+        sim_ws=run_folder, verbosity_level=0, load_only=["dis", "npf"]
+    )
+    gwf = sim.get_model()
+    arrays = [
+        gwf.dis.top.array,
+        gwf.dis.botm.array,
+        gwf.dis.idomain.array,
+        gwf.npf.k.array,
+    ]
+    return time.perf_counter() - t0, arrays
+
+
+def _read_text_data_line_by_line(monkeypatch):
+    # make the bulk text array reader fall back to reading the arrays one
+    # line at a time
+    monkeypatch.setattr(
+        MFFileAccessArray,
+        "_read_text_data_bulk",
+        staticmethod(
+            lambda fd, data_size, data_type, lines=None: (
+                None,
+                [] if lines is None else lines,
+            )
+        ),
+    )
+
+
+def test_array_text_load_line_by_line(monkeypatch):
+    # INTERNAL and OPEN/CLOSE text arrays read in bulk and one line at a
+    # time are the same
+    run_folder = f"{base_dir}_array_text_load"
+    test_setup = FlopyTestSetup(verbose=True, test_dirs=run_folder)
+
+    _, bulk_arrays = _array_text_load(run_folder, 3, 30, 40)
+    _read_text_data_line_by_line(monkeypatch)
+    _, line_arrays = _array_text_load(run_folder, 3, 30, 40)
+    for bulk_array, line_array in zip(bulk_arrays, line_arrays):
+        assert np.array_equal(bulk_array, line_array)
+
+
+@pytest.mark.skipif(
+    "FLOPY_BENCHMARK" not in os.environ,
+    reason="benchmark, set FLOPY_BENCHMARK to run",
+)
+def test_array_text_load_benchmark(monkeypatch):
+    # compare the time to load large INTERNAL and OPEN/CLOSE text arrays in
+    # bulk and one line at a time
+    run_folder = f"{base_dir}_array_text_load_benchmark"
+    test_setup = FlopyTestSetup(verbose=True, test_dirs=run_folder)
+
+    bulk_time, _ = _array_text_load(run_folder, 3, 300, 300)
+    _read_text_data_line_by_line(monkeypatch)
+    line_time, _ = _array_text_load(run_folder, 3, 300, 300)
+    print(
+        f"array load time: bulk {bulk_time:.2f} s, "
+        f"line by line {line_time:.2f} s"
+    )
+    assert bulk_time < line_time
+
+
+def test_snapshot():
+    # test006_gwf3 and test001e_UZF_3lay have OPEN/CLOSE arrays and lists
+    for test_ex_name in (
+        "test006_2models_mvr",
+        "test006_gwf3",
+        "test001e_UZF_3lay",
+    ):
+        pth = os.path.join("..", "examples", "data", "mf6", test_ex_name)
+        run_folder = f"{base_dir}_{test_ex_name}_snapshot"
+        test_setup = FlopyTestSetup(verbose=True, test_dirs=run_folder)
+        os.makedirs(run_folder, exist_ok=True)
+        sim_ws = os.path.join(run_folder, "source")
+        shutil.copytree(pth, sim_ws)
+        snapshot_path = os.path.join(run_folder, "snapshot.npz")
+
+        sim = MFSimulation.load(sim_ws=sim_ws, verbosity_level=0)
+        sim.save_snapshot(snapshot_path)
+        assert sim.simulation_data.snapshot is None
+
+        # arrays and lists are stored in binary form, without pickle
+        with np.load(snapshot_path, allow_pickle=False) as data:
+            if test_ex_name == "test006_2models_mvr":
+                prefixes = ("array_", "list_")
+            else:
+                prefixes = ("file_",)
+            for prefix in prefixes:
+                assert any(name.startswith(prefix) for name in data.files)
+
+        model_data = {}
+        for model_name in sim.model_names:
+            model = sim.get_model(model_name)
+            model_data[model_name] = [
+                [str(data.get_data()) for data in package.data_list]
+                for package in model.packagelist
+            ]
+        sim.set_sim_path(os.path.join(run_folder, "text"))
+        sim.write_simulation(silent=True)
+
+        # the snapshot is not loaded into the folder it was saved from
+        with pytest.raises(ValueError):
+            MFSimulation.load_snapshot(snapshot_path, sim_ws)
+
+        # the snapshot does not need the simulation folder
+        shutil.rmtree(sim_ws)
+        restore_ws = os.path.join(run_folder, "restored")
+        sim2 = MFSimulation.load_snapshot(
+            snapshot_path, restore_ws, verbosity_level=0
+        )
+        assert sim2.simulation_data.snapshot is None
+        assert os.path.abspath(
+            sim2.simulation_data.mfpath.get_sim_path()
+        ) == os.path.abspath(restore_ws)
+        assert sim2.model_names == sim.model_names
+        for model_name in sim.model_names:
+            model2 = sim2.get_model(model_name)
+            assert [
+                [str(data.get_data()) for data in package.data_list]
+                for package in model2.packagelist
+            ] == model_data[model_name]
+
+        # the restored simulation writes the same files, including comments
+        sim2.set_sim_path(os.path.join(run_folder, "snapshot"))
+        sim2.write_simulation(silent=True)
+        for file_name in os.listdir(os.path.join(run_folder, "text")):
+            with open(os.path.join(run_folder, "text", file_name)) as f:
+                lines = f.readlines()[1:]
+            with open(os.path.join(run_folder, "snapshot", file_name)) as f:
+                assert f.readlines()[1:] == lines, file_name
+
+        # restored files that were changed are not overwritten
+        if test_ex_name == "test006_gwf3":
+            file_path = os.path.join(restore_ws, "flow.disu.area.dat")
+            with open(file_path, "w") as f:
+                f.write("changed\n")
+            with pytest.raises(FileExistsError):
+                MFSimulation.load_snapshot(snapshot_path, restore_ws)
+            with open(file_path) as f:
+                assert f.read() == "changed\n"
+
+
 def test_mf6_output():
     ex_name = "test001e_UZF_3lay"
     sim_ws = os.path.join("..", "examples", "data", "mf6", ex_name)
@@ -1302,5 +1621,11 @@ if __name__ == "__main__":
     test027_timeseriestest()
     test036_twrihfb()
     test045_lake2tr()
+    test_lazy_load()
+    test_list_block_load()
+    test_array_text_load()
+    with pytest.MonkeyPatch.context() as mp:
+        test_array_text_load_line_by_line(mp)
+    test_snapshot()
     test_mf6_output()
     test_mf6_output_add_observation()
@@ -1297,6 +1297,12 @@ class MFArray(MFMultiDimVar):
                 self._simulation_data.debug,
                 ex,
             )
+        snapshot = self._simulation_data.snapshot
+        if snapshot is not None:
+            # store the data in the snapshot being saved
+            marker = snapshot.add_array(data)
+            if marker is not None:
+                return f"{data_indent}{marker}\n"
         file_access = MFFileAccessArray(
             self.structure,
             self._data_dimensions,
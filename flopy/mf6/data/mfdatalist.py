@@ -797,6 +797,28 @@ class MFList(mfdata.MFMultiDimVar, DataListInterface):
                     ex,
                 )
 
+            snapshot = self._simulation_data.snapshot
+            if (
+                snapshot is not None
+                and data_lines > 0
+                and len(self._data_dimensions.package_dim.get_tsnames()) == 0
+                and self.structure.type == DatumType.recarray
+                and self.structure.parent_block is not None
+                and len(self.structure.parent_block.data_structures) <= 1
+                and storage.layer_storage.first_item().data_storage_type
+                == DataStorageType.internal_array
+            ):
+                # store the data of the block in the snapshot being saved
+                comments = {
+                    line_num: comment.text
+                    for line_num, comment in storage.comments.items()
+                }
+                marker = snapshot.add_list(data_complete, comments)
+                if marker is not None:
+                    file_entry.append(f"{indent}{indent}{marker}\n")
+                    self._data_dimensions.unlock()
+                    return "".join(file_entry)
+
             # loop through list line by line - assumes first data_item size
             # is representative
             self._crnt_line_num = 1
@@ -1,4 +1,4 @@
-import sys, inspect
+import sys, inspect, itertools, warnings
 from copy import deepcopy
 import numpy as np
 from ..mfbase import MFDataException, VerbosityLevel
@@ -13,6 +13,10 @@ from ...utils.binaryfile import BinaryHeader
 from ...utils import datautil
 from ..data.mfstructure import DatumType, MFDataStructure, DataType
 
+# text that must be split one line at a time by PyListUtil.split_data_line:
+# delimiters other than white space, quoted strings and comments
+_NOT_SIMPLE_TEXT = (",", "'", '"', "#", "!", "//")
+
 
 class MFFileAccess:
     def __init__(
@@ -548,11 +552,43 @@ class MFFileAccessArray(MFFileAccess):
         if fd is None:
             close_file = True
             fd = self._open_ext_file(fname)
+        if data_type == DatumType.double_precision:
+            data_type = np.float64
+        elif data_type == DatumType.integer:
+            data_type = np.int32
+
+        lines = []
+        snapshot = self._simulation_data.snapshot
+        if snapshot is not None:
+            # data stored in the snapshot being loaded
+            line = fd.readline()
+            data_out = snapshot.get_array(line)
+            if data_out is not None:
+                if close_file:
+                    fd.close()
+                data_out = np.reshape(data_out.astype(data_type), data_dim)
+                return data_out, current_size
+            lines.append(line)
+
+        # read the data in a single pass
+        data_out, lines = self._read_text_data_bulk(
+            fd, data_size, data_type, lines
+        )
+        if data_out is not None:
+            data_out = self._resolve_cellid_numbers_from_file(data_out)
+            if close_file:
+                fd.close()
+            data_out = np.reshape(data_out, data_dim)
+            return data_out, current_size
+
+        # split the lines already read and the remaining lines one at a
+        # time, to handle comments, quotes and other delimiters
+        line_iter = itertools.chain(lines, iter(fd.readline, ""))
         data_raw = []
         line = " "
         PyListUtil.reset_delimiter_used()
         while line != "" and len(data_raw) < data_size:
-            line = fd.readline()
+            line = next(line_iter, "")
             arr_line = PyListUtil.split_data_line(line, True)
             if not MFComment.is_comment(arr_line, True):
                 data_raw += arr_line
@@ -587,11 +623,6 @@ class MFFileAccessArray(MFFileAccess):
                 self._simulation_data.debug,
             )
 
-        if data_type == DatumType.double_precision:
-            data_type = np.float64
-        elif data_type == DatumType.integer:
-            data_type = np.int32
-
         data_out = np.fromiter(data_raw, dtype=data_type, count=data_size)
         data_out = self._resolve_cellid_numbers_from_file(data_out)
         if close_file:
@@ -600,6 +631,43 @@ class MFFileAccessArray(MFFileAccess):
         data_out = np.reshape(data_out, data_dim)
         return data_out, current_size
 
+    @staticmethod
+    def _read_text_data_bulk(fd, data_size, data_type, lines=None):
+        """Reads the lines of fd that contain data_size numbers and parses
+        them, after any lines already read, with a single call to numpy.
+        Returns the data, or None and the lines read if the lines contain
+        comments, quotes, other delimiters or text that numpy can not parse,
+        so they must be split one line at a time."""
+        if lines is None:
+            lines = []
+        try:
+            if np.dtype(data_type).kind not in "fiu":
+                return None, lines
+        except TypeError:
+            return None, lines
+        num_items = sum(len(line.split()) for line in lines)
+        while num_items < data_size:
+            line = fd.readline()
+            if not line:
+                break
+            lines.append(line)
+            num_items += len(line.split())
+        if num_items < data_size:
+            return None, lines
+        text = "".join(lines)
+        if any(item in text for item in _NOT_SIMPLE_TEXT):
+            return None, lines
+        with warnings.catch_warnings():
+            # numpy warns when it can not parse all of the text
+            warnings.simplefilter("error", DeprecationWarning)
+            try:
+                data = np.fromstring(text, dtype=data_type, sep=" ")
+            except (DeprecationWarning, ValueError):
+                return None, lines
+        if data.size != num_items:
+            return None, lines
+        return data[:data_size], lines
+
     def load_from_package(
         self,
         first_line,
@@ -942,6 +1010,12 @@ class MFFileAccessArray(MFFileAccess):
             )
         if isinstance(data, list) or isinstance(data, np.ndarray):
             try:
+                if isinstance(data, np.ndarray):
+                    # store integers with the type of a python int, as
+                    # they are when stored from a list
+                    if data.dtype.kind in "iu":
+                        data = data.astype(int)
+                    return np.reshape(data, dimensions)
                 return np.reshape(data, dimensions).tolist()
             except Exception as ex:
                 type_, value_, traceback_ = sys.exc_info()
@@ -1111,6 +1185,18 @@ class MFFileAccessList(MFFileAccess):
                     self._simulation_data.debug,
                     ex,
                 )
+        elif self._simulation_data.snapshot is not None and (
+            self._simulation_data.snapshot.is_marker(arr_line)
+        ):
+            # data stored in the snapshot being loaded
+            data_loaded, comments = self._simulation_data.snapshot.get_list(
+                arr_line
+            )
+            storage.store_internal(data_loaded, None, False, self._current_key)
+            for line_num, text in comments.items():
+                storage.comments[line_num] = MFComment(
+                    text, self._path, self._simulation_data, line_num
+                )
         else:
             (
                 have_newrec_line,
@@ -1279,9 +1365,11 @@ class MFFileAccessList(MFFileAccess):
         line = " "
         optional_line_info = []
         line_info_processed = False
+        bulk_load_tried = False
+        readline = file_handle.readline
         data_structs = struct.data_item_structures
         while line != "":
-            line = file_handle.readline()
+            line = readline()
             arr_line = PyListUtil.split_data_line(line)
             if not line or (
                 arr_line
@@ -1339,6 +1427,21 @@ class MFFileAccessList(MFFileAccess):
                                 optional_line_info.append(data_item)
                         else:
                             optional_line_info.append(data_item)
+                if not bulk_load_tried and recarray_len == 1:
+                    # load the rest of the block in one pass
+                    bulk_load_tried = True
+                    lines, end_line = self._read_block_lines(file_handle, line)
+                    data_lines = self._load_simple_lines(lines)
+                    if data_lines is not None:
+                        data_loaded.extend(data_lines)
+                        self._data_line = data_lines[-1]
+                        line_num += len(data_lines)
+                        readline = iter([end_line]).__next__
+                        continue
+                    # load the lines already read one line at a time
+                    readline = itertools.chain(
+                        lines[1:], [end_line], itertools.repeat("")
+                    ).__next__
                 if MFComment.is_comment(arr_line, True):
                     arr_line.insert(0, "\n")
                     storage.add_data_line_comment(arr_line, line_num)
@@ -1473,6 +1576,126 @@ class MFFileAccessList(MFFileAccess):
         else:
             return [False, None, data_line]
 
+    @staticmethod
+    def _read_block_lines(file_handle, line):
+        """Reads lines from file_handle until the end of the block.  Returns
+        line and the lines that were read, and the END line (an empty string
+        at the end of the file)."""
+        lines = [line]
+        while True:
+            line = file_handle.readline()
+            if not line or line.lstrip()[:3].upper() == "END":
+                return lines, line
+            lines.append(line)
+
+    def _load_simple_lines(self, lines):
+        """Loads data lines with the layout found in the first line of a
+        list block one column at a time.  Returns a list of data line tuples,
+        or None if the lines contain comments, quoted strings or a different
+        number of items than expected, so they must be loaded one line at a
+        time."""
+        text = "".join(lines)
+        if any(item in text for item in _NOT_SIMPLE_TEXT):
+            return None
+        rows = list(map(str.split, lines))
+        num_items = len(rows[0])
+        if num_items == 0 or any(len(row) != num_items for row in rows):
+            return None
+        columns = list(zip(*rows))
+        num_lines = len(rows)
+
+        # columns of the required data items
+        data_structs = self.structure.data_item_structures
+        data_columns = []
+        cellid_columns = []
+        data_index = 0
+        for index, entry in enumerate(self._last_line_info):
+            for sub_entry in entry:
+                if sub_entry[0] >= num_items:
+                    return None
+                if sub_entry[1] is None:
+                    data_columns.append(itertools.repeat(None, num_lines))
+                elif sub_entry[2] > 0:
+                    # is a cellid
+                    try:
+                        cellid_columns.append(
+                            [int(item) - 1 for item in columns[sub_entry[0]]]
+                        )
+                    except ValueError:
+                        return None
+                    if len(cellid_columns) == sub_entry[2]:
+                        # end of current cellid
+                        data_columns.append(list(zip(*cellid_columns)))
+                        cellid_columns = []
+                else:
+                    data_columns.append(
+                        self._convert_column(
+                            columns[sub_entry[0]],
+                            sub_entry[1],
+                            data_structs[index],
+                        )
+                    )
+                data_index = sub_entry[0]
+        if cellid_columns:
+            return None
+
+        # columns of the optional aux and boundname data items
+        data_index += 1
+        package_dim = self._data_dimensions.package_dim
+        for data_item in data_structs[len(self._last_line_info) :]:
+            if num_items <= data_index:
+                break
+            if data_item.name == "aux":
+                aux_var_names = package_dim.get_aux_variables()
+                if aux_var_names is None:
+                    continue
+                for var_name in aux_var_names[0]:
+                    if var_name.lower() != "auxiliary":
+                        if num_items <= data_index:
+                            return None
+                        data_columns.append(
+                            self._convert_column(
+                                columns[data_index], data_item.type, data_item
+                            )
+                        )
+                        data_index += 1
+            elif data_item.name == "boundname" and package_dim.boundnames():
+                data_columns.append(
+                    self._convert_column(
+                        columns[data_index], data_item.type, data_item
+                    )
+                )
+                data_index += 1
+        if num_items != data_index:
+            # extra items are stored as comments
+            return None
+        return list(zip(*data_columns))
+
+    def _convert_column(self, column, data_type, data_item):
+        """Converts a column of strings from a list block to data_type, with
+        built-in conversions where they give the same result as
+        convert_data."""
+        try:
+            if (
+                data_type == DatumType.double_precision
+                and not data_item.support_negative_index
+            ):
+                return list(map(float, column))
+            elif (
+                data_type == DatumType.integer and not data_item.numeric_index
+            ):
+                return list(map(int, column))
+        except ValueError:
+            pass
+        if data_type == DatumType.string:
+            if data_item.preserve_case:
+                return list(column)
+            return list(map(str.lower, column))
+        return [
+            convert_data(item, self._data_dimensions, data_type, data_item)
+            for item in column
+        ]
+
     def load_list_line(
         self,
         storage,
@@ -1,5 +1,8 @@
 import os
+import io
+import re
 import sys
+import shutil
 import errno
 import inspect
 import datetime
@@ -28,6 +31,46 @@ from .utils.output_util import MF6Output
 from ..mbase import ModelInterface
 from ..version import __version__
 
+# package files containing these keywords are always loaded when the
+# simulation is loaded, since they refer to other files or change the type
+# of the package
+_LAZY_LOAD_EXCLUDE = re.compile(rb"open/close|filein|readasarrays", re.I)
+_BLOCK_LINE = re.compile(
+    rb"^[ \t]*(begin|end)[ \t]+(\S+)[^\r\n]*", re.I | re.M
+)
+
+
+class _DeferredData:
+    """
+    Data descriptor for a data attribute of a package class, installed the
+    first time a package of the class is loaded with lazy=True.  Gets the
+    data of the package, loading the package data if they have not been
+    loaded.  Without package data, gets the class attribute the descriptor
+    replaced, if any.
+
+    """
+
+    def __init__(self, name, package_class):
+        self.name = name
+        self.has_class_attribute = hasattr(package_class, name)
+        self.class_attribute = getattr(package_class, name, None)
+
+    def __get__(self, instance, owner=None):
+        if instance is not None:
+            instance_dict = instance.__dict__
+            if self.name not in instance_dict and self.name in (
+                instance_dict.get("_deferred_data", ())
+            ):
+                instance._load_deferred()
+            if self.name in instance_dict:
+                return instance_dict[self.name]
+        if self.has_class_attribute:
+            return self.class_attribute
+        raise AttributeError(self.name)
+
+    def __set__(self, instance, value):
+        instance.__dict__[self.name] = value
+
 
 class MFBlockHeader:
     """
@@ -1539,6 +1582,9 @@ class MFPackage(PackageContainer, PackageInterface):
         Describes the blocks and data contain in this package
     dimensions : PackageDimension
         Resolves data dimensions for data within this package
+    block_offsets : list
+        Name and byte offsets of the start and end of each block in the
+        package file, recorded when the package is loaded with lazy=True
 
     """
 
@@ -1677,6 +1723,11 @@ class MFPackage(PackageContainer, PackageInterface):
         self.bc_color = "black"
         self.__inattr = False
         self._child_package_groups = {}
+        # lazy loading
+        self._deferred_file = None
+        self._deferred_strict = True
+        self._deferred_data = {}
+        self.block_offsets = []
 
     def __init_subclass__(cls):
         """Register package type"""
@@ -1794,16 +1845,25 @@ class MFPackage(PackageContainer, PackageInterface):
         -------
             MF6Output object
         """
+        self._load_deferred()
         return MF6Output(self)
 
     @property
     def data_list(self):
         """List of data in this package."""
         # return [data_object, data_object, ...]
+        self._load_deferred()
         return self._data_list
 
+    @property
+    def is_loaded(self):
+        """Whether the data of a package loaded with lazy=True have been
+        loaded."""
+        return self._deferred_file is None
+
     def check(self, f=None, verbose=True, level=1, checktype=None):
         """Data check, returns True on success."""
+        self._load_deferred()
         if checktype is None:
             checktype = mf6check
         return super().check(f, verbose, level, checktype)
@@ -1818,6 +1878,8 @@ class MFPackage(PackageContainer, PackageInterface):
         return excl_list
 
     def _get_data_str(self, formal, show_data=True):
+        if show_data:
+            self._load_deferred()
         data_str = (
             "package_name = {}\nfilename = {}\npackage_type = {}"
             "\nmodel_or_simulation_package = {}"
@@ -2004,6 +2066,7 @@ class MFPackage(PackageContainer, PackageInterface):
             Array containing inspection results
 
         """
+        self._load_deferred()
         data_found = []
 
         # loop through blocks
@@ -2348,6 +2411,7 @@ class MFPackage(PackageContainer, PackageInterface):
             external_data_folder
                 Folder where external data will be stored
         """
+        self._load_deferred()
         # set blocks
         for key, block in self.blocks.items():
             file_name = os.path.split(self.filename)[1]
@@ -2367,6 +2431,9 @@ class MFPackage(PackageContainer, PackageInterface):
                 Determine if data error checking is enabled
 
         """
+        if self._deferred_file is not None:
+            # data of packages that have not been loaded are internal
+            return
         # set blocks
         for key, block in self.blocks.items():
             block.set_all_data_internal(check_data)
@@ -2389,8 +2456,8 @@ class MFPackage(PackageContainer, PackageInterface):
         """
         # open file
         try:
-            fd_input_file = open(
-                datautil.clean_filename(self.get_file_path()), "r"
+            fd_input_file = self._simulation_data.open_load_file(
+                datautil.clean_filename(self.get_file_path())
             )
         except OSError as e:
             if e.errno == errno.ENOENT:
@@ -2412,6 +2479,14 @@ class MFPackage(PackageContainer, PackageInterface):
                     self._simulation_data.debug,
                 )
 
+        if self._simulation_data.lazy_load and self._can_defer_load():
+            fd_input_file.close()
+            if self._defer_load(strict):
+                return True
+            fd_input_file = open(
+                datautil.clean_filename(self.get_file_path()), "r"
+            )
+
         try:
             self._load_blocks(fd_input_file, strict)
         except ReadAsArraysException as err:
@@ -2426,6 +2501,91 @@ class MFPackage(PackageContainer, PackageInterface):
         # return validity of file
         return self.is_valid()
 
+    def _can_defer_load(self):
+        """Whether the package type can be loaded with lazy=True.  The name
+        files, discretization packages and child packages are needed to load
+        other packages and are always loaded."""
+        return self.parent_file is None and self.package_type not in (
+            "nam",
+            "tdis",
+            "dis",
+            "disv",
+            "disu",
+        )
+
+    def _defer_load(self, strict=True):
+        """Scans the package file for block headers, recording the byte
+        offsets of each block in block_offsets, and defers loading the
+        blocks until the package data are first used.
+
+        Parameters
+        ----------
+        strict : bool
+            Enforce strict checking of data when the blocks are loaded.
+
+        Returns
+        -------
+        deferred : bool
+            False if the file refers to other files and must be loaded now.
+
+        """
+        file_path = os.path.abspath(
+            datautil.clean_filename(self.get_file_path())
+        )
+        with open(file_path, "rb") as f:
+            text = f.read()
+        if _LAZY_LOAD_EXCLUDE.search(text) is not None:
+            return False
+
+        # record block locations, from the beginning of the BEGIN line to
+        # the end of the END line
+        block_offsets = []
+        start = None
+        for match in _BLOCK_LINE.finditer(text):
+            keyword = match.group(1).lower()
+            name = match.group(2).decode().lower()
+            if keyword == b"begin":
+                start = (name, match.start())
+            elif start is not None and start[0] == name:
+                block_offsets.append((name, start[1], match.end()))
+                start = None
+        self.block_offsets = block_offsets
+
+        # remove data attributes until they are used, see _DeferredData
+        data_ids = {id(data) for data in self._data_list}
+        package_class = type(self)
+        for name, value in list(self.__dict__.items()):
+            if id(value) in data_ids:
+                self._deferred_data[name] = self.__dict__.pop(name)
+                if not isinstance(
+                    package_class.__dict__.get(name), _DeferredData
+                ):
+                    setattr(
+                        package_class, name, _DeferredData(name, package_class)
+                    )
+        self._deferred_file = file_path
+        self._deferred_strict = strict
+        return True
+
+    def _load_deferred(self):
+        """Loads the blocks of a package loaded with lazy=True if they have
+        not been loaded."""
+        if self._deferred_file is None:
+            return
+        file_path = self._deferred_file
+        self._deferred_file = None
+        self.__dict__.update(self._deferred_data)
+        self._deferred_data = {}
+        if (
+            self._simulation_data.verbosity_level.value
+            >= VerbosityLevel.verbose.value
+        ):
+            print(f"    loading package {self._get_pname()}...")
+        with open(file_path, "r") as fd_input_file:
+            self._load_blocks(fd_input_file, self._deferred_strict)
+        if self.simulation_data.auto_set_sizes:
+            self._update_size_defs()
+
     def is_valid(self):
         """Returns whether or not this package is valid.
 
@@ -2434,6 +2594,8 @@ class MFPackage(PackageContainer, PackageInterface):
         is valid : bool
 
         """
+        if self._deferred_file is not None:
+            return True
         # Check blocks
         for block in self.blocks.values():
             # Non-optional blocks must be enabled
@@ -2640,15 +2802,31 @@ class MFPackage(PackageContainer, PackageInterface):
         ext_file_action : ExtFileAction
             How to handle pathing of external data files.
         """
-        if self.simulation_data.auto_set_sizes:
+        snapshot = self.simulation_data.snapshot
+        if snapshot is not None:
+            # store the package text in the snapshot being saved
+            self._load_deferred()
+        if self._deferred_file is None and self.simulation_data.auto_set_sizes:
             self._update_size_defs()
+        package_file_path = self.get_file_path()
+        if snapshot is not None:
+            fd = io.StringIO()
+            self._write_blocks(fd, ext_file_action)
+            snapshot.add_text(package_file_path, fd.getvalue())
+            return
 
         # create any folders in path
-        package_file_path = self.get_file_path()
         package_folder = os.path.split(package_file_path)[0]
         if package_folder and not os.path.isdir(package_folder):
             os.makedirs(os.path.split(package_file_path)[0])
 
+        if self._deferred_file is not None:
+            # the package has not been used since it was loaded, so copy
+            # the original file
+            if os.path.abspath(package_file_path) != self._deferred_file:
+                shutil.copyfile(self._deferred_file, package_file_path)
+            return
+
         # open file
         fd = open(package_file_path, "w")
 
@@ -2870,6 +3048,7 @@ class MFPackage(PackageContainer, PackageInterface):
         """
         from flopy import export
 
+        self._load_deferred()
         return export.utils.package_export(f, self, **kwargs)
 
     def plot(self, **kwargs):
@@ -2908,6 +3087,7 @@ class MFPackage(PackageContainer, PackageInterface):
         if not self.plottable:
             raise TypeError("Simulation level packages are not plottable")
 
+        self._load_deferred()
         axes = PlotUtilities._plot_package_helper(self, **kwargs)
         return axes
 
@@ -0,0 +1,333 @@
+"""
+Module to save and restore snapshots of MODFLOW 6 simulations.  A snapshot
+is a single NumPy .npz file that contains the text of the simulation's
+package files, with the data of internal arrays and of list blocks replaced
+by markers that refer to binary blobs stored in the same file.  External
+files and other files the simulation refers to are stored in the snapshot
+as bytes, so a snapshot does not depend on the simulation folder it was
+saved from.  Snapshots are written and read without pickle.  Snapshots are saved with
+MFSimulation.save_snapshot() and loaded with MFSimulation.load_snapshot().
+
+"""
+import json
+import os
+
+import numpy as np
+
+_MARKER = "SNAPSHOT"
+_METADATA = "metadata"
+_FORMAT_VERSION = 2
+
+
+def _column_to_array(column):
+    """
+    Convert a column of a list recarray to an array that can be saved
+    without pickle.  Returns the array and the kind of values in the
+    column, or None if the column can not be saved as an array.
+
+    """
+    if column.dtype.kind in "biuf":
+        return column, "array"
+    if column.dtype.kind != "O":
+        return None
+    values = column.tolist()
+    value_types = {type(value) for value in values}
+    if value_types == {tuple}:
+        sizes = {len(value) for value in values}
+        if len(sizes) != 1 or not all(
+            isinstance(item, (int, np.integer))
+            for value in values
+            for item in value
+        ):
+            return None
+        return np.array(values, dtype=np.int64), "cellid"
+    elif value_types == {str}:
+        return np.array(values, dtype=str), "str"
+    elif value_types == {float}:
+        return np.array(values, dtype=np.float64), "float"
+    elif value_types == {int}:
+        return np.array(values, dtype=np.int64), "int"
+    return None
+
+
+class MFSnapshot:
+    """
+    Contents of a simulation snapshot.
+
+    Parameters
+    ----------
+    sim_ws : str
+        Simulation path of the simulation.  Package files are stored
+        relative to this path.
+    sim_name : str
+        Name of the simulation.
+    version : str
+        MODFLOW version of the simulation.
+    exe_name : str
+        Name of the MODFLOW executable of the simulation.
+
+    Attributes
+    ----------
+    read_only : bool
+        True for snapshots loaded from a file.  No data is added to a read
+        only snapshot.
+
+    """
+
+    def __init__(self, sim_ws, sim_name="sim", version="mf6", exe_name="mf6"):
+        self.sim_ws = sim_ws
+        self.sim_name = sim_name
+        self.version = version
+        self.exe_name = exe_name
+        self.texts = {}
+        self.read_only = False
+        self._blobs = {}
+        self._lists = {}
+        self._files = {}
+        self._count = 0
+
+    def _key(self, file_path):
+        return os.path.normcase(
+            os.path.relpath(os.path.abspath(file_path), self.sim_ws)
+        )
+
+    def _in_sim_ws(self, file_path):
+        key = self._key(file_path)
+        return not (os.path.isabs(key) or key.split(os.sep)[0] == os.pardir)
+
+    def _add_columns(self, name, data):
+        if not isinstance(data, np.recarray) or len(data) == 0:
+            return None
+        columns = []
+        for column_name in data.dtype.names:
+            column = _column_to_array(data[column_name])
+            if column is None:
+                return None
+            columns.append(column)
+        for icol, (column, _) in enumerate(columns):
+            self._blobs[f"{name}_{icol}"] = column
+        return [kind for _, kind in columns]
+
+    def _get_columns(self, name, kinds):
+        columns = []
+        for icol, kind in enumerate(kinds):
+            values = self._blobs[f"{name}_{icol}"].tolist()
+            if kind == "cellid":
+                values = [tuple(value) for value in values]
+            columns.append(values)
+        return list(zip(*columns))
+
+    def _next_marker(self):
+        index = self._count
+        self._count += 1
+        return index, f"{_MARKER} {index}"
+
+    @staticmethod
+    def _marker_index(arr_line):
+        if len(arr_line) == 2 and arr_line[0].upper() == _MARKER:
+            try:
+                return int(arr_line[1])
+            except ValueError:
+                return None
+        return None
+
+    def is_marker(self, arr_line):
+        """
+        Check if a split line of package text is a marker for data stored
+        in the snapshot.
+
+        """
+        return self._marker_index(arr_line) is not None
+
+    def add_text(self, file_path, text):
+        """
+        Add the text of a package file.
+
+        """
+        self.texts[self._key(file_path)] = text
+
+    def get_text(self, file_path):
+        """
+        Get the text of a package file, or None if the file is not in the
+        snapshot.
+
+        """
+        return self.texts.get(self._key(file_path))
+
+    def add_array(self, data):
+        """
+        Add the data of an array.  Returns the marker to write in place of
+        the data, or None if the array can not be stored in the snapshot.
+
+        """
+        if (
+            self.read_only
+            or not isinstance(data, np.ndarray)
+            or data.dtype.kind not in "biuf"
+        ):
+            return None
+        index, marker = self._next_marker()
+        self._blobs[f"array_{index}"] = data
+        return marker
+
+    def get_array(self, line):
+        """
+        Get the array for a marker line, or None if the line is not a
+        marker.
+
+        """
+        index = self._marker_index(line.split())
+        if index is None:
+            return None
+        return self._blobs[f"array_{index}"]
+
+    def add_list(self, data, comments=None):
+        """
+        Add the data of a list as one array for each column, and the text
+        of the comments mixed in with the data keyed by data line.  Returns
+        the marker to write in place of the data, or None if the list can
+        not be stored in the snapshot.
+
+        """
+        if self.read_only:
+            return None
+        index = self._count
+        kinds = self._add_columns(f"list_{index}", data)
+        if kinds is None:
+            return None
+        _, marker = self._next_marker()
+        self._lists[str(index)] = {
+            "kinds": kinds,
+            "comments": {} if comments is None else comments,
+        }
+        return marker
+
+    def get_list(self, arr_line):
+        """
+        Get the rows of the list and the comments mixed in with the data
+        for a split marker line, or None if the line is not a marker.
+
+        """
+        index = self._marker_index(arr_line)
+        if index is None:
+            return None
+        list_info = self._lists[str(index)]
+        comments = {
+            int(line_num): text
+            for line_num, text in list_info["comments"].items()
+        }
+        return self._get_columns(f"list_{index}", list_info["kinds"]), comments
+
+    def add_file(self, file_path):
+        """
+        Add the contents of a file the simulation refers to that is not a
+        package file, for example an external file.  Files outside of the
+        simulation path are not stored.
+
+        """
+        key = self._key(file_path)
+        if (
+            self.read_only
+            or key in self.texts
+            or key in self._files
+            or not self._in_sim_ws(file_path)
+            or not os.path.isfile(file_path)
+        ):
+            return
+        name = f"file_{len(self._files)}"
+        with open(file_path, "rb") as f:
+            self._blobs[name] = np.frombuffer(f.read(), dtype=np.uint8)
+        self._files[key] = name
+
+    def restore_files(self):
+        """
+        Write the files stored with add_file to the simulation path.
+        Existing files are not overwritten.  A file that already exists
+        with the same contents is left as is, and a file that exists with
+        different contents raises an error before any file is written.
+
+        """
+        new_files = []
+        for key, name in self._files.items():
+            file_path = os.path.join(self.sim_ws, key)
+            contents = self._blobs[name].tobytes()
+            if os.path.exists(file_path):
+                with open(file_path, "rb") as f:
+                    if f.read() != contents:
+                        raise FileExistsError(
+                            f"{file_path} already exists and differs from "
+                            "the file stored in the snapshot"
+                        )
+            else:
+                new_files.append((file_path, contents))
+        for file_path, contents in new_files:
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            with open(file_path, "wb") as f:
+                f.write(contents)
+
+    def save(self, path, compress=False):
+        """
+        Save the snapshot to a file.
+
+        Parameters
+        ----------
+        path : str
+            Path of the snapshot file.
+        compress : bool
+            Compress the snapshot file. (Default is False.)
+
+        """
+        metadata = {
+            "format_version": _FORMAT_VERSION,
+            "sim_ws": self.sim_ws,
+            "sim_name": self.sim_name,
+            "version": self.version,
+            "exe_name": self.exe_name,
+            "texts": self.texts,
+            "lists": self._lists,
+            "files": self._files,
+        }
+        blobs = dict(self._blobs)
+        blobs[_METADATA] = np.array(json.dumps(metadata))
+        savez = np.savez_compressed if compress else np.savez
+        with open(path, "wb") as f:
+            savez(f, **blobs)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load a snapshot from a file.
+
+        Parameters
+        ----------
+        path : str
+            Path of the snapshot file.
+
+        Returns
+        -------
+        snapshot : MFSnapshot
+
+        """
+        with np.load(path, allow_pickle=False) as data:
+            blobs = {name: data[name] for name in data.files}
+        metadata = json.loads(str(blobs.pop(_METADATA)))
+        if metadata.get("format_version") != _FORMAT_VERSION:
+            raise ValueError(
+                f"{path} is not a snapshot that can be loaded by this "
+                "version of flopy"
+            )
+        snapshot = cls(
+            metadata["sim_ws"],
+            metadata["sim_name"],
+            metadata["version"],
+            metadata["exe_name"],
+        )
+        snapshot.texts = metadata["texts"]
+        snapshot._lists = metadata["lists"]
+        snapshot._files = metadata["files"]
+        snapshot._blobs = blobs
+        snapshot.read_only = True
+        snapshot._count = len(metadata["lists"]) + sum(
+            name.startswith("array_") for name in blobs
+        )
+        return snapshot
@@ -1,4 +1,5 @@
 import errno
+import io
 import sys
 import inspect
 import os.path
@@ -14,6 +15,7 @@ from ..mfbase import (
     VerbosityLevel,
 )
 from ..mfpackage import MFPackage
+from ..mfsnapshot import MFSnapshot
 from ..data.mfstructure import DatumType
 from ..data import mfstructure
 from ..utils import binaryfile_utils
@@ -230,6 +232,12 @@ class MFSimulationData:
         Dictionary containing discretization information for each model
     mfdata : SimulationDict
         Custom dictionary containing all model data for the simulation
+    lazy_load : bool
+        When true packages that are loaded are only scanned for block headers
+        and their data are loaded the first time they are used
+    snapshot : MFSnapshot
+        Snapshot that the simulation is being saved to or loaded from,
+        otherwise None
 
     """
 
@@ -248,6 +256,8 @@ class MFSimulationData:
         self.comments_on = False
         self.auto_set_sizes = True
         self.verify_data = True
+        self.lazy_load = False
+        self.snapshot = None
         self.debug = False
         self.verbose = True
         self.verbosity_level = VerbosityLevel.normal
@@ -282,6 +292,29 @@ class MFSimulationData:
             self._max_columns_of_data = val
             self.max_columns_user_set = True
 
+    def open_load_file(self, file_path):
+        """
+        Opens a file to load.  Files stored in the snapshot being loaded
+        are returned as a text stream of the contents of the file in memory.
+
+        Parameters
+        ----------
+            file_path: str
+                path of the file
+
+        Returns
+        -------
+            file: file object
+
+        """
+        if self.snapshot is not None:
+            text = self.snapshot.get_text(file_path)
+            if text is not None:
+                fd = io.StringIO(text)
+                fd.name = file_path
+                return fd
+        return open(file_path, "r")
+
     def set_sci_note_upper_thres(self, value):
         """
         Sets threshold number where any number larger than threshold
@@ -602,6 +635,8 @@ class MFSimulation(PackageContainer):
         load_only=None,
         verify_data=False,
         write_headers=True,
+        lazy=False,
+        snapshot=None,
     ):
         """
         Load an existing model.
@@ -638,6 +673,18 @@ class MFSimulation(PackageContainer):
         write_headers: bool
             When true flopy writes a header to each package file indicating
             that it was created by flopy
+        lazy : bool
+            When true only the name files, the tdis package and the
+            discretization packages are loaded.  Other package files are
+            scanned for block headers and their data are loaded the first
+            time they are used.  Packages that are not used are written by
+            copying their original file.  Package files that contain
+            OPEN/CLOSE, FILEIN or READASARRAYS are always loaded.
+        snapshot : MFSnapshot
+            Snapshot that contains the package files and data of the
+            simulation.  Files that are not in the snapshot are read from
+            sim_ws.  Snapshot files are loaded with load_snapshot.  Default is
+            None, which reads all files from sim_ws.
 
         Returns
         -------
@@ -646,6 +693,7 @@ class MFSimulation(PackageContainer):
         Examples
         --------
         >>> s = flopy.mf6.mfsimulation.load('my simulation')
+        >>> s = flopy.mf6.mfsimulation.load('my simulation', lazy=True)
 
         """
         # initialize
@@ -659,90 +707,45 @@ class MFSimulation(PackageContainer):
         )
         verbosity_level = instance.simulation_data.verbosity_level
         instance.simulation_data.verify_data = verify_data
+        instance.simulation_data.lazy_load = lazy
+        instance.simulation_data.snapshot = snapshot
 
-        if verbosity_level.value >= VerbosityLevel.normal.value:
-            print("loading simulation...")
-
-        # build case consistent load_only dictionary for quick lookups
-        load_only = instance._load_only_dict(load_only)
-
-        # load simulation name file
-        if verbosity_level.value >= VerbosityLevel.normal.value:
-            print("  loading simulation name file...")
-        instance.name_file.load(strict)
-
-        # load TDIS file
-        tdis_pkg = f"tdis{mfstructure.MFStructure().get_version_string()}"
-        tdis_attr = getattr(instance.name_file, tdis_pkg)
-        instance._tdis_file = mftdis.ModflowTdis(
-            instance, filename=tdis_attr.get_data()
-        )
+        try:
+            if verbosity_level.value >= VerbosityLevel.normal.value:
+                print("loading simulation...")
 
-        instance._tdis_file._filename = instance.simulation_data.mfdata[
-            ("nam", "timing", tdis_pkg)
-        ].get_data()
-        if verbosity_level.value >= VerbosityLevel.normal.value:
-            print("  loading tdis package...")
-        instance._tdis_file.load(strict)
+            # build case consistent load_only dictionary for quick lookups
+            load_only = instance._load_only_dict(load_only)
 
-        # load models
-        try:
-            model_recarray = instance.simulation_data.mfdata[
-                ("nam", "models", "models")
-            ]
-            models = model_recarray.get_data()
-        except MFDataException as mfde:
-            message = (
-                "Error occurred while loading model names from the "
-                "simulation name file."
-            )
-            raise MFDataException(
-                mfdata_except=mfde,
-                model=instance.name,
-                package="nam",
-                message=message,
-            )
-        for item in models:
-            # resolve model working folder and name file
-            path, name_file = os.path.split(item[1])
-            model_obj = PackageContainer.model_factory(item[0][:-1].lower())
-            # load model
+            # load simulation name file
             if verbosity_level.value >= VerbosityLevel.normal.value:
-                print(f"  loading model {item[0].lower()}...")
-            instance._models[item[2]] = model_obj.load(
-                instance,
-                instance.structure.model_struct_objs[item[0].lower()],
-                item[2],
-                name_file,
-                version,
-                exe_name,
-                strict,
-                path,
-                load_only,
+                print("  loading simulation name file...")
+            instance.name_file.load(strict)
+
+            # load TDIS file
+            tdis_pkg = f"tdis{mfstructure.MFStructure().get_version_string()}"
+            tdis_attr = getattr(instance.name_file, tdis_pkg)
+            instance._tdis_file = mftdis.ModflowTdis(
+                instance, filename=tdis_attr.get_data()
             )
 
-        # load exchange packages and dependent packages
-        try:
-            exchange_recarray = instance.name_file.exchanges
-            has_exch_data = exchange_recarray.has_data()
-        except MFDataException as mfde:
-            message = (
-                "Error occurred while loading exchange names from the "
-                "simulation name file."
-            )
-            raise MFDataException(
-                mfdata_except=mfde,
-                model=instance.name,
-                package="nam",
-                message=message,
-            )
-        if has_exch_data:
+            instance._tdis_file._filename = instance.simulation_data.mfdata[
+                ("nam", "timing", tdis_pkg)
+            ].get_data()
+            if verbosity_level.value >= VerbosityLevel.normal.value:
+                print("  loading tdis package...")
+            instance._tdis_file.load(strict)
+
+            # load models
             try:
-                exch_data = exchange_recarray.get_data()
+                model_recarray = instance.simulation_data.mfdata[
+                    ("nam", "models", "models")
+                ]
+                models = model_recarray.get_data()
             except MFDataException as mfde:
                 message = (
-                    "Error occurred while loading exchange names from "
-                    "the simulation name file."
+                    "Error occurred while loading model names from the "
+                    "simulation name file."
                 )
                 raise MFDataException(
                     mfdata_except=mfde,
@@ -750,114 +753,238 @@ class MFSimulation(PackageContainer):
                     package="nam",
                     message=message,
                 )
-            for exgfile in exch_data:
-                if load_only is not None and not instance._in_pkg_list(
-                    load_only, exgfile[0], exgfile[2]
-                ):
-                    if (
-                        instance.simulation_data.verbosity_level.value
-                        >= VerbosityLevel.normal.value
-                    ):
-                        print(f"    skipping package {exgfile[0].lower()}...")
-                    continue
-                # get exchange type by removing numbers from exgtype
-                exchange_type = "".join(
-                    [char for char in exgfile[0] if not char.isdigit()]
-                ).upper()
-                # get exchange number for this type
-                if exchange_type not in instance._exg_file_num:
-                    exchange_file_num = 0
-                    instance._exg_file_num[exchange_type] = 1
-                else:
-                    exchange_file_num = instance._exg_file_num[exchange_type]
-                    instance._exg_file_num[exchange_type] += 1
+            for item in models:
+                # resolve model working folder and name file
+                path, name_file = os.path.split(item[1])
+                model_obj = PackageContainer.model_factory(
+                    item[0][:-1].lower()
+                )
+                # load model
+                if verbosity_level.value >= VerbosityLevel.normal.value:
+                    print(f"  loading model {item[0].lower()}...")
+                instance._models[item[2]] = model_obj.load(
+                    instance,
+                    instance.structure.model_struct_objs[item[0].lower()],
+                    item[2],
+                    name_file,
+                    version,
+                    exe_name,
+                    strict,
+                    path,
+                    load_only,
+                )
 
-                exchange_name = f"{exchange_type}_EXG_{exchange_file_num}"
-                # find package class the corresponds to this exchange type
-                package_obj = instance.package_factory(
-                    exchange_type.replace("-", "").lower(), ""
+            # load exchange packages and dependent packages
+            try:
+                exchange_recarray = instance.name_file.exchanges
+                has_exch_data = exchange_recarray.has_data()
+            except MFDataException as mfde:
+                message = (
+                    "Error occurred while loading exchange names from the "
+                    "simulation name file."
                 )
-                if not package_obj:
+                raise MFDataException(
+                    mfdata_except=mfde,
+                    model=instance.name,
+                    package="nam",
+                    message=message,
+                )
+            if has_exch_data:
+                try:
+                    exch_data = exchange_recarray.get_data()
+                except MFDataException as mfde:
                     message = (
-                        "An error occurred while loading the "
-                        "simulation name file.  Invalid exchange type "
-                        '"{}" specified.'.format(exchange_type)
+                        "Error occurred while loading exchange names from "
+                        "the simulation name file."
                     )
-                    type_, value_, traceback_ = sys.exc_info()
                     raise MFDataException(
-                        instance.name,
-                        "nam",
-                        "nam",
-                        "loading simulation name file",
-                        exchange_recarray.structure.name,
-                        inspect.stack()[0][3],
-                        type_,
-                        value_,
-                        traceback_,
-                        message,
-                        instance._simulation_data.debug,
+                        mfdata_except=mfde,
+                        model=instance.name,
+                        package="nam",
+                        message=message,
                     )
+                for exgfile in exch_data:
+                    if load_only is not None and not instance._in_pkg_list(
+                        load_only, exgfile[0], exgfile[2]
+                    ):
+                        if (
+                            instance.simulation_data.verbosity_level.value
+                            >= VerbosityLevel.normal.value
+                        ):
+                            print(
+                                f"    skipping package {exgfile[0].lower()}..."
+                            )
+                        continue
+                    # get exchange type by removing numbers from exgtype
+                    exchange_type = "".join(
+                        [char for char in exgfile[0] if not char.isdigit()]
+                    ).upper()
+                    # get exchange number for this type
+                    if exchange_type not in instance._exg_file_num:
+                        exchange_file_num = 0
+                        instance._exg_file_num[exchange_type] = 1
+                    else:
+                        exchange_file_num = instance._exg_file_num[
+                            exchange_type
+                        ]
+                        instance._exg_file_num[exchange_type] += 1
+
+                    exchange_name = f"{exchange_type}_EXG_{exchange_file_num}"
+                    # find package class the corresponds to this exchange type
+                    package_obj = instance.package_factory(
+                        exchange_type.replace("-", "").lower(), ""
+                    )
+                    if not package_obj:
+                        message = (
+                            "An error occurred while loading the "
+                            "simulation name file.  Invalid exchange type "
+                            '"{}" specified.'.format(exchange_type)
+                        )
+                        type_, value_, traceback_ = sys.exc_info()
+                        raise MFDataException(
+                            instance.name,
+                            "nam",
+                            "nam",
+                            "loading simulation name file",
+                            exchange_recarray.structure.name,
+                            inspect.stack()[0][3],
+                            type_,
+                            value_,
+                            traceback_,
+                            message,
+                            instance._simulation_data.debug,
+                        )
 
-                # build and load exchange package object
-                exchange_file = package_obj(
-                    instance,
-                    exgtype=exgfile[0],
-                    exgmnamea=exgfile[2],
-                    exgmnameb=exgfile[3],
-                    filename=exgfile[1],
-                    pname=exchange_name,
-                    loading_package=True,
-                )
-                if verbosity_level.value >= VerbosityLevel.normal.value:
-                    print(
-                        f"  loading exchange package {exchange_file._get_pname()}..."
+                    # build and load exchange package object
+                    exchange_file = package_obj(
+                        instance,
+                        exgtype=exgfile[0],
+                        exgmnamea=exgfile[2],
+                        exgmnameb=exgfile[3],
+                        filename=exgfile[1],
+                        pname=exchange_name,
+                        loading_package=True,
                     )
-                exchange_file.load(strict)
-                instance._exchange_files[exgfile[1]] = exchange_file
+                    if verbosity_level.value >= VerbosityLevel.normal.value:
+                        print(
+                            f"  loading exchange package {exchange_file._get_pname()}..."
+                        )
+                    exchange_file.load(strict)
+                    instance._exchange_files[exgfile[1]] = exchange_file
 
-        # load simulation packages
-        solution_recarray = instance.simulation_data.mfdata[
-            ("nam", "solutiongroup", "solutiongroup")
-        ]
+            # load simulation packages
+            solution_recarray = instance.simulation_data.mfdata[
+                ("nam", "solutiongroup", "solutiongroup")
+            ]
 
-        try:
-            solution_group_dict = solution_recarray.get_data()
-        except MFDataException as mfde:
-            message = (
-                "Error occurred while loading solution groups from "
-                "the simulation name file."
-            )
-            raise MFDataException(
-                mfdata_except=mfde,
-                model=instance.name,
-                package="nam",
-                message=message,
-            )
-        for solution_group in solution_group_dict.values():
-            for solution_info in solution_group:
-                if load_only is not None and not instance._in_pkg_list(
-                    load_only, solution_info[0], solution_info[2]
-                ):
-                    if (
-                        instance.simulation_data.verbosity_level.value
-                        >= VerbosityLevel.normal.value
+            try:
+                solution_group_dict = solution_recarray.get_data()
+            except MFDataException as mfde:
+                message = (
+                    "Error occurred while loading solution groups from "
+                    "the simulation name file."
+                )
+                raise MFDataException(
+                    mfdata_except=mfde,
+                    model=instance.name,
+                    package="nam",
+                    message=message,
+                )
+            for solution_group in solution_group_dict.values():
+                for solution_info in solution_group:
+                    if load_only is not None and not instance._in_pkg_list(
+                        load_only, solution_info[0], solution_info[2]
                     ):
+                        if (
+                            instance.simulation_data.verbosity_level.value
+                            >= VerbosityLevel.normal.value
+                        ):
+                            print(
+                                f"    skipping package {solution_info[0].lower()}..."
+                            )
+                        continue
+                    ims_file = mfims.ModflowIms(
+                        instance,
+                        filename=solution_info[1],
+                        pname=solution_info[2],
+                    )
+                    if verbosity_level.value >= VerbosityLevel.normal.value:
                         print(
-                            f"    skipping package {solution_info[0].lower()}..."
+                            f"  loading ims package {ims_file._get_pname()}..."
                         )
-                    continue
-                ims_file = mfims.ModflowIms(
-                    instance, filename=solution_info[1], pname=solution_info[2]
-                )
-                if verbosity_level.value >= VerbosityLevel.normal.value:
-                    print(f"  loading ims package {ims_file._get_pname()}...")
-                ims_file.load(strict)
+                    ims_file.load(strict)
 
-        instance.simulation_data.mfpath.set_last_accessed_path()
+            instance.simulation_data.mfpath.set_last_accessed_path()
+        finally:
+            instance.simulation_data.lazy_load = False
+            instance.simulation_data.snapshot = None
         if verify_data:
             instance.check()
         return instance
 
+    @classmethod
+    def load_snapshot(
+        cls,
+        path,
+        sim_ws,
+        strict=True,
+        verbosity_level=1,
+        load_only=None,
+        verify_data=False,
+        write_headers=True,
+    ):
+        """
+        Load a simulation from a snapshot file saved with save_snapshot.
+
+        Parameters
+        ----------
+        path : str
+            Path of the snapshot file
+        sim_ws : str
+            Path to simulation working folder.  External files and other
+            files stored in the snapshot are written to this folder.
+            Existing files are not overwritten.  This can not be the
+            simulation working folder the snapshot was saved from.
+        strict : bool
+            Strict enforcement of file formatting
+        verbosity_level : int
+            Verbosity level of standard output
+        load_only : list
+            List of package abbreviations or package names corresponding to
+            packages that flopy will load, see load
+        verify_data : bool
+            Verify data when it is loaded
+        write_headers: bool
+            When true flopy writes a header to each package file indicating
+            that it was created by flopy
+
+        Returns
+        -------
+        sim : MFSimulation object
+
+        """
+        snapshot = MFSnapshot.load(path)
+        sim_ws = os.path.abspath(sim_ws)
+        if os.path.normcase(sim_ws) == os.path.normcase(snapshot.sim_ws):
+            raise ValueError(
+                f"Snapshot {path} can not be loaded into {sim_ws}, the "
+                "simulation working folder it was saved from"
+            )
+        snapshot.sim_ws = sim_ws
+        snapshot.restore_files()
+        return cls.load(
+            snapshot.sim_name,
+            snapshot.version,
+            snapshot.exe_name,
+            sim_ws,
+            strict=strict,
+            verbosity_level=verbosity_level,
+            load_only=load_only,
+            verify_data=verify_data,
+            write_headers=write_headers,
+            snapshot=snapshot,
+        )
+
     def check(self, f=None, verbose=True, level=1):
         """
         Check model data for common errors.
@@ -1513,11 +1640,56 @@ class MFSimulation(PackageContainer):
                 print(f"  writing model {model.name}...")
             model.write(ext_file_action=ext_file_action)
 
-        self.simulation_data.mfpath.set_last_accessed_path()
+        if sim_data.snapshot is None:
+            self.simulation_data.mfpath.set_last_accessed_path()
 
         if silent:
             self.simulation_data.verbosity_level = saved_verb_lvl
 
+    def save_snapshot(self, path, compress=False):
+        """
+        Save the simulation to a snapshot file that can be loaded with
+        load_snapshot.  The snapshot contains the package files of the
+        simulation, with the data of internal arrays and of list blocks
+        stored in binary form, so loading the snapshot is faster than
+        loading the package files.  External files and other files in the
+        simulation path that the simulation refers to are stored as bytes.
+        Snapshots are saved with numpy.savez and do not use pickle.
+
+        Parameters
+        ----------
+            path : str
+                Path of the snapshot file
+            compress : bool
+                Compress the snapshot file
+
+        Examples
+        --------
+        >>> sim = flopy.mf6.MFSimulation.load(sim_ws='my_sim')
+        >>> sim.save_snapshot('my_sim.npz')
+        >>> sim = flopy.mf6.MFSimulation.load_snapshot('my_sim.npz', 'new_ws')
+
+        """
+        sim_data = self.simulation_data
+        sim_data.snapshot = MFSnapshot(
+            os.path.abspath(sim_data.mfpath.get_sim_path()),
+            self.name,
+            self.version,
+            self.exe_name,
+        )
+        try:
+            self.write_simulation(
+                ext_file_action=ExtFileAction.copy_none, silent=True
+            )
+            mfpath = sim_data.mfpath
+            for file_path in mfpath.existing_file_dict.values():
+                sim_data.snapshot.add_file(
+                    mfpath.resolve_path(file_path, None)
+                )
+            sim_data.snapshot.save(path, compress)
+        finally:
+            sim_data.snapshot = None
+
     def set_sim_path(self, path):
         """Return a list of output data keys.
 
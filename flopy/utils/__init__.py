@@ -31,6 +31,12 @@ from .binaryfile import (
     CellBudgetFile,
     HeadUFile,
 )
+from .chunkedfile import ChunkedArray, open_chunked
+from .ensemblefile import (
+    EnsembleHeadFile,
+    EnsembleUcnFile,
+    EnsembleCellBudgetFile,
+)
 from .formattedfile import FormattedHeadFile
 from .modpathfile import PathlineFile, EndpointFile, TimeseriesFile
 from .swroutputfile import (
@@ -54,6 +60,7 @@ from .utils_def import FlopyBinaryData, totim_to_datetime
 from .flopy_io import read_fixed_var, write_fixed_var
 from .zonbud import (
     ZoneBudget,
+    ZoneBudgetBatch,
     ZoneFile6,
     ZoneBudget6,
     ZBNetOutput,
@@ -8,9 +8,19 @@ important classes that can be accessed by the user.
 *  CellBudgetFile (Binary cell-by-cell flow file)
 
 """
+import mmap
+import os
+import struct
+import time
+import zipfile
 import numpy as np
 import warnings
-from ..utils.datafile import Header, LayerFile
+from ..utils.datafile import Header, LayerFile, RecordCache, _running_stats
+from ..utils.chunkedfile import (
+    ChunkedArrayWriter,
+    open_chunked,
+    write_chunked_group,
+)
 
 
 class BinaryHeader(Header):
@@ -269,6 +279,98 @@ def get_headfile_precision(filename):
     return result
 
 
+def get_index_file_path(filename, index_file):
+    """
+    Get the path of the sidecar index file for a binary output file.
+
+    Parameters
+    ----------
+    filename : str
+        Name of the binary output file.
+    index_file : bool or str
+        If True, the index file is named filename with a ".fpidx"
+        extension appended.  If a string, it is the name of the index file.
+        If False or None, an index file is not used.
+
+    Returns
+    -------
+    result : str or None
+        Path of the index file or None if an index file is not used.
+
+    """
+    if index_file is None or index_file is False:
+        return None
+    elif index_file is True:
+        return f"{filename}.fpidx"
+    return str(index_file)
+
+
+def _get_index_key(filename):
+    """
+    Get the size and modification time of a file, which are used to
+    determine if an index file is still valid.
+
+    """
+    stat = os.stat(filename)
+    return np.array([stat.st_size, stat.st_mtime_ns], dtype=np.int64)
+
+
+def read_index_file(index_file, filename):
+    """
+    Read a sidecar index file written by write_index_file.
+
+    Parameters
+    ----------
+    index_file : str
+        Name of the index file.
+    filename : str
+        Name of the binary output file that was indexed.
+
+    Returns
+    -------
+    data : dict or None
+        Dictionary of index arrays.  None is returned if the index file does
+        not exist, cannot be read, or if the binary output file has changed
+        since the index file was written.
+
+    """
+    if not os.path.isfile(index_file):
+        return None
+    try:
+        with np.load(index_file, allow_pickle=False) as f:
+            data = {key: f[key] for key in f.files}
+    except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+        return None
+    key = data.pop("key", None)
+    if key is None or not np.array_equal(key, _get_index_key(filename)):
+        return None
+    return data
+
+
+def write_index_file(index_file, filename, **kwargs):
+    """
+    Write a sidecar index file for a binary output file.  The size and
+    modification time of the binary output file are stored with the index
+    arrays so stale index files are ignored by read_index_file.
+
+    Parameters
+    ----------
+    index_file : str
+        Name of the index file.
+    filename : str
+        Name of the binary output file that was indexed.
+    **kwargs : dict
+        Index arrays to store in the index file.
+
+    """
+    try:
+        with open(index_file, "wb") as f:
+            np.savez(f, key=_get_index_key(filename), **kwargs)
+    except OSError as e:
+        warnings.warn(f"Could not write index file {index_file}: {e}")
+    return
+
+
 class BinaryLayerFile(LayerFile):
     """
     The BinaryLayerFile class is the super class from which specific derived
@@ -276,8 +378,26 @@ class BinaryLayerFile(LayerFile):
 
     """
 
-    def __init__(self, filename, precision, verbose, kwargs):
+    def __init__(
+        self,
+        filename,
+        precision,
+        verbose,
+        kwargs,
+        mmap=False,
+        index_file=False,
+        cache_size=0,
+    ):
+        self.mmap = mmap
+        self.cache_size = cache_size
+        self.index_file = get_index_file_path(filename, index_file)
+        self._memmap = None
+        self.cache = None
+        if cache_size > 0 and not mmap:
+            self.cache = RecordCache(cache_size)
         super().__init__(filename, precision, verbose, kwargs)
+        if self.mmap:
+            self._memmap = np.memmap(self.filename, dtype=np.uint8, mode="r")
         return
 
     def __enter__(self):
@@ -289,9 +409,15 @@ class BinaryLayerFile(LayerFile):
     def _build_index(self):
         """
         Build the recordarray and iposarray, which maps the header information
-        to the position in the binary file.
+        to the position in the binary file.  If an index file is used and
+        it is current, the index is read from the index file instead of
+        scanning the binary file.
 
         """
+        if self.index_file is not None:
+            if self._read_index_file():
+                return
+
         header = self._get_header()
         self.nrow = header["nrow"]
         self.ncol = header["ncol"]
@@ -307,32 +433,197 @@ class BinaryLayerFile(LayerFile):
         self.file.seek(0, 2)
         self.totalbytes = self.file.tell()
         self.file.seek(0, 0)
-        ipos = 0
-        while ipos < self.totalbytes:
+        headers, iposarray = self._index_records(0)
+
+        # self.recordarray contains a recordarray of all the headers.
+        self.recordarray = np.array(headers, dtype=self.header_dtype)
+        self.iposarray = np.array(iposarray, dtype=np.int64)
+        if len(self.recordarray) > 0:
+            self.nlay = np.max(self.recordarray["ilay"])
+
+        if self.index_file is not None:
+            self._write_index_file()
+        return
+
+    def _index_records(self, ipos):
+        """
+        Read the headers from byte position ipos to the end of the file and
+        update the list of unique times and time steps.  Records with text
+        that does not match the file text are skipped.  A record that is
+        only partially written is not indexed.  The byte position after the
+        last complete record is stored so indexing can be resumed by
+        refresh().
+
+        Returns
+        -------
+        headers : list
+            headers of the records
+        iposarray : list of ints
+            byte position of the start of the data for each record
+
+        """
+        headers = []
+        iposarray = []
+        hdrsize = self.header_dtype.itemsize
+        while ipos + hdrsize <= self.totalbytes:
+            self.file.seek(ipos, 0)
             header = self._get_header()
-            self.recordarray.append(header)
+            datapos = ipos + hdrsize
+            end = datapos + int(self.get_databytes(header))
+            if end > self.totalbytes:
+                break
+            ipos = end
             if self.text.upper() not in header["text"]:
                 continue
-            if ipos == 0:
-                self.times.append(header["totim"])
+            totim = header["totim"]
+            if len(self.times) == 0 or totim != self.times[-1]:
+                self.times.append(totim)
                 kstpkper = (header["kstp"], header["kper"])
                 self.kstpkper.append(kstpkper)
-            else:
-                totim = header["totim"]
-                if totim != self.times[-1]:
-                    self.times.append(totim)
-                    kstpkper = (header["kstp"], header["kper"])
-                    self.kstpkper.append(kstpkper)
-            ipos = self.file.tell()
-            self.iposarray.append(ipos)
-            databytes = self.get_databytes(header)
-            self.file.seek(databytes, 1)
-            ipos = self.file.tell()
+            headers.append(header)
+            iposarray.append(datapos)
+        self._index_end = ipos
+        return headers, iposarray
 
-        # self.recordarray contains a recordarray of all the headers.
-        self.recordarray = np.array(self.recordarray, dtype=self.header_dtype)
-        self.iposarray = np.array(self.iposarray)
+    def refresh(self):
+        """
+        Index records that have been written to the file since it was
+        opened or last refreshed.  Indexing resumes from the end of the
+        last complete record, so only the new part of the file is read.
+        A partially written record at the end of the file is ignored until
+        it is complete.
+
+        Returns
+        -------
+        nrecords : int
+            Number of new records.
+
+        Examples
+        --------
+        >>> import flopy
+        >>> hdobj = flopy.utils.HeadFile('model.hds')
+        >>> nnew = hdobj.refresh()
+
+        """
+        self.file.seek(0, 2)
+        self.totalbytes = self.file.tell()
+        if self.totalbytes <= self._index_end:
+            return 0
+        headers, iposarray = self._index_records(self._index_end)
+        if len(headers) == 0:
+            return 0
+        self.recordarray = np.concatenate(
+            (self.recordarray, np.array(headers, dtype=self.header_dtype))
+        )
+        self.iposarray = np.concatenate(
+            (self.iposarray, np.array(iposarray, dtype=np.int64))
+        )
         self.nlay = np.max(self.recordarray["ilay"])
+        if self._memmap is not None:
+            self._memmap = np.memmap(self.filename, dtype=np.uint8, mode="r")
+        if self.index_file is not None:
+            self._write_index_file()
+        return len(headers)
+
+    def follow(self, interval=1.0, timeout=None):
+        """
+        Generator that yields the data for each time step as it is written
+        to the file by a running model.  The time steps that are already in
+        the file are yielded first.  A time step is yielded once a record
+        for a later time is written, or when following stops because no new
+        records were written for timeout seconds.
+
+        Parameters
+        ----------
+        interval : float
+            Number of seconds to wait before checking the file for new
+            records.  (Default is 1.)
+        timeout : float
+            Stop if no new records are written for timeout seconds.  If
+            None, follow the file until the generator is closed.
+            (Default is None.)
+
+        Yields
+        ------
+        kstpkper : tuple of ints
+            Zero-based time step and stress period.
+        totim : float
+            The simulation time.
+        data : numpy array
+            Data array for the time step returned by get_data().
+
+        Examples
+        --------
+        >>> import flopy
+        >>> hdobj = flopy.utils.HeadFile('model.hds')
+        >>> for kstpkper, totim, head in hdobj.follow(timeout=60.):
+        ...     print(totim, head.max())
+
+        """
+        itim = 0
+        last = time.time()
+        while True:
+            if self.refresh() > 0:
+                last = time.time()
+                stop = False
+            else:
+                stop = timeout is not None and time.time() - last >= timeout
+            # the last time step may still be incomplete unless stopping
+            ntimes = len(self.times)
+            if not stop:
+                ntimes -= 1
+            while itim < ntimes:
+                kstp, kper = self.kstpkper[itim]
+                totim = self.times[itim]
+                yield (kstp - 1, kper - 1), totim, self.get_data(totim=totim)
+                itim += 1
+            if stop:
+                return
+            time.sleep(interval)
+
+    def _read_index_file(self):
+        """
+        Set the index from the index file.  Returns False if the index file
+        is missing, out of date, or was written for a different text or
+        precision.
+
+        """
+        data = read_index_file(self.index_file, self.filename)
+        if data is None:
+            return False
+        if (
+            str(data["text"]) != self.text.decode()
+            or str(data["precision"]) != self.precision
+            or data["recordarray"].dtype != self.header_dtype
+        ):
+            return False
+        self.nrow, self.ncol, self.nlay = data["shape"]
+        self.totalbytes = int(data["totalbytes"])
+        self.recordarray = data["recordarray"]
+        self.iposarray = data["iposarray"]
+        self.times = list(data["times"])
+        self.kstpkper = [tuple(kk) for kk in data["kstpkper"]]
+        self._index_end = int(data["indexend"])
+        return True
+
+    def _write_index_file(self):
+        """
+        Write the index to the index file.
+
+        """
+        write_index_file(
+            self.index_file,
+            self.filename,
+            text=self.text.decode(),
+            precision=self.precision,
+            shape=np.array([self.nrow, self.ncol, self.nlay], dtype=np.int32),
+            totalbytes=self.totalbytes,
+            indexend=self._index_end,
+            recordarray=self.recordarray,
+            iposarray=self.iposarray,
+            times=np.array(self.times, dtype=self.realtype),
+            kstpkper=np.array(self.kstpkper, dtype=np.int32).reshape(-1, 2),
+        )
         return
 
     def get_databytes(self, header):
@@ -358,6 +649,170 @@ class BinaryLayerFile(LayerFile):
     def _read_data(self, shp):
         return binaryread(self.file, self.realtype, shape=shp)
 
+    def _get_record_shape(self, header):
+        """
+        Return the shape of the data array that follows a header.
+
+        """
+        return (header["nrow"], header["ncol"])
+
+    def _read_record(self, idx):
+        """
+        Read the data array for the zero-based record idx.  If the file was
+        opened with mmap=True, a read-only view into the memory-mapped file
+        is returned instead of a copy.  If a cache is used, records are
+        returned from the cache when possible.
+
+        """
+        shp = self._get_record_shape(self.recordarray[idx])
+        ipos = int(self.iposarray[idx])
+        if self._memmap is not None:
+            count = int(np.prod(shp))
+            data = np.frombuffer(
+                self._memmap, dtype=self.realtype, count=count, offset=ipos
+            )
+            return data.reshape(shp)
+        if self.cache is not None:
+            idx = int(idx)
+            data = self.cache.get(idx)
+            if data is not None:
+                return self.cache.copy(data)
+        self.file.seek(ipos, 0)
+        data = self._read_data(shp).reshape(shp)
+        if self.cache is not None:
+            self.cache.put(idx, data)
+            data = self.cache.copy(data)
+        return data
+
+    def _get_data_array(self, totim=0):
+        """
+        Get the three dimensional data array for the
+        specified kstp and kper value or totim value.
+
+        """
+        if totim >= 0.0:
+            keyindices = np.where((self.recordarray["totim"] == totim))[0]
+            if len(keyindices) == 0:
+                msg = f"totim value ({totim}) not found in file..."
+                raise Exception(msg)
+        else:
+            raise Exception("Data not found...")
+
+        # initialize head with nan and then fill it
+        idx = keyindices[0]
+        nrow = self.recordarray["nrow"][idx]
+        ncol = self.recordarray["ncol"][idx]
+        data = np.empty((self.nlay, nrow, ncol), dtype=self.realtype)
+        data[:, :, :] = np.nan
+        for idx in keyindices:
+            ilay = self.recordarray["ilay"][idx]
+            if self.verbose:
+                ipos = self.iposarray[idx]
+                msg = f"Byte position in file: {ipos} for layer {ilay}"
+                print(msg)
+            data[ilay - 1] = self._read_record(idx)
+        return data
+
+    def _get_layer_array(self, totim, mflay):
+        """
+        Get the data array for a single zero-based layer for the specified
+        totim value.  Only the record for the requested layer is read.  If
+        the file was opened with mmap=True, a read-only view into the
+        memory-mapped file is returned.
+
+        """
+        keyindices = np.where(
+            (self.recordarray["totim"] == totim)
+            & (self.recordarray["ilay"] == mflay + 1)
+        )[0]
+        if len(keyindices) == 0:
+            if totim not in self.recordarray["totim"]:
+                msg = f"totim value ({totim}) not found in file..."
+                raise Exception(msg)
+            return self._get_data_array(totim)[mflay]
+        return self._read_record(keyindices[0])
+
+    def _get_strided_view(self):
+        """
+        Get a read-only (ntimes, nlay, ...) view of all of the records in a
+        memory-mapped file.  None is returned if the file is not memory
+        mapped or if the records are not evenly spaced, ordered by layer,
+        and of equal size.
+
+        """
+        if self._memmap is None or len(self.recordarray) == 0:
+            return None
+        ntimes = len(self.times)
+        nlay = int(self.nlay)
+        nrec = len(self.recordarray)
+        if nrec != ntimes * nlay or len(self.iposarray) != nrec:
+            return None
+        shp = self._get_record_shape(self.recordarray[0])
+        for name in ("nrow", "ncol"):
+            if np.any(self.recordarray[name] != self.recordarray[name][0]):
+                return None
+        ilay = np.tile(np.arange(1, nlay + 1), ntimes)
+        if not np.array_equal(self.recordarray["ilay"], ilay):
+            return None
+        totim = np.repeat(np.array(self.times), nlay)
+        if not np.array_equal(self.recordarray["totim"], totim):
+            return None
+        itemsize = self.realtype(1).nbytes
+        if nrec > 1:
+            stride = np.diff(self.iposarray)
+            if np.any(stride != stride[0]):
+                return None
+            stride = int(stride[0])
+        else:
+            stride = int(np.prod(shp)) * itemsize
+        base = np.frombuffer(
+            self._memmap,
+            dtype=self.realtype,
+            count=int(np.prod(shp)),
+            offset=int(self.iposarray[0]),
+        )
+        base = base.reshape(shp)
+        return np.lib.stride_tricks.as_strided(
+            base,
+            shape=(ntimes, nlay) + base.shape,
+            strides=(nlay * stride, stride) + base.strides,
+            writeable=False,
+        )
+
+    def get_alldata(self, mflay=None, nodata=-9999):
+        """
+        Get all of the data from the file.
+
+        Parameters
+        ----------
+        mflay : integer
+           MODFLOW zero-based layer number to return.  If None, then all
+           all layers will be included. (Default is None.)
+
+        nodata : float
+           The nodata value in the data array.  All array values that have the
+           nodata value will be assigned np.nan.  If the file was opened
+           with mmap=True and nodata is None, a read-only view into the
+           memory-mapped file is returned without copying the data.
+
+        Returns
+        ----------
+        data : numpy array
+            Array has size (ntimes, nlay, nrow, ncol) if mflay is None or it
+            has size (ntimes, nrow, ncol) if mlay is specified.
+
+        """
+        view = self._get_strided_view()
+        if view is None:
+            return super().get_alldata(mflay=mflay, nodata=nodata)
+        if mflay is not None:
+            view = view[:, mflay]
+        if nodata is None:
+            return view
+        rv = np.array(view)
+        rv[rv == nodata] = np.nan
+        return rv
+
     def _get_header(self):
         """
         Read the file header
@@ -402,26 +857,64 @@ class BinaryLayerFile(LayerFile):
         # Initialize result array and put times in first column
         result = self._init_result(nstation)
 
-        istat = 1
-        for k, i, j in kijlist:
-            ioffset = (i * self.ncol + j) * self.realtype(1).nbytes
-            for irec, header in enumerate(self.recordarray):
-                ilay = (
-                    header["ilay"] - 1
-                )  # change ilay from header to zero-based
-                if ilay != k:
+        kij = np.array(kijlist, dtype=np.int64).reshape(-1, 3)
+
+        # gather all of the cells at once from a regular memory-mapped file
+        view = self._get_strided_view()
+        if view is not None:
+            result[:, 1:] = view[:, kij[:, 0], kij[:, 1], kij[:, 2]]
+            return result
+
+        # map each time to a row in result
+        itimes = {}
+        for itim, totim in enumerate(result[:, 0]):
+            itimes.setdefault(totim, itim)
+
+        # zero-based cell number within a layer for each station
+        icell = kij[:, 1] * self.ncol + kij[:, 2]
+        ilay = self.recordarray["ilay"] - 1
+        totims = self.recordarray["totim"].astype(self.realtype)
+
+        # read the span of values containing the stations in a layer once
+        # for each record of that layer and scatter them into result
+        for k in np.unique(kij[:, 0]):
+            istat = np.where(kij[:, 0] == k)[0]
+            cells = icell[istat]
+            c0 = cells.min()
+            count = cells.max() - c0 + 1
+            for irec in np.where(ilay == k)[0]:
+                itim = itimes.get(totims[irec])
+                if itim is None:
                     continue
-                ipos = int(self.iposarray[irec])
+                values = self._read_values(irec, c0, count)
+                result[itim, istat + 1] = values[cells - c0]
+        return result
 
-                # Calculate offset necessary to reach intended cell
-                self.file.seek(ipos + int(ioffset), 0)
+    def _read_values(self, idx, start, count):
+        """
+        Read count values starting at the zero-based value start from the
+        data array of the zero-based record idx.
 
-                # Find the time index and then put value into result in the
-                # correct location.
-                itim = np.where(result[:, 0] == header["totim"])[0]
-                result[itim, istat] = binaryread(self.file, self.realtype)
-            istat += 1
-        return result
+        """
+        if self.cache is not None and int(idx) in self.cache:
+            data = self.cache.get(int(idx)).ravel()
+            return data[start : start + count].copy()
+        ipos = int(self.iposarray[idx]) + int(start) * self.realtype(1).nbytes
+        if self._memmap is not None:
+            return np.frombuffer(
+                self._memmap, dtype=self.realtype, count=count, offset=ipos
+            )
+        self.file.seek(ipos, 0)
+        return np.fromfile(self.file, self.realtype, count)
+
+    def close(self):
+        """
+        Close the file handle and release the memory-mapped file.
+
+        """
+        self._memmap = None
+        super().close()
+        return
 
 
 class HeadFile(BinaryLayerFile):
@@ -438,6 +931,23 @@ class HeadFile(BinaryLayerFile):
         'auto', 'single' or 'double'.  Default is 'auto'.
     verbose : bool
         Write information to the screen.  Default is False.
+    mmap : bool
+        Map the file into memory using numpy.memmap instead of reading
+        each record with seek and read calls.  get_data(mflay=...) and
+        get_alldata(nodata=None) return read-only views into the mapped
+        file.  Default is False.
+    index_file : bool or str
+        Sidecar index file used to avoid scanning the file headers each time
+        the file is opened.  If True, the index file is named filename with
+        a ".fpidx" extension appended.  The index file is written after the
+        first scan and is rebuilt if the size or modification time of the
+        file changes.  Default is False.
+    cache_size : int
+        Maximum number of bytes of records kept in a least recently used
+        cache, so records that are read repeatedly are not read from the
+        file again.  Cache statistics are available from the cache
+        attribute.  The cache is not used if mmap is True.  Default is 0
+        (no cache).
 
     Attributes
     ----------
@@ -476,7 +986,15 @@ class HeadFile(BinaryLayerFile):
     """
 
     def __init__(
-        self, filename, text="head", precision="auto", verbose=False, **kwargs
+        self,
+        filename,
+        text="head",
+        precision="auto",
+        verbose=False,
+        mmap=False,
+        index_file=False,
+        cache_size=0,
+        **kwargs,
     ):
         self.text = text.encode()
         if precision == "auto":
@@ -488,7 +1006,15 @@ class HeadFile(BinaryLayerFile):
         self.header_dtype = BinaryHeader.set_dtype(
             bintype="Head", precision=precision
         )
-        super().__init__(filename, precision, verbose, kwargs)
+        super().__init__(
+            filename,
+            precision,
+            verbose,
+            kwargs,
+            mmap=mmap,
+            index_file=index_file,
+            cache_size=cache_size,
+        )
         return
 
 
@@ -506,6 +1032,23 @@ class UcnFile(BinaryLayerFile):
         'auto', 'single' or 'double'.  Default is 'auto'.
     verbose : bool
         Write information to the screen.  Default is False.
+    mmap : bool
+        Map the file into memory using numpy.memmap instead of reading
+        each record with seek and read calls.  get_data(mflay=...) and
+        get_alldata(nodata=None) return read-only views into the mapped
+        file.  Default is False.
+    index_file : bool or str
+        Sidecar index file used to avoid scanning the file headers each time
+        the file is opened.  If True, the index file is named filename with
+        a ".fpidx" extension appended.  The index file is written after the
+        first scan and is rebuilt if the size or modification time of the
+        file changes.  Default is False.
+    cache_size : int
+        Maximum number of bytes of records kept in a least recently used
+        cache, so records that are read repeatedly are not read from the
+        file again.  Cache statistics are available from the cache
+        attribute.  The cache is not used if mmap is True.  Default is 0
+        (no cache).
 
     Attributes
     ----------
@@ -544,6 +1087,9 @@ class UcnFile(BinaryLayerFile):
         text="concentration",
         precision="auto",
         verbose=False,
+        mmap=False,
+        index_file=False,
+        cache_size=0,
         **kwargs,
     ):
         self.text = text.encode()
@@ -556,7 +1102,15 @@ class UcnFile(BinaryLayerFile):
         self.header_dtype = BinaryHeader.set_dtype(
             bintype="Ucn", precision=precision
         )
-        super().__init__(filename, precision, verbose, kwargs)
+        super().__init__(
+            filename,
+            precision,
+            verbose,
+            kwargs,
+            mmap=mmap,
+            index_file=index_file,
+            cache_size=cache_size,
+        )
         return
 
 
@@ -576,6 +1130,17 @@ class CellBudgetFile:
         'single' or 'double'.  Default is 'single'.
     verbose : bool
         Write information to the screen.  Default is False.
+    index_file : bool or str
+        Sidecar index file used to avoid scanning the record headers each
+        time the file is opened.  If True, the index file is named filename
+        with a ".fpidx" extension appended.  The index file is written after
+        the first scan and is rebuilt if the size or modification time of
+        the file changes.  Default is False.
+    cache_size : int
+        Maximum number of bytes of records kept in a least recently used
+        cache, so records that are read repeatedly are not read from the
+        file again.  Cache statistics are available from the cache
+        attribute.  Default is 0 (no cache).
 
     Attributes
     ----------
@@ -599,10 +1164,22 @@ class CellBudgetFile:
 
     """
 
-    def __init__(self, filename, precision="auto", verbose=False, **kwargs):
+    def __init__(
+        self,
+        filename,
+        precision="auto",
+        verbose=False,
+        index_file=False,
+        cache_size=0,
+        **kwargs,
+    ):
         self.filename = filename
         self.precision = precision
         self.verbose = verbose
+        self.index_file = get_index_file_path(filename, index_file)
+        self.cache = None
+        if cache_size > 0:
+            self.cache = RecordCache(cache_size)
         self.file = open(self.filename, "rb")
         # Get filesize to ensure this is not an empty file
         self.file.seek(0, 2)
@@ -624,6 +1201,7 @@ class CellBudgetFile:
         self.imethlist = []
         self.paknamlist = []
         self.nrecords = 0
+        self._nodeindex = {}
 
         self.dis = None
         self.modelgrid = None
@@ -661,19 +1239,27 @@ class CellBudgetFile:
             raise Exception(f"LayerFile error: unrecognized kwargs: {args}")
 
         if precision == "auto":
-            success = self._set_precision("single")
-            if not success:
-                success = self._set_precision("double")
-            if not success:
-                s = "Budget precision could not be auto determined"
-                raise BudgetIndexError(s)
-        elif precision == "single":
-            success = self._set_precision(precision)
-        elif precision == "double":
-            success = self._set_precision(precision)
+            precisions = ("single", "double")
+        elif precision in ("single", "double"):
+            precisions = (precision,)
         else:
             raise Exception(f"Unknown precision specified: {precision}")
 
+        # only accept a partially written record at the end of the file if
+        # the file cannot be read without it
+        success = False
+        for allow_partial in (False, True):
+            self._allow_partial = allow_partial
+            for value in precisions:
+                success = self._set_precision(value)
+                if success:
+                    break
+            if success:
+                break
+        if not success and precision == "auto":
+            s = "Budget precision could not be auto determined"
+            raise BudgetIndexError(s)
+
         # set shape for full3D option
         if self.modelgrid is None:
             self.shape = (self.nlay, self.nrow, self.ncol)
@@ -709,6 +1295,10 @@ class CellBudgetFile:
         self.imethlist = []
         self.paknamlist = []
         self.nrecords = 0
+        self.nrow = 0
+        self.ncol = 0
+        self.nlay = 0
+        self._nodeindex = {}
 
     def _set_precision(self, precision="single"):
         """
@@ -790,124 +1380,403 @@ class CellBudgetFile:
     def _build_index(self):
         """
         Build the ordered dictionary, which maps the header information
-        to the position in the binary file.
+        to the position in the binary file.  If an index file is used and
+        it is current, the index is read from the index file instead of
+        scanning the binary file.
         """
-        asciiset = " "
-        for i in range(33, 127):
-            asciiset += chr(i)
+        if self.index_file is not None:
+            if self._read_index_file():
+                return
 
-        # read first record
-        header = self._get_header()
-        nrow = header["nrow"]
-        ncol = header["ncol"]
-        text = header["text"]
-        if isinstance(text, bytes):
-            text = text.decode()
-        if nrow < 0 or ncol < 0:
-            raise Exception("negative nrow, ncol")
-        if not text.endswith("FLOW-JA-FACE"):
-            self.nrow = nrow
-            self.ncol = ncol
-            self.nlay = np.abs(header["nlay"])
         self.file.seek(0, 2)
         self.totalbytes = self.file.tell()
         self.file.seek(0, 0)
         self.recorddict = {}
-        # read the remaining records
-        ipos = 0
-        while ipos < self.totalbytes:
-            self.iposheader.append(ipos)
-            header = self._get_header()
-            self.nrecords += 1
-            totim = header["totim"]
-            if totim == 0:
-                totim = self._totim_from_kstpkper(
-                    (header["kstp"] - 1, header["kper"] - 1)
-                )
-                header["totim"] = totim
-            if totim >= 0 and totim not in self.times:
-                self.times.append(totim)
-            kstpkper = (header["kstp"], header["kper"])
-            if kstpkper not in self.kstpkper:
-                self.kstpkper.append(kstpkper)
-            if header["text"] not in self.textlist:
-                # check the precision of the file using text records
-                try:
-                    tlist = [header["text"], header["modelnam"]]
-                    for text in tlist:
-                        if isinstance(text, bytes):
-                            text = text.decode()
-                        for t in text:
-                            if t.upper() not in asciiset:
-                                raise Exception()
+        records, iposheader, iposarray = self._index_records(0)
 
-                except:
-                    raise BudgetIndexError("Improper precision")
-                self.textlist.append(header["text"])
-                self.imethlist.append(header["imeth"])
-            if header["paknam"] not in self.paknamlist:
-                self.paknamlist.append(header["paknam"])
-            ipos = self.file.tell()
+        # convert to numpy arrays
+        self.recordarray = np.array(records, dtype=self.header_dtype)
+        self.iposheader = np.array(iposheader, dtype=np.int64)
+        self.iposarray = np.array(iposarray, dtype=np.int64)
+        self._set_times()
 
-            if self.verbose:
-                for itxt in [
-                    "kstp",
-                    "kper",
-                    "text",
-                    "ncol",
-                    "nrow",
-                    "nlay",
-                    "imeth",
-                    "delt",
-                    "pertim",
-                    "totim",
-                    "modelnam",
-                    "paknam",
-                    "modelnam2",
-                    "paknam2",
-                ]:
-                    s = header[itxt]
-                    if isinstance(s, bytes):
-                        s = s.decode()
-                    print(f"{itxt}: {s}")
-                print("file position: ", ipos)
-                if (
-                    int(header["imeth"]) != 5
-                    and int(header["imeth"]) != 6
-                    and int(header["imeth"]) != 7
-                ):
-                    print("")
-
-            # set the nrow, ncol, and nlay if they have not been set
-            if self.nrow == 0:
-                text = header["text"]
-                if isinstance(text, bytes):
-                    text = text.decode()
-                if not text.endswith("FLOW-JA-FACE"):
-                    self.nrow = header["nrow"]
-                    self.ncol = header["ncol"]
-                    self.nlay = np.abs(header["nlay"])
-
-            # store record and byte position mapping
-            self.recorddict[
-                tuple(header)
-            ] = ipos  # store the position right after header2
-            self.recordarray.append(header)
-            self.iposarray.append(
-                ipos
-            )  # store the position right after header2
-
-            # skip over the data to the next record and set ipos
-            self._skip_record(header)
-            ipos = self.file.tell()
+        if self.index_file is not None:
+            self._write_index_file()
+        return
 
-        # convert to numpy arrays
-        self.recordarray = np.array(self.recordarray, dtype=self.header_dtype)
-        self.iposheader = np.array(self.iposheader, dtype=np.int64)
-        self.iposarray = np.array(self.iposarray, dtype=np.int64)
+    def _get_precision(self):
+        """
+        Get the precision that is being used to read the file.
+
+        """
+        if self.realtype == np.float32:
+            return "single"
+        return "double"
+
+    def _read_index_file(self):
+        """
+        Set the index from the index file.  Returns False if the index file
+        is missing, out of date, or was written without (or with) a
+        discretization object to compute missing times.
+
+        """
+        data = read_index_file(self.index_file, self.filename)
+        if data is None or bool(data["has_dis"]) != (self.dis is not None):
+            return False
+        if str(data["precision"]) != self._get_precision():
+            raise BudgetIndexError("Improper precision")
+        self.nrow, self.ncol, self.nlay = data["shape"]
+        self.totalbytes = int(data["totalbytes"])
+        self.recordarray = data["recordarray"]
+        self.iposheader = data["iposheader"]
+        self.iposarray = data["iposarray"]
+        self.times = list(data["times"])
+        self.kstpkper = [tuple(kk) for kk in data["kstpkper"]]
+        self.textlist = list(data["textlist"])
+        self.imethlist = list(data["imethlist"])
+        self.paknamlist = list(data["paknamlist"])
+        self.nrecords = len(self.recordarray)
+        self._index_end = int(data["indexend"])
+        self.recorddict = {
+            tuple(header): ipos
+            for header, ipos in zip(self.recordarray, self.iposarray)
+        }
+        self.nper = self.recordarray["kper"].max()
+        return True
+
+    def _write_index_file(self):
+        """
+        Write the index to the index file.
+
+        """
+        write_index_file(
+            self.index_file,
+            self.filename,
+            precision=self._get_precision(),
+            has_dis=self.dis is not None,
+            shape=np.array([self.nrow, self.ncol, self.nlay], dtype=np.int32),
+            totalbytes=self.totalbytes,
+            indexend=self._index_end,
+            recordarray=self.recordarray,
+            iposheader=self.iposheader,
+            iposarray=self.iposarray,
+            times=np.array(self.times, dtype=self.realtype),
+            kstpkper=np.array(self.kstpkper, dtype=np.int32).reshape(-1, 2),
+            textlist=np.array(self.textlist, dtype="S16"),
+            imethlist=np.array(self.imethlist, dtype=np.int32),
+            paknamlist=np.array(self.paknamlist, dtype="S16"),
+        )
+        return
+
+    def _index_records(self, ipos):
+        """
+        Read the record headers from byte position ipos to the end of the
+        file.  The record names, package names, and the record and byte
+        position mapping are updated as records are read.
+
+        A record that is only partially written is not indexed if
+        partially written records are allowed, otherwise a
+        BudgetIndexError is raised.  The byte position after the last
+        complete record is stored so indexing can be resumed by refresh().
+
+        Returns
+        -------
+        records : list of tuples
+            header values for each record
+        iposheader : list of ints
+            byte position of the start of each header
+        iposarray : list of ints
+            byte position of the start of the data for each record
+
+        """
+        if self.realtype == np.float32:
+            ffmt = "f"
+        else:
+            ffmt = "d"
+        header1 = struct.Struct("<2i16s3i")
+        header2 = struct.Struct(f"<i3{ffmt}")
+        names = struct.Struct("<16s16s16s16s")
+        noname = (b"", b"", b"", b"")
+
+        textset = set(self.textlist)
+        paknamset = set(self.paknamlist)
+        records = []
+        iposheader = []
+        iposarray = []
+        buffer = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            while ipos < self.totalbytes:
+                try:
+                    kstp, kper, text, ncol, nrow, nlay = header1.unpack_from(
+                        buffer, ipos
+                    )
+                    datapos = ipos + header1.size
+                    text = text.rstrip(b"\0")
+                    if nlay < 0:
+                        imeth, delt, pertim, totim = header2.unpack_from(
+                            buffer, datapos
+                        )
+                        datapos += header2.size
+                        if imeth == 6:
+                            modelnames = names.unpack_from(buffer, datapos)
+                            modelnames = tuple(
+                                n.rstrip(b"\0") for n in modelnames
+                            )
+                            datapos += names.size
+                        else:
+                            modelnames = noname
+                    else:
+                        imeth, delt, pertim, totim = 0, 0.0, 0.0, 0.0
+                        modelnames = noname
+                    end = datapos + self._get_record_nbytes(
+                        buffer, datapos, imeth, nrow, ncol, nlay
+                    )
+                except struct.error:
+                    end = None
+                if end is None or end > self.totalbytes:
+                    if self._allow_partial:
+                        break
+                    raise BudgetIndexError("Improper precision")
+
+                if self.nrecords == 0:
+                    if nrow < 0 or ncol < 0:
+                        raise Exception("negative nrow, ncol")
+                self.nrecords += 1
+                if totim == 0:
+                    totim = self._totim_from_kstpkper((kstp - 1, kper - 1))
+
+                # check the precision of the file using the text of each
+                # unique record name
+                if text not in textset:
+                    if len(text.strip()) == 0:
+                        raise BudgetIndexError("Improper precision")
+                    for t in (text, modelnames[0]):
+                        if not all(32 <= c < 127 for c in t):
+                            raise BudgetIndexError("Improper precision")
+                    textset.add(text)
+                    self.textlist.append(text)
+                    self.imethlist.append(imeth)
+                paknam = modelnames[1]
+                if paknam not in paknamset:
+                    paknamset.add(paknam)
+                    self.paknamlist.append(paknam)
+
+                # set the nrow, ncol, and nlay if they have not been set
+                if self.nrow == 0:
+                    if not text.endswith(b"FLOW-JA-FACE"):
+                        self.nrow = nrow
+                        self.ncol = ncol
+                        self.nlay = abs(nlay)
+
+                header = (
+                    kstp,
+                    kper,
+                    text,
+                    ncol,
+                    nrow,
+                    nlay,
+                    imeth,
+                    delt,
+                    pertim,
+                    totim,
+                ) + modelnames
+                if self.verbose:
+                    for itxt, s in zip(self.header_dtype.names, header):
+                        if isinstance(s, bytes):
+                            s = s.decode()
+                        print(f"{itxt}: {s}")
+                    print("file position: ", datapos)
+                    if imeth not in (5, 6, 7):
+                        print("")
+
+                # store record and byte position mapping
+                # (the position right after header2)
+                self.recorddict[header] = datapos
+                records.append(header)
+                iposheader.append(ipos)
+                iposarray.append(datapos)
+
+                # move to the next record
+                ipos = end
+        finally:
+            buffer.close()
+        self._index_end = ipos
+        return records, iposheader, iposarray
+
+    def _set_times(self):
+        """
+        Set nper and the unique times and time steps, in the order they
+        occur in the file, from the recordarray.
+
+        """
+        if len(self.recordarray) == 0:
+            return
         self.nper = self.recordarray["kper"].max()
+        totim = self.recordarray["totim"]
+        totim = totim[totim >= 0]
+        _, index = np.unique(totim, return_index=True)
+        self.times = list(totim[np.sort(index)])
+        kstpkper = np.column_stack(
+            (self.recordarray["kstp"], self.recordarray["kper"])
+        )
+        _, index = np.unique(kstpkper, axis=0, return_index=True)
+        self.kstpkper = [tuple(kk) for kk in kstpkper[np.sort(index)]]
         return
 
+    def refresh(self):
+        """
+        Index records that have been written to the file since it was
+        opened or last refreshed.  Indexing resumes from the end of the
+        last complete record, so only the new part of the file is read.
+        A partially written record at the end of the file is ignored until
+        it is complete.
+
+        Returns
+        -------
+        nrecords : int
+            Number of new records.
+
+        Examples
+        --------
+        >>> import flopy
+        >>> cbb = flopy.utils.CellBudgetFile('model.cbc')
+        >>> nnew = cbb.refresh()
+
+        """
+        self.file.seek(0, 2)
+        self.totalbytes = self.file.tell()
+        if self.totalbytes <= self._index_end:
+            return 0
+        allow_partial = self._allow_partial
+        self._allow_partial = True
+        try:
+            records, iposheader, iposarray = self._index_records(
+                self._index_end
+            )
+        finally:
+            self._allow_partial = allow_partial
+        if len(records) == 0:
+            return 0
+        self.recordarray = np.concatenate(
+            (self.recordarray, np.array(records, dtype=self.header_dtype))
+        )
+        self.iposheader = np.concatenate(
+            (self.iposheader, np.array(iposheader, dtype=np.int64))
+        )
+        self.iposarray = np.concatenate(
+            (self.iposarray, np.array(iposarray, dtype=np.int64))
+        )
+        self._set_times()
+        if self.index_file is not None:
+            self._write_index_file()
+        return len(records)
+
+    def follow(self, text=None, full3D=False, interval=1.0, timeout=None):
+        """
+        Generator that yields records as they are written to the file by a
+        running model.  The records that are already in the file are
+        yielded first.
+
+        Parameters
+        ----------
+        text : str
+            The text identifier for the records to yield.  If None, all
+            records are yielded.  (Default is None.)
+        full3D : boolean
+            If true, then return list-style records as three dimensional
+            numpy arrays.  (Default is False.)
+        interval : float
+            Number of seconds to wait before checking the file for new
+            records.  (Default is 1.)
+        timeout : float
+            Stop if no new records are written for timeout seconds.  If
+            None, follow the file until the generator is closed.
+            (Default is None.)
+
+        Yields
+        ------
+        kstpkper : tuple of ints
+            Zero-based time step and stress period of the record.
+        totim : float
+            The simulation time of the record.
+        text : str
+            The text identifier of the record.
+        data : record
+            The data record returned by get_record().
+
+        Examples
+        --------
+        >>> import flopy
+        >>> cbb = flopy.utils.CellBudgetFile('model.cbc')
+        >>> for kstpkper, totim, text, q in cbb.follow(
+        ...     text='STORAGE', timeout=60.
+        ... ):
+        ...     print(totim, q.sum())
+
+        """
+        text16 = None
+        idx = 0
+        last = time.time()
+        while True:
+            if text16 is None and text is not None:
+                try:
+                    text16 = self._find_text(text)
+                except Exception:
+                    pass
+            nrecords = len(self.recordarray)
+            while idx < nrecords:
+                header = self.recordarray[idx]
+                if text is None or header["text"] == text16:
+                    kstpkper = (header["kstp"] - 1, header["kper"] - 1)
+                    yield (
+                        kstpkper,
+                        header["totim"],
+                        header["text"].decode(),
+                        self.get_record(idx, full3D=full3D),
+                    )
+                idx += 1
+            if self.refresh() > 0:
+                last = time.time()
+            elif timeout is not None and time.time() - last >= timeout:
+                return
+            else:
+                time.sleep(interval)
+
+    def _get_record_nbytes(self, buffer, ipos, imeth, nrow, ncol, nlay):
+        """
+        Get the number of bytes of data in a record, not counting header
+        and header2, using the record dimensions and the list sizes
+        stored at the start of list records.
+
+        """
+        realsize = self.realtype(1).nbytes
+        intsize = 4
+        if imeth in (0, 1):
+            nbytes = nrow * ncol * abs(nlay) * realsize
+        elif imeth == 2:
+            (nlist,) = struct.unpack_from("<i", buffer, ipos)
+            nbytes = intsize + nlist * (intsize + realsize)
+        elif imeth == 3:
+            nbytes = nrow * ncol * (realsize + intsize)
+        elif imeth == 4:
+            nbytes = nrow * ncol * realsize
+        elif imeth in (5, 6):
+            (nauxp1,) = struct.unpack_from("<i", buffer, ipos)
+            naux = nauxp1 - 1
+            (nlist,) = struct.unpack_from(
+                "<i", buffer, ipos + intsize + naux * 16
+            )
+            if self.verbose:
+                print("naux: ", naux)
+                print("nlist: ", nlist)
+                print("")
+            nnode = 1 if imeth == 5 else 2
+            nbytes = 2 * intsize + naux * 16
+            nbytes += nlist * (nnode * intsize + (1 + naux) * realsize)
+        else:
+            raise BudgetIndexError(f"invalid method code {imeth}")
+        return nbytes
+
     def _skip_record(self, header):
         """
         Skip over this record, not counting header and header2.
@@ -1347,6 +2216,103 @@ class CellBudgetFile:
 
         return recordlist
 
+    def iter_records(self, text=None, paknam=None, full3D=False):
+        """
+        Iterate over the records in the budget file one record at a time.
+        Only the current record is held in memory.
+
+        Parameters
+        ----------
+        text : str
+            The text identifier for the records to return.  Examples include
+            'RIVER LEAKAGE', 'STORAGE', 'FLOW RIGHT FACE', etc.  If None,
+            all records are returned. (Default is None.)
+        paknam : str
+            The package name for the records to return.  If None, records
+            for all packages are returned. (Default is None.)
+        full3D : boolean
+            If true, then return the record as a three dimensional numpy
+            array, even for those list-style records written as part of a
+            'COMPACT BUDGET' MODFLOW budget file.  (Default is False.)
+
+        Yields
+        ------
+        kstpkper : tuple of ints
+            Zero-based time step and stress period.
+        totim : float
+            The simulation time.
+        text : str
+            The text identifier for the record.
+        record : a single data record
+            The record returned by get_record().
+
+        Examples
+        --------
+        >>> import flopy
+        >>> cbb = flopy.utils.CellBudgetFile('model.cbc')
+        >>> for kstpkper, totim, text, q in cbb.iter_records('STORAGE'):
+        ...     print(totim, q.sum())
+
+        """
+        select = np.ones(len(self.recordarray), dtype=bool)
+        if text is not None:
+            select &= self.recordarray["text"] == self._find_text(text)
+        if paknam is not None:
+            select &= self.recordarray["paknam"] == self._find_paknam(paknam)
+        for idx in np.where(select)[0]:
+            header = self.recordarray[idx]
+            kstpkper = (header["kstp"] - 1, header["kper"] - 1)
+            yield (
+                kstpkper,
+                header["totim"],
+                header["text"].decode(),
+                self.get_record(idx, full3D=full3D),
+            )
+
+    def get_stats(self, text, paknam=None, nodata=None, threshold=None):
+        """
+        Get cell-by-cell statistics over all of the records for a budget
+        term.  The records are read one at a time as full three-dimensional
+        arrays so memory use does not depend on the number of records.
+
+        Parameters
+        ----------
+        text : str
+            The text identifier for the records.  Examples include
+            'RIVER LEAKAGE', 'STORAGE', 'FLOW RIGHT FACE', etc.
+        paknam : str
+            The package name for the records.  If None, records for all
+            packages are included. (Default is None.)
+        nodata : float
+           The nodata value in the records.  Values that have the nodata
+           value are excluded from the statistics. (Default is None.)
+        threshold : float
+           If not None, the number of records with a value greater than
+           threshold in each cell is also returned. (Default is None.)
+
+        Returns
+        -------
+        stats : dict
+            Dictionary with 'min', 'max', 'mean' and 'count' (number of
+            records with a value for the cell) arrays and, if threshold is
+            not None, an 'exceedance' array.  Cells that are not included
+            in any list-style record are set to np.nan.
+
+        Examples
+        --------
+        >>> import flopy
+        >>> cbb = flopy.utils.CellBudgetFile('model.cbc')
+        >>> stats = cbb.get_stats('RIVER LEAKAGE', threshold=0.)
+        >>> stats['exceedance'].sum()
+
+        """
+        records = self.iter_records(text=text, paknam=paknam, full3D=True)
+        return _running_stats(
+            (rec for _, _, _, rec in records),
+            nodata=nodata,
+            threshold=threshold,
+        )
+
     def get_ts(self, idx, text=None, times=None):
         """
         Get a time series from the binary budget file.
@@ -1413,49 +2379,250 @@ class CellBudgetFile:
         for idx, t in enumerate(timesint):
             result[idx, 0] = t
 
-        for itim, k in enumerate(kk):
-            try:
-                v = self.get_data(kstpkper=k, text=text, full3D=True)
-                # skip missing data - required for storage
-                if len(v) > 0:
-                    v = v[0]
-                    istat = 1
-                    for k, i, j in kijlist:
-                        result[itim, istat] = v[k, i, j].copy()
-                        istat += 1
-            except ValueError:
-                v = self.get_data(kstpkper=k, text=text)
-                # skip missing data - required for storage
-                if len(v) > 0:
-                    if self.modelgrid is None:
-                        s = (
-                            "A modelgrid instance must be provided during "
-                            "instantiation to get IMETH=6 timeseries data"
-                        )
-                        raise AssertionError(s)
-
-                    if self.modelgrid.grid_type == "structured":
-                        ndx = [
-                            lrc[0]
-                            * (self.modelgrid.nrow * self.modelgrid.ncol)
-                            + lrc[1] * self.modelgrid.ncol
-                            + (lrc[2] + 1)
-                            for lrc in kijlist
-                        ]
-                    else:
-                        ndx = [
-                            lrc[0] * self.modelgrid.ncpl + (lrc[-1] + 1)
-                            for lrc in kijlist
-                        ]
+        # use the first record with text for each time step
+        text16 = self._find_text(text)
+        records = {}
+        for irec in np.where(self.recordarray["text"] == text16)[0]:
+            header = self.recordarray[irec]
+            kstpkper = (header["kstp"] - 1, header["kper"] - 1)
+            if kstpkper not in records:
+                records[kstpkper] = irec
 
-                    for vv in v:
-                        field = vv.dtype.names[2]
-                        dix = np.where(np.isin(vv["node"], ndx))[0]
-                        if len(dix) > 0:
-                            result[itim, 1:] = vv[field][dix]
+        for itim, k in enumerate(kk):
+            irec = records.get(k)
+            # skip missing data - required for storage
+            if irec is not None:
+                result[itim, 1:] = self._get_cell_values(irec, kijlist)
 
         return result
 
+    def to_chunked(self, path, text=None, chunks=None, level=6):
+        """
+        Write the records in the budget file to chunked, compressed array
+        stores in a local directory.  The records for each budget term are
+        written as full three-dimensional arrays to a subdirectory of path.
+        The file is read once, one record at a time.
+
+        Parameters
+        ----------
+        path : str
+            Directory of the stores.
+        text : str or list of str
+            The text identifier of the records to write.  If None, all of
+            the records are written. (Default is None.)
+        chunks : tuple of ints
+            Shape of the chunks (nrecords, nlay, nrow, ncol).  If None,
+            chunks contain 10 records and a single layer. (Default is None.)
+        level : int
+            zlib compression level. (Default is 6.)
+
+        Returns
+        -------
+        out : dict
+            Dictionary of ChunkedArray objects keyed by record text.  Each
+            array has size (nrecords, nlay, nrow, ncol) and the time step,
+            simulation time, and package name of each record are stored in
+            the attrs of the array.
+
+        Examples
+        --------
+        >>> import flopy
+        >>> cbb = flopy.utils.CellBudgetFile('model.cbc')
+        >>> arrays = cbb.to_chunked('model_cbc')
+        >>> frf = arrays['FLOW RIGHT FACE'][:, 0, 10, 10]
+
+        """
+        if text is None:
+            textlist = list(self.textlist)
+        elif isinstance(text, (str, bytes)):
+            textlist = [self._find_text(text)]
+        else:
+            textlist = [self._find_text(t) for t in text]
+
+        os.makedirs(path, exist_ok=True)
+        writers = {}
+        for idx, header in enumerate(self.recordarray):
+            if header["text"] not in textlist:
+                continue
+            name = header["text"].decode().strip()
+            data = self.get_record(idx, full3D=True)
+            if header["imeth"] == 4:
+                data = data[np.newaxis]
+            if name not in writers:
+                subdir = name.replace(" ", "_").replace("-", "_")
+                writers[name] = ChunkedArrayWriter(
+                    os.path.join(path, subdir),
+                    data.shape,
+                    self.realtype,
+                    chunks=chunks,
+                    level=level,
+                    attrs={
+                        "filename": os.path.basename(self.filename),
+                        "text": name,
+                        "totim": [],
+                        "kstpkper": [],
+                        "paknam": [],
+                    },
+                )
+            writer = writers[name]
+            writer.append(data)
+            writer.attrs["totim"].append(header["totim"])
+            writer.attrs["kstpkper"].append(
+                (header["kstp"] - 1, header["kper"] - 1)
+            )
+            writer.attrs["paknam"].append(header["paknam"])
+        for writer in writers.values():
+            writer.close()
+        write_chunked_group(
+            path,
+            {name: os.path.basename(w.path) for name, w in writers.items()},
+        )
+        return open_chunked(path)
+
+    def _get_cell_values(self, idx, kijlist):
+        """
+        Get the values for a list of cells from a record by reading only
+        the bytes for the cells.  The node numbers of list-style records
+        are read the first time a record is used and are cached.
+
+        Parameters
+        ----------
+        idx : int
+            The zero-based record number.
+        kijlist : list of tuples of ints
+            Zero-based (layer, row, column) of each cell.
+
+        Returns
+        ----------
+        values : numpy array
+            Value for each cell, np.nan if the record has no value for the
+            cell.  Values of list-style records for the same cell are
+            summed.
+
+        """
+        header = self.recordarray[idx]
+        ipos = int(self.iposarray[idx])
+        imeth = header["imeth"]
+        nrow = int(header["nrow"])
+        ncol = int(header["ncol"])
+        kij = np.array(kijlist, dtype=np.int64).reshape(-1, 3)
+        itemsize = self.realtype(1).nbytes
+        values = np.full(kij.shape[0], np.nan)
+
+        if imeth in (0, 1, 3, 4):
+            nlay = abs(int(header["nlay"])) if imeth < 3 else 1
+            if np.any(kij[:, 1:] >= (nrow, ncol)) or (
+                imeth < 3 and np.any(kij[:, 0] >= nlay)
+            ):
+                raise IndexError(
+                    f"cells {kijlist} are not within the record shape "
+                    f"{(nlay, nrow, ncol)}"
+                )
+
+        if imeth in (0, 1):
+            cell = (kij[:, 0] * nrow + kij[:, 1]) * ncol + kij[:, 2]
+            values[:] = self._read_at(ipos + cell * itemsize, self.realtype)
+        elif imeth in (3, 4):
+            cell = kij[:, 1] * ncol + kij[:, 2]
+            if imeth == 3:
+                ilayer = self._read_at(ipos + cell * 4, np.int32)
+                ipos += nrow * ncol * 4
+            else:
+                ilayer = np.ones(cell.shape, dtype=np.int32)
+            found = ilayer == kij[:, 0] + 1
+            values[found] = self._read_at(
+                ipos + cell[found] * itemsize, self.realtype
+            )
+        elif imeth in (2, 5, 6):
+            nodes, order, listpos, nbytes, qoffset = self._get_node_index(idx)
+            if len(self.shape) == 3:
+                nrow, ncol = self.shape[1], self.shape[2]
+            node = (kij[:, 0] * nrow + kij[:, 1]) * ncol + kij[:, 2] + 1
+            i0 = np.searchsorted(nodes, node, side="left")
+            i1 = np.searchsorted(nodes, node, side="right")
+            found = i1 > i0
+            if np.any(found):
+                entries = np.concatenate(
+                    [order[j0:j1] for j0, j1 in zip(i0, i1)]
+                )
+                q = self._read_at(
+                    listpos + entries * nbytes + qoffset, self.realtype
+                )
+                # sum the values of entries for the same cell
+                count = i1 - i0
+                start = np.cumsum(count) - count
+                values[found] = np.add.reduceat(q, start[found])
+        else:
+            raise ValueError(f"invalid imeth value - {imeth}")
+        return values
+
+    def _get_node_index(self, idx):
+        """
+        Get the node index of a list-style record.  The node numbers are
+        read from the file the first time and are cached.
+
+        Returns
+        ----------
+        nodes : numpy array
+            Sorted node numbers of the entries in the list.
+        order : numpy array
+            Entry number of each value in nodes.
+        listpos : int
+            Byte position of the first list entry.
+        nbytes : int
+            Number of bytes of each list entry.
+        qoffset : int
+            Byte offset of q in a list entry.
+
+        """
+        if idx in self._nodeindex:
+            return self._nodeindex[idx]
+        header = self.recordarray[idx]
+        imeth = header["imeth"]
+        self.file.seek(int(self.iposarray[idx]), 0)
+        if imeth == 2:
+            nauxp1 = 1
+        else:
+            nauxp1 = binaryread(self.file, np.int32)[0]
+            self.file.seek((nauxp1 - 1) * 16, 1)
+        nlist = binaryread(self.file, np.int32)[0]
+        listpos = self.file.tell()
+        qoffset = 8 if imeth == 6 else 4
+        nbytes = qoffset + nauxp1 * self.realtype(1).nbytes
+        dtype = np.dtype(
+            {"names": ["node"], "formats": [np.int32], "itemsize": nbytes}
+        )
+        nodes = binaryread(self.file, dtype, shape=(nlist,))["node"]
+        order = np.argsort(nodes, kind="stable").astype(np.int64)
+        index = (nodes[order], order, listpos, nbytes, qoffset)
+        self._nodeindex[idx] = index
+        return index
+
+    def _read_at(self, positions, dtype):
+        """
+        Read single values at byte positions in the file.  The values are
+        read with one read if the positions are close together and one at a
+        time otherwise.
+
+        """
+        positions = np.asarray(positions, dtype=np.int64)
+        dtype = np.dtype(dtype)
+        if positions.size == 0:
+            return np.empty(0, dtype=dtype)
+        p0 = int(positions.min())
+        nbytes = int(positions.max()) - p0 + dtype.itemsize
+        if nbytes <= max(2 ** 16, 16 * positions.size * dtype.itemsize):
+            self.file.seek(p0, 0)
+            buffer = self.file.read(nbytes)
+            pos = (positions - p0)[:, np.newaxis] + np.arange(dtype.itemsize)
+            data = np.frombuffer(buffer, dtype=np.uint8)[pos]
+            return data.view(dtype)[:, 0]
+        values = np.empty(positions.shape, dtype=dtype)
+        for i, ipos in enumerate(positions):
+            self.file.seek(int(ipos), 0)
+            values[i] = np.frombuffer(self.file.read(dtype.itemsize), dtype)[0]
+        return values
+
     def _build_kijlist(self, idx):
         if isinstance(idx, list):
             kijlist = idx
@@ -1529,6 +2696,20 @@ class CellBudgetFile:
         Examples
         --------
 
+        """
+        if self.cache is not None:
+            key = (int(idx), bool(full3D))
+            record = self.cache.get(key)
+            if record is None:
+                record = self._read_record(idx, full3D)
+                self.cache.put(key, record)
+            return self.cache.copy(record)
+        return self._read_record(idx, full3D)
+
+    def _read_record(self, idx, full3D=False):
+        """
+        Read a single data record from the budget file.  See get_record().
+
         """
         # idx must be an ndarray, so if it comes in as an integer then convert
         if np.isscalar(idx):
@@ -1831,6 +3012,23 @@ class HeadUFile(BinaryLayerFile):
         'auto', 'single' or 'double'.  Default is 'auto'.
     verbose : bool
         Write information to the screen.  Default is False.
+    mmap : bool
+        Map the file into memory using numpy.memmap instead of reading
+        each record with seek and read calls.  get_data(mflay=...) and
+        get_alldata(nodata=None) return read-only views into the mapped
+        file.  Default is False.
+    index_file : bool or str
+        Sidecar index file used to avoid scanning the file headers each time
+        the file is opened.  If True, the index file is named filename with
+        a ".fpidx" extension appended.  The index file is written after the
+        first scan and is rebuilt if the size or modification time of the
+        file changes.  Default is False.
+    cache_size : int
+        Maximum number of bytes of records kept in a least recently used
+        cache, so records that are read repeatedly are not read from the
+        file again.  Cache statistics are available from the cache
+        attribute.  The cache is not used if mmap is True.  Default is 0
+        (no cache).
 
     Attributes
     ----------
@@ -1873,7 +3071,15 @@ class HeadUFile(BinaryLayerFile):
     """
 
     def __init__(
-        self, filename, text="headu", precision="auto", verbose=False, **kwargs
+        self,
+        filename,
+        text="headu",
+        precision="auto",
+        verbose=False,
+        mmap=False,
+        index_file=False,
+        cache_size=0,
+        **kwargs,
     ):
         """
         Class constructor
@@ -1888,7 +3094,15 @@ class HeadUFile(BinaryLayerFile):
         self.header_dtype = BinaryHeader.set_dtype(
             bintype="Head", precision=precision
         )
-        super().__init__(filename, precision, verbose, kwargs)
+        super().__init__(
+            filename,
+            precision,
+            verbose,
+            kwargs,
+            mmap=mmap,
+            index_file=index_file,
+            cache_size=cache_size,
+        )
         return
 
     def _get_data_array(self, totim=0.0):
@@ -1909,17 +3123,24 @@ class HeadUFile(BinaryLayerFile):
         # fill a list of 1d arrays with heads from binary file
         data = self.nlay * [None]
         for idx in keyindices:
-            ipos = self.iposarray[idx]
             ilay = self.recordarray["ilay"][idx]
-            nstrt = self.recordarray["ncol"][idx]
-            nend = self.recordarray["nrow"][idx]
-            npl = nend - nstrt + 1
             if self.verbose:
+                ipos = self.iposarray[idx]
                 print(f"Byte position in file: {ipos} for layer {ilay}")
-            self.file.seek(ipos, 0)
-            data[ilay - 1] = binaryread(self.file, self.realtype, shape=(npl,))
+            data[ilay - 1] = self._read_record(idx)
         return data
 
+    def _get_record_shape(self, header):
+        """
+        Return the shape of the data array that follows a header.  For
+        unstructured grids, nrow and ncol are the starting and ending node
+        numbers for the layer.
+
+        """
+        nstrt = header["ncol"]
+        nend = header["nrow"]
+        return (nend - nstrt + 1,)
+
     def get_databytes(self, header):
         """
 
@@ -1971,16 +3192,16 @@ class HeadUFile(BinaryLayerFile):
             nnode = idx - nodelay_cumsum[layer - 1]
 
             result = []
-            for i, time in enumerate(times):
-                data = self.get_data(totim=time)
-                result.append([time, data[layer - 1][nnode]])
+            for i, totim in enumerate(times):
+                data = self.get_data(totim=totim)
+                result.append([totim, data[layer - 1][nnode]])
 
         elif isinstance(idx, list):
 
             result = []
-            for i, time in enumerate(times):
-                data = self.get_data(totim=time)
-                row = [time]
+            for i, totim in enumerate(times):
+                data = self.get_data(totim=totim)
+                row = [totim]
 
                 for node in idx:
                     if isinstance(node, int):
@@ -0,0 +1,389 @@
+"""
+Module to write and read chunked, compressed array stores.  A store is a
+local directory with an array.json metadata file and one zlib compressed
+file for each chunk of the array, so slices of the array can be read
+without reading the chunks that are not part of the slice.  Binary head and
+budget files can be written to a store with HeadFile.to_chunked() and
+CellBudgetFile.to_chunked().
+
+"""
+import itertools
+import json
+import os
+import zlib
+
+import numpy as np
+
+_ARRAY_FILE = "array.json"
+_GROUP_FILE = "group.json"
+
+
+def _to_json(value):
+    """
+    Convert numpy values in metadata to types that can be written to json.
+
+    """
+    if isinstance(value, dict):
+        return {str(k): _to_json(v) for k, v in value.items()}
+    elif isinstance(value, (list, tuple, np.ndarray)):
+        return [_to_json(v) for v in value]
+    elif isinstance(value, bytes):
+        return value.decode().strip()
+    elif isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _chunk_name(chunk_idx):
+    return ".".join(str(i) for i in chunk_idx)
+
+
+def _default_chunks(shape, ntimes=10):
+    """
+    Get the default chunk shape for an array with shape for a single time.
+    Chunks contain ntimes times and, for three-dimensional arrays, a single
+    layer.
+
+    """
+    shape = tuple(max(1, n) for n in shape)
+    if len(shape) == 3:
+        shape = (1,) + shape[1:]
+    return (ntimes,) + shape
+
+
+class ChunkedArrayWriter:
+    """
+    Write an array to a chunked store one time (the first dimension) at a
+    time.  Only the times for one chunk along the first dimension are held
+    in memory.
+
+    Parameters
+    ----------
+    path : str
+        Directory of the store.  The directory is created if it does not
+        exist.
+    shape : tuple of ints
+        Shape of a single time of the array.
+    dtype : numpy dtype
+        Data type of the array.
+    chunks : tuple of ints
+        Shape of the chunks, including the time dimension.  If None, chunks
+        contain 10 times and a single layer. (Default is None.)
+    level : int
+        zlib compression level. (Default is 6.)
+    attrs : dict
+        Metadata stored with the array. (Default is None.)
+
+    """
+
+    def __init__(self, path, shape, dtype, chunks=None, level=6, attrs=None):
+        shape = tuple(int(n) for n in shape)
+        if chunks is None:
+            chunks = _default_chunks(shape)
+        chunks = tuple(int(n) for n in chunks)
+        if len(chunks) != len(shape) + 1:
+            raise ValueError(
+                f"chunks {chunks} do not match the array dimensions "
+                f"{('ntimes',) + shape}"
+            )
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.shape = shape
+        self.dtype = np.dtype(dtype)
+        self.chunks = chunks
+        self.level = level
+        self.attrs = {} if attrs is None else dict(attrs)
+        self.ntimes = 0
+        self._buffer = []
+        return
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def append(self, data):
+        """
+        Append the data for a time to the array.
+
+        Parameters
+        ----------
+        data : numpy array
+            Array with the shape of a single time of the array.  Masked
+            values are stored as np.nan.
+
+        """
+        if np.ma.isMaskedArray(data):
+            data = data.astype(self.dtype).filled(np.nan)
+        data = np.asarray(data, dtype=self.dtype)
+        if data.shape != self.shape:
+            raise ValueError(
+                f"data shape {data.shape} does not match the array shape "
+                f"{self.shape}"
+            )
+        self._buffer.append(data)
+        if len(self._buffer) == self.chunks[0]:
+            self._flush()
+        return
+
+    def _flush(self):
+        """
+        Write the buffered times to the chunk files.
+
+        """
+        if len(self._buffer) == 0:
+            return
+        block = np.stack(self._buffer)
+        it = self.ntimes // self.chunks[0]
+        nchunks = [
+            -(-n // c) for n, c in zip(block.shape[1:], self.chunks[1:])
+        ]
+        for chunk_idx in itertools.product(*[range(n) for n in nchunks]):
+            key = tuple(
+                slice(i * c, (i + 1) * c)
+                for i, c in zip(chunk_idx, self.chunks[1:])
+            )
+            chunk = np.ascontiguousarray(block[(slice(None),) + key])
+            fpth = os.path.join(self.path, _chunk_name((it,) + chunk_idx))
+            with open(fpth, "wb") as f:
+                f.write(zlib.compress(chunk.tobytes(), self.level))
+        self.ntimes += block.shape[0]
+        self._buffer = []
+        return
+
+    def close(self):
+        """
+        Write the remaining times and the metadata file.
+
+        """
+        self._flush()
+        metadata = {
+            "shape": (self.ntimes,) + self.shape,
+            "chunks": self.chunks,
+            "dtype": self.dtype.str,
+            "compressor": "zlib",
+            "level": self.level,
+            "attrs": self.attrs,
+        }
+        with open(os.path.join(self.path, _ARRAY_FILE), "w") as f:
+            json.dump(_to_json(metadata), f, indent=1)
+        return
+
+
+class ChunkedArray:
+    """
+    Read an array from a chunked store.  Slicing the object only reads the
+    chunks that contain the requested values.
+
+    Parameters
+    ----------
+    path : str
+        Directory of the store.
+
+    Attributes
+    ----------
+    shape : tuple of ints
+        Shape of the array.  The first dimension is time.
+    chunks : tuple of ints
+        Shape of the chunks.
+    dtype : numpy dtype
+        Data type of the array.
+    attrs : dict
+        Metadata stored with the array, for example the simulation times
+        (totim) and time steps (kstpkper) of the first dimension.
+
+    Examples
+    --------
+
+    >>> import flopy
+    >>> hds = flopy.utils.HeadFile('model.hds')
+    >>> arr = hds.to_chunked('model_hds')
+    >>> arr[-1, 0]  # the first layer of the last time
+    >>> arr[:, 0, 10, 10]  # time series for a cell
+
+    """
+
+    def __init__(self, path):
+        fpth = os.path.join(path, _ARRAY_FILE)
+        if not os.path.isfile(fpth):
+            raise FileNotFoundError(f"{path} is not a chunked array store")
+        with open(fpth) as f:
+            metadata = json.load(f)
+        self.path = path
+        self.shape = tuple(metadata["shape"])
+        self.chunks = tuple(metadata["chunks"])
+        self.dtype = np.dtype(metadata["dtype"])
+        self.attrs = metadata["attrs"]
+        self.nchunks_read = 0
+        return
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __repr__(self):
+        return (
+            f"ChunkedArray(path={self.path!r}, shape={self.shape}, "
+            f"chunks={self.chunks}, dtype={self.dtype})"
+        )
+
+    def _normalize_key(self, key):
+        """
+        Convert a key to an array of indices for each dimension and a list
+        of the dimensions that are kept in the result.
+
+        """
+        if not isinstance(key, tuple):
+            key = (key,)
+        if any(k is Ellipsis for k in key):
+            i = [k is Ellipsis for k in key].index(True)
+            fill = (slice(None),) * (self.ndim - len(key) + 1)
+            key = key[:i] + fill + key[i + 1 :]
+        if len(key) > self.ndim:
+            raise IndexError(
+                f"too many indices for array with {self.ndim} dimensions"
+            )
+        key = key + (slice(None),) * (self.ndim - len(key))
+        indices = []
+        keep = []
+        for k, n in zip(key, self.shape):
+            if isinstance(k, slice):
+                indices.append(np.arange(n)[k])
+                keep.append(True)
+            elif np.ndim(k) == 0:
+                k = int(k)
+                if k < -n or k >= n:
+                    raise IndexError(f"index {k} is out of bounds for {n}")
+                indices.append(np.array([k % n]))
+                keep.append(False)
+            else:
+                k = np.asarray(k, dtype=int)
+                if np.any(k < -n) or np.any(k >= n):
+                    raise IndexError(f"index out of bounds for {n}")
+                indices.append(k % n)
+                keep.append(True)
+        return indices, keep
+
+    def _read_chunk(self, chunk_idx):
+        """
+        Read a chunk from the store.
+
+        """
+        shape = tuple(
+            min(c, n - i * c)
+            for i, c, n in zip(chunk_idx, self.chunks, self.shape)
+        )
+        fpth = os.path.join(self.path, _chunk_name(chunk_idx))
+        with open(fpth, "rb") as f:
+            data = zlib.decompress(f.read())
+        self.nchunks_read += 1
+        return np.frombuffer(data, dtype=self.dtype).reshape(shape)
+
+    def __getitem__(self, key):
+        indices, keep = self._normalize_key(key)
+        result = np.empty([len(idx) for idx in indices], dtype=self.dtype)
+
+        # position of the requested indices in each chunk
+        chunk_ids = [idx // c for idx, c in zip(indices, self.chunks)]
+        unique_ids = [np.unique(ids) for ids in chunk_ids]
+        for chunk_idx in itertools.product(*unique_ids):
+            dst = []
+            src = []
+            for dim, ichunk in enumerate(chunk_idx):
+                sel = np.where(chunk_ids[dim] == ichunk)[0]
+                dst.append(sel)
+                src.append(indices[dim][sel] - ichunk * self.chunks[dim])
+            chunk = self._read_chunk(chunk_idx)
+            result[np.ix_(*dst)] = chunk[np.ix_(*src)]
+
+        # drop the dimensions selected with an integer
+        return result.reshape([n for n, k in zip(result.shape, keep) if k])
+
+    def get_times(self):
+        """
+        Get a list of the simulation times (totim) of the first dimension
+        of the array.
+
+        """
+        return self.attrs.get("totim", [])
+
+    def get_kstpkper(self):
+        """
+        Get a list of the zero-based (kstp, kper) of the first dimension of
+        the array.
+
+        """
+        return [tuple(kk) for kk in self.attrs.get("kstpkper", [])]
+
+    def get_ts(self, idx):
+        """
+        Get a time series for one or more cells.
+
+        Parameters
+        ----------
+        idx : tuple of ints, or a list of a tuple of ints
+            Zero-based cell index (layer, row, column) or a list of cell
+            indices.
+
+        Returns
+        ----------
+        out : numpy array
+            Array has size (ntimes, ncells + 1).  The first column in the
+            data array will contain time (totim).
+
+        """
+        if isinstance(idx, tuple):
+            idx = [idx]
+        result = np.empty((self.shape[0], len(idx) + 1))
+        result[:, 0] = self.get_times()
+        for istat, cell in enumerate(idx):
+            result[:, istat + 1] = self[(slice(None),) + tuple(cell)]
+        return result
+
+
+def write_chunked_group(path, arrays):
+    """
+    Write the group file that lists the arrays in a directory.
+
+    Parameters
+    ----------
+    path : str
+        Directory of the group.
+    arrays : dict
+        Dictionary of array names and subdirectories.
+
+    """
+    with open(os.path.join(path, _GROUP_FILE), "w") as f:
+        json.dump({"arrays": arrays}, f, indent=1)
+    return
+
+
+def open_chunked(path):
+    """
+    Open a chunked array store written by to_chunked().
+
+    Parameters
+    ----------
+    path : str
+        Directory of the store.
+
+    Returns
+    -------
+    out : ChunkedArray or dict
+        A ChunkedArray for a single array, or a dictionary of ChunkedArray
+        objects keyed by record name for a budget file store.
+
+    """
+    fpth = os.path.join(path, _GROUP_FILE)
+    if os.path.isfile(fpth):
+        with open(fpth) as f:
+            arrays = json.load(f)["arrays"]
+        return {
+            name: ChunkedArray(os.path.join(path, subdir))
+            for name, subdir in arrays.items()
+        }
+    return ChunkedArray(path)
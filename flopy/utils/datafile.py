@@ -3,9 +3,12 @@ Module to read MODFLOW output files.  The module contains shared
 abstract classes that should not be directly accessed.
 
 """
+import os
+from collections import OrderedDict
 import numpy as np
 import flopy.utils
 from ..discretization.structuredgrid import StructuredGrid
+from ..utils.chunkedfile import ChunkedArray, ChunkedArrayWriter
 
 
 class Header:
@@ -145,6 +148,183 @@ class Header:
             return self.header[0]
 
 
+def _running_stats(records, nodata=None, threshold=None):
+    """
+    Reduce a sequence of equally shaped arrays to cell-by-cell statistics
+    while holding only one array from the sequence in memory.
+
+    Parameters
+    ----------
+    records : iterable of numpy arrays
+        Arrays to reduce.  Masked values, nan values and values equal to
+        nodata are excluded from the statistics.
+    nodata : float
+        The nodata value in the arrays. (Default is None.)
+    threshold : float
+        If not None, the number of values greater than threshold is
+        counted for each cell. (Default is None.)
+
+    Returns
+    -------
+    stats : dict
+        Dictionary with 'min', 'max', 'mean' and 'count' arrays, and an
+        'exceedance' array if threshold is not None.  Statistics for cells
+        without any valid values are set to np.nan.  None is returned if
+        records is empty.
+
+    """
+    vmin = vmax = total = count = exceed = None
+    for data in records:
+        valid = ~np.ma.getmaskarray(data)
+        data = np.ma.getdata(data)
+        if nodata is not None:
+            valid &= data != nodata
+        if np.issubdtype(data.dtype, np.floating):
+            valid &= ~np.isnan(data)
+        if vmin is None:
+            vmin = np.full(data.shape, np.inf)
+            vmax = np.full(data.shape, -np.inf)
+            total = np.zeros(data.shape, dtype=np.float64)
+            count = np.zeros(data.shape, dtype=int)
+            if threshold is not None:
+                exceed = np.zeros(data.shape, dtype=int)
+        np.minimum(vmin, data, out=vmin, where=valid)
+        np.maximum(vmax, data, out=vmax, where=valid)
+        np.add(total, data, out=total, where=valid)
+        count += valid
+        if threshold is not None:
+            exceed += valid & (data > threshold)
+    if vmin is None:
+        return None
+
+    empty = count == 0
+    vmin[empty] = np.nan
+    vmax[empty] = np.nan
+    mean = np.full(total.shape, np.nan)
+    np.divide(total, count, out=mean, where=~empty)
+    stats = {"min": vmin, "max": vmax, "mean": mean, "count": count}
+    if threshold is not None:
+        stats["exceedance"] = exceed
+    return stats
+
+
+class RecordCache:
+    """
+    Least recently used cache of records read from an output file.  The
+    cache is bounded by the number of bytes of the cached records.
+
+    Parameters
+    ----------
+    maxbytes : int
+        Maximum number of bytes of the cached records.
+
+    Attributes
+    ----------
+    hits : int
+        Number of records that were returned from the cache.
+    misses : int
+        Number of records that were not in the cache.
+    nbytes : int
+        Number of bytes of the cached records.
+
+    """
+
+    def __init__(self, maxbytes):
+        self.maxbytes = int(maxbytes)
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._records = OrderedDict()
+
+    def __len__(self):
+        return len(self._records)
+
+    def __contains__(self, key):
+        return key in self._records
+
+    @staticmethod
+    def _get_nbytes(record):
+        if isinstance(record, (list, tuple)):
+            return sum(RecordCache._get_nbytes(r) for r in record)
+        nbytes = record.nbytes
+        if np.ma.isMaskedArray(record):
+            nbytes += np.ma.getmaskarray(record).nbytes
+        return nbytes
+
+    @staticmethod
+    def copy(record):
+        """
+        Return a copy of a record so the cached record cannot be changed.
+
+        """
+        if isinstance(record, list):
+            return [r.copy() for r in record]
+        return record.copy()
+
+    def get(self, key):
+        """
+        Get a record from the cache.  None is returned if the record is not
+        in the cache.
+
+        """
+        record = self._records.get(key)
+        if record is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._records.move_to_end(key)
+        return record
+
+    def put(self, key, record):
+        """
+        Add a record to the cache.  The least recently used records are
+        removed until the cached records fit in maxbytes.  Records that are
+        larger than maxbytes are not cached.
+
+        """
+        nbytes = self._get_nbytes(record)
+        if nbytes > self.maxbytes:
+            return
+        if key in self._records:
+            self.nbytes -= self._get_nbytes(self._records.pop(key))
+        self._records[key] = record
+        self.nbytes += nbytes
+        while self.nbytes > self.maxbytes:
+            _, removed = self._records.popitem(last=False)
+            self.nbytes -= self._get_nbytes(removed)
+        return
+
+    def clear(self):
+        """
+        Remove all of the records from the cache and reset the counters.
+
+        """
+        self._records.clear()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        return
+
+    def info(self):
+        """
+        Get the cache statistics.
+
+        Returns
+        -------
+        info : dict
+            Dictionary with the number of hits and misses, the number of
+            cached records, and the current and maximum number of bytes.
+
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "nrecords": len(self._records),
+            "nbytes": self.nbytes,
+            "maxbytes": self.maxbytes,
+        }
+
+
 class LayerFile:
     """
     The LayerFile class is the abstract base class from which specific derived
@@ -448,6 +628,14 @@ class LayerFile:
             data[ilay - 1] = self._read_data(shp)
         return data
 
+    def _get_layer_array(self, totim, mflay):
+        """
+        Get the two dimensional data array for a single zero-based layer
+        for the specified totim value.
+
+        """
+        return self._get_data_array(totim)[mflay, :, :]
+
     def get_times(self):
         """
         Get a list of unique times in the file
@@ -529,11 +717,10 @@ class LayerFile:
         else:
             totim1 = self.times[-1]
 
-        data = self._get_data_array(totim1)
         if mflay is None:
-            return data
+            return self._get_data_array(totim1)
         else:
-            return data[mflay, :, :]
+            return self._get_layer_array(totim1, mflay)
 
     def get_alldata(self, mflay=None, nodata=-9999):
         """
@@ -573,6 +760,132 @@ class LayerFile:
         rv[rv == nodata] = np.nan
         return rv
 
+    def iter_records(self, mflay=None):
+        """
+        Iterate over the data in the file one time step at a time.  Only
+        the data for the current time step is held in memory.
+
+        Parameters
+        ----------
+        mflay : integer
+           MODFLOW zero-based layer number to return.  If None, then all
+           all layers will be included. (Default is None.)
+
+        Yields
+        ------
+        kstpkper : tuple of ints
+            Zero-based time step and stress period.
+        totim : float
+            The simulation time.
+        data : numpy array
+            Array has size (nlay, nrow, ncol) if mflay is None or it has size
+            (nrow, ncol) if mlay is specified.
+
+        Examples
+        --------
+        >>> import flopy
+        >>> hdobj = flopy.utils.HeadFile('model.hds')
+        >>> for kstpkper, totim, head in hdobj.iter_records():
+        ...     print(totim, head.max())
+
+        """
+        for itim, totim in enumerate(list(self.times)):
+            kstp, kper = self.kstpkper[itim]
+            data = self.get_data(totim=totim, mflay=mflay)
+            yield (kstp - 1, kper - 1), totim, data
+
+    def get_stats(self, mflay=None, nodata=None, threshold=None):
+        """
+        Get cell-by-cell statistics over all of the times in the file.
+        The file is read one time step at a time so memory use does not
+        depend on the number of times in the file.
+
+        Parameters
+        ----------
+        mflay : integer
+           MODFLOW zero-based layer number to return.  If None, then all
+           all layers will be included. (Default is None.)
+        nodata : float
+           The nodata value in the data array.  Array values that have the
+           nodata value are excluded from the statistics. (Default is None.)
+        threshold : float
+           If not None, the number of times the value in each cell is
+           greater than threshold is also returned. (Default is None.)
+
+        Returns
+        -------
+        stats : dict
+            Dictionary with 'min', 'max', 'mean' and 'count' (number of
+            times with valid values) arrays and, if threshold is not None,
+            an 'exceedance' array.  Arrays have size (nlay, nrow, ncol) if
+            mflay is None or size (nrow, ncol) if mflay is specified.
+
+        Examples
+        --------
+        >>> import flopy
+        >>> hdobj = flopy.utils.HeadFile('model.hds')
+        >>> stats = hdobj.get_stats(nodata=1e30, threshold=10.)
+        >>> stats['exceedance'].max()
+
+        """
+        return _running_stats(
+            (data for _, _, data in self.iter_records(mflay=mflay)),
+            nodata=nodata,
+            threshold=threshold,
+        )
+
+    def to_chunked(self, path, chunks=None, level=6):
+        """
+        Write the data in the file to a chunked, compressed array store in
+        a local directory.  The file is read one time step at a time, and
+        only the time steps for one chunk are held in memory.
+
+        Parameters
+        ----------
+        path : str
+            Directory of the store.
+        chunks : tuple of ints
+            Shape of the chunks (ntimes, nlay, nrow, ncol).  If None, chunks
+            contain 10 times and a single layer. (Default is None.)
+        level : int
+            zlib compression level. (Default is 6.)
+
+        Returns
+        -------
+        out : ChunkedArray
+            Array of size (ntimes, nlay, nrow, ncol) read from the store.
+
+        Examples
+        --------
+        >>> import flopy
+        >>> hdobj = flopy.utils.HeadFile('model.hds')
+        >>> arr = hdobj.to_chunked('model_hds')
+        >>> head = arr[:, 0, 10, 10]
+
+        """
+        attrs = {
+            "filename": os.path.basename(self.filename),
+            "text": getattr(self, "text", b""),
+            "totim": list(self.times),
+            "kstpkper": self.get_kstpkper(),
+        }
+        writer = None
+        for _, _, data in self.iter_records():
+            if writer is None:
+                writer = ChunkedArrayWriter(
+                    path,
+                    data.shape,
+                    data.dtype,
+                    chunks=chunks,
+                    level=level,
+                    attrs=attrs,
+                )
+            writer.append(data)
+        if writer is None:
+            raise ValueError(f"there is no data in {self.filename}")
+        writer.close()
+        return ChunkedArray(path)
+
     def _read_data(self, shp):
         """
         Read data from file
@@ -0,0 +1,566 @@
+"""
+Module to read binary output files from an ensemble of model runs, for
+example the realizations of a Monte-Carlo analysis.  The files of all of the
+ensemble members must have the same structure as the first file, which is
+the only file that is indexed.  Values are read from the other members at
+the byte positions determined from the first file using a thread or process
+pool.
+
+"""
+import glob
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
+
+import numpy as np
+
+from .binaryfile import CellBudgetFile, HeadFile, UcnFile
+
+
+def _natural_sort_key(filename):
+    """
+    Sort key that orders numbers in file names by value, so 'real2' is
+    sorted before 'real10'.
+
+    """
+    return [
+        int(part) if part.isdigit() else part
+        for part in re.split(r"(\d+)", filename)
+    ]
+
+
+def _check_member(filename, check):
+    """
+    Make sure an ensemble member has the same size and the same record
+    headers as the indexed file.  check is a tuple with the size of the
+    indexed file, the byte positions of its record headers and the bytes
+    of the record headers.
+
+    """
+    totalbytes, header_index, headers = check
+    same = os.path.getsize(filename) == totalbytes
+    if same:
+        data = np.memmap(filename, dtype=np.uint8, mode="r")
+        try:
+            same = np.array_equal(data[header_index], headers)
+        finally:
+            del data
+    if not same:
+        raise ValueError(
+            f"{filename} does not have the same structure as the first "
+            "file in the ensemble"
+        )
+    return
+
+
+def _read_values(filename, check, offsets, dtype):
+    """
+    Read single values at byte offsets from an ensemble member.  Offsets
+    that are less than zero are returned as np.nan.
+
+    """
+    _check_member(filename, check)
+    dtype = np.dtype(dtype)
+    valid = offsets >= 0
+    result = np.full(offsets.shape, np.nan, dtype=dtype)
+    data = np.memmap(filename, dtype=np.uint8, mode="r")
+    try:
+        pos = offsets[valid][:, np.newaxis] + np.arange(dtype.itemsize)
+        result[valid] = np.asarray(data[pos]).view(dtype)[:, 0]
+    finally:
+        del data
+    return result
+
+
+def _read_arrays(filename, check, positions, count, dtype):
+    """
+    Read count values starting at each byte position from an ensemble
+    member.
+
+    """
+    _check_member(filename, check)
+    result = np.empty((len(positions), count), dtype=dtype)
+    with open(filename, "rb") as f:
+        for idx, ipos in enumerate(positions):
+            f.seek(ipos, 0)
+            result[idx] = np.fromfile(f, dtype=dtype, count=count)
+    return result
+
+
+def _match_times(times, totim, rtol=1e-6):
+    """
+    Get the index of the time in times that is closest to each value of
+    totim, or -1 if the closest time is not within the relative tolerance
+    rtol.  totim values that are computed, for example from time step
+    lengths, or that are rounded to the precision of the file are matched
+    to the times in the file.
+
+    """
+    times = np.asarray(times, dtype=np.float64)
+    totim = np.atleast_1d(np.asarray(totim, dtype=np.float64))
+    order = np.argsort(times, kind="stable")
+    sorted_times = times[order]
+    right = np.clip(np.searchsorted(sorted_times, totim), 0, len(times) - 1)
+    left = np.clip(right - 1, 0, len(times) - 1)
+    closest = np.where(
+        np.abs(sorted_times[left] - totim)
+        <= np.abs(sorted_times[right] - totim),
+        left,
+        right,
+    )
+    itime = order[closest]
+    return np.where(
+        np.isclose(times[itime], totim, rtol=rtol, atol=0.0), itime, -1
+    )
+
+
+def _read_budget_ts(filename, idx, text, kwargs):
+    """
+    Get a budget time series from an ensemble member that is indexed
+    separately.  Used for list-style budget records.
+
+    """
+    with CellBudgetFile(filename, **kwargs) as cbb:
+        return cbb.get_ts(idx, text=text)[:, 1:]
+
+
+class _EnsembleFile:
+    """
+    The _EnsembleFile class is the base class for the ensemble readers.
+    This class should not be instantiated directly.
+
+    """
+
+    _reader = None
+
+    def __init__(self, filenames, workers=None, executor="thread", **kwargs):
+        if isinstance(filenames, (str, os.PathLike)):
+            filenames = sorted(
+                glob.glob(str(filenames)), key=_natural_sort_key
+            )
+        else:
+            filenames = [str(f) for f in filenames]
+        if len(filenames) == 0:
+            raise ValueError("no files were found for the ensemble")
+        if executor not in ("thread", "process"):
+            raise ValueError(
+                f"executor must be 'thread' or 'process', not '{executor}'"
+            )
+        self.filenames = filenames
+        self.nreal = len(filenames)
+        self.workers = workers
+        self.executor = executor
+        self._kwargs = kwargs
+
+        # index the first file, the index is used for all of the files
+        self.reference = self._reader(filenames[0], **kwargs)
+        self.reference.close()
+        self.nlay = self.reference.nlay
+        self.nrow = self.reference.nrow
+        self.ncol = self.reference.ncol
+        self.totalbytes = os.path.getsize(filenames[0])
+
+        # the record headers of the other files are compared to the record
+        # headers of the first file before values are read
+        starts, ends = self._get_header_spans()
+        header_index = np.concatenate(
+            [np.arange(start, end) for start, end in zip(starts, ends)]
+            + [np.empty(0, dtype=np.int64)]
+        )
+        data = np.memmap(filenames[0], dtype=np.uint8, mode="r")
+        try:
+            headers = np.array(data[header_index])
+        finally:
+            del data
+        self._check = (self.totalbytes, header_index, headers)
+        return
+
+    def _get_header_spans(self):
+        """
+        Get the start and end byte positions of the record headers in the
+        indexed file.
+
+        """
+        ipos = np.asarray(self.reference.iposarray, dtype=np.int64)
+        return ipos - self.reference.header_dtype.itemsize, ipos
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _map(self, func, *args):
+        """
+        Call func for each ensemble member and stack the results.  The
+        member file name is the first argument passed to func and args are
+        passed unchanged to every call.
+
+        """
+        iterables = [self.filenames] + [repeat(arg) for arg in args]
+        if self.workers == 1 or self.nreal == 1:
+            results = list(map(func, *iterables))
+        else:
+            if self.executor == "process":
+                pool = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                pool = ThreadPoolExecutor(max_workers=self.workers)
+            with pool:
+                results = list(pool.map(func, *iterables))
+        return np.stack(results)
+
+    def get_times(self):
+        """
+        Get a list of unique times in the ensemble files
+
+        Returns
+        ----------
+        out : list of floats
+            List contains unique simulation times (totim) in the files.
+
+        """
+        return self.reference.get_times()
+
+    def get_kstpkper(self):
+        """
+        Get a list of unique stress periods and time steps in the ensemble
+        files
+
+        Returns
+        ----------
+        out : list of (kstp, kper) tuples
+            List of unique kstp, kper combinations in the files.  kstp and
+            kper values are zero-based.
+
+        """
+        return self.reference.get_kstpkper()
+
+    def close(self):
+        """
+        Close the file handle of the indexed file.
+
+        """
+        self.reference.close()
+        return
+
+
+class EnsembleHeadFile(_EnsembleFile):
+    """
+    EnsembleHeadFile Class.
+
+    Parameters
+    ----------
+    filenames : list of str, or str
+        List of head file names, or a glob pattern (for example
+        'realization_*/model.hds') that is expanded and sorted in natural
+        order, so 'real2' comes before 'real10'.  All of the files must have
+        the same structure as the first file.
+    workers : int
+        Maximum number of workers used to read the files.  If None, the
+        default number of workers of the executor is used.  If 1, the files
+        are read one after the other.  (Default is None.)
+    executor : str
+        'thread' to read the files with a thread pool or 'process' to read
+        them with a process pool.  (Default is 'thread'.)
+    **kwargs : dict
+        Keyword arguments passed to HeadFile when the first file is indexed
+        (text, precision, verbose, ...).
+
+    Notes
+    -----
+    Only the first file is indexed.  The other files are read at the byte
+    positions of the first file, so a file that has a different size or
+    different record headers (kstp, kper, times, text, shape) than the
+    first file raises a ValueError.
+
+    Examples
+    --------
+
+    >>> import flopy
+    >>> ens = flopy.utils.EnsembleHeadFile('real*/model.hds', workers=8)
+    >>> ts = ens.get_ts([(0, 10, 10), (1, 5, 5)])
+    >>> ts.shape
+    (nreal, ntimes, 2)
+
+    """
+
+    _reader = HeadFile
+
+    def _get_positions(self, totim, ilay):
+        """
+        Get the byte position of the data of each record for totim and
+        ilay, or -1 if there is no record.  totim is matched to the times
+        in the file with a relative tolerance.
+
+        """
+        recordarray = self.reference.recordarray
+        recpos = {
+            (t, k): ipos
+            for t, k, ipos in zip(
+                recordarray["totim"].tolist(),
+                recordarray["ilay"].tolist(),
+                self.reference.iposarray.tolist(),
+            )
+        }
+        times = np.array(self.get_times(), dtype=recordarray["totim"].dtype)
+        return np.array(
+            [
+                [
+                    recpos.get((times[itime].item(), k), -1)
+                    if itime >= 0
+                    else -1
+                    for k in np.atleast_1d(ilay)
+                ]
+                for itime in _match_times(times, totim)
+            ],
+            dtype=np.int64,
+        )
+
+    def _get_totim(self, kstpkper=None, totim=None, idx=None):
+        """
+        Get the simulation time for kstpkper, totim, or idx.  The last time
+        is returned if all are None.
+
+        """
+        if kstpkper is not None:
+            kk = self.get_kstpkper()
+            if tuple(kstpkper) not in kk:
+                raise Exception(
+                    f"get_data() error: kstpkper not found:{kstpkper}"
+                )
+            return self.reference.times[kk.index(tuple(kstpkper))]
+        elif totim is not None:
+            return totim
+        elif idx is not None:
+            return self.reference.recordarray["totim"][idx]
+        return self.reference.times[-1]
+
+    def get_data(self, kstpkper=None, idx=None, totim=None, mflay=None):
+        """
+        Get data for a time step from all of the ensemble files.
+
+        Parameters
+        ----------
+        kstpkper : tuple of ints
+            A tuple containing the time step and stress period (kstp, kper).
+            These are zero-based kstp and kper values.
+        idx : int
+            The zero-based record number.  The first record is record 0.
+        totim : float
+            The simulation time.
+        mflay : integer
+           MODFLOW zero-based layer number to return.  If None, then all
+           all layers will be included. (Default is None.)
+
+        Returns
+        ----------
+        data : numpy array
+            Array has size (nreal, nlay, nrow, ncol) if mflay is None or it
+            has size (nreal, nrow, ncol) if mlay is specified.
+
+        Notes
+        -----
+        if both kstpkper and totim are None, will return the last entry
+
+        """
+        totim = self._get_totim(kstpkper=kstpkper, totim=totim, idx=idx)
+        if mflay is None:
+            ilay = np.arange(1, self.nlay + 1)
+        else:
+            ilay = np.array([mflay + 1])
+        positions = self._get_positions(totim, ilay)[0]
+        if np.any(positions < 0):
+            raise Exception(f"get_data() error: totim not found:{totim}")
+        data = self._map(
+            _read_arrays,
+            self._check,
+            positions,
+            self.nrow * self.ncol,
+            self.reference.realtype,
+        )
+        data = data.reshape(self.nreal, len(ilay), self.nrow, self.ncol)
+        if mflay is not None:
+            data = data[:, 0]
+        return data
+
+    def get_ts(self, idx, totim=None, kstpkper=None):
+        """
+        Get a time series for one or more cells from all of the ensemble
+        files.
+
+        Parameters
+        ----------
+        idx : tuple of ints, or a list of a tuple of ints
+            idx can be (layer, row, column) or it can be a list in the form
+            [(layer, row, column), (layer, row, column), ...].  The layer,
+            row, and column values must be zero based.
+        totim : list of floats
+            Simulation times to return.  If totim and kstpkper are None, all
+            of the times are returned. (Default is None.)
+        kstpkper : list of tuples of ints
+            Zero-based time steps and stress periods to return.
+            (Default is None.)
+
+        Returns
+        ----------
+        out : numpy array
+            Array has size (nreal, ntimes, ncells).  Times without data for
+            a cell are set to np.nan.
+
+        """
+        kijlist = self.reference._build_kijlist(idx)
+        if kstpkper is not None:
+            times = [self._get_totim(kstpkper=kk) for kk in kstpkper]
+        elif totim is not None:
+            times = list(np.atleast_1d(totim))
+        else:
+            times = self.get_times()
+        kij = np.array(kijlist, dtype=np.int64)
+        positions = self._get_positions(times, np.unique(kij[:, 0]) + 1)
+        ilay = np.searchsorted(np.unique(kij[:, 0]), kij[:, 0])
+        itemsize = np.dtype(self.reference.realtype).itemsize
+        offsets = positions[:, ilay]
+        offsets = np.where(
+            offsets < 0,
+            -1,
+            offsets + (kij[:, 1] * self.ncol + kij[:, 2]) * itemsize,
+        )
+        return self._map(
+            _read_values, self._check, offsets, self.reference.realtype
+        )
+
+
+class EnsembleUcnFile(EnsembleHeadFile):
+    """
+    EnsembleUcnFile Class.
+
+    Parameters
+    ----------
+    filenames : list of str, or str
+        List of concentration file names, or a glob pattern that is expanded
+        and sorted in natural order.  All of the files must have the same
+        structure as the first file.
+    workers : int
+        Maximum number of workers used to read the files.  If None, the
+        default number of workers of the executor is used.  If 1, the files
+        are read one after the other.  (Default is None.)
+    executor : str
+        'thread' to read the files with a thread pool or 'process' to read
+        them with a process pool.  (Default is 'thread'.)
+    **kwargs : dict
+        Keyword arguments passed to UcnFile when the first file is indexed.
+
+    Examples
+    --------
+
+    >>> import flopy
+    >>> ens = flopy.utils.EnsembleUcnFile('real*/MT3D001.UCN')
+    >>> conc = ens.get_data(totim=100.)
+
+    """
+
+    _reader = UcnFile
+
+
+class EnsembleCellBudgetFile(_EnsembleFile):
+    """
+    EnsembleCellBudgetFile Class.
+
+    Parameters
+    ----------
+    filenames : list of str, or str
+        List of cell budget file names, or a glob pattern that is expanded
+        and sorted in natural order.
+    workers : int
+        Maximum number of workers used to read the files.  If None, the
+        default number of workers of the executor is used.  If 1, the files
+        are read one after the other.  (Default is None.)
+    executor : str
+        'thread' to read the files with a thread pool or 'process' to read
+        them with a process pool.  (Default is 'thread'.)
+    **kwargs : dict
+        Keyword arguments passed to CellBudgetFile when a file is indexed
+        (precision, verbose, ...).
+
+    Notes
+    -----
+    Values in full three-dimensional budget records are read at the byte
+    positions of the first file.  The length of list-style records
+    can differ between ensemble members, so each member is indexed
+    separately for these records.
+
+    Examples
+    --------
+
+    >>> import flopy
+    >>> ens = flopy.utils.EnsembleCellBudgetFile('real*/model.cbc')
+    >>> ts = ens.get_ts((0, 10, 10), text='STORAGE')
+
+    """
+
+    _reader = CellBudgetFile
+
+    def _get_header_spans(self):
+        """
+        Get the start and end byte positions of the record headers in the
+        indexed file.
+
+        """
+        return (
+            np.asarray(self.reference.iposheader, dtype=np.int64),
+            np.asarray(self.reference.iposarray, dtype=np.int64),
+        )
+
+    def get_ts(self, idx, text):
+        """
+        Get a time series for one or more cells from all of the ensemble
+        files.
+
+        Parameters
+        ----------
+        idx : tuple of ints, or a list of a tuple of ints
+            idx can be (layer, row, column) or it can be a list in the form
+            [(layer, row, column), (layer, row, column), ...].  The layer,
+            row, and column values must be zero based.
+        text : str
+            The text identifier for the record.  Examples include
+            'RIVER LEAKAGE', 'STORAGE', 'FLOW RIGHT FACE', etc.
+
+        Returns
+        ----------
+        out : numpy array
+            Array has size (nreal, ntimes, ncells) with a value for each
+            time step in get_kstpkper().  Time steps without data for a
+            cell are set to np.nan.
+
+        """
+        cbb = self.reference
+        kijlist = cbb._build_kijlist(idx)
+        text16 = cbb._find_text(text)
+        recordarray = cbb.recordarray
+        select = np.where(recordarray["text"] == text16)[0]
+        if np.any(recordarray["imeth"][select] > 1):
+            return self._map(_read_budget_ts, idx, text, self._kwargs)
+
+        # use the first record for each time step, as get_ts() does
+        recpos = {}
+        for irec in select:
+            header = recordarray[irec]
+            kk = (header["kstp"] - 1, header["kper"] - 1)
+            if kk not in recpos:
+                recpos[kk] = irec
+        itemsize = np.dtype(cbb.realtype).itemsize
+        offsets = np.full(
+            (len(cbb.get_kstpkper()), len(kijlist)), -1, dtype=np.int64
+        )
+        for itim, kk in enumerate(cbb.get_kstpkper()):
+            irec = recpos.get(kk)
+            if irec is None:
+                continue
+            header = recordarray[irec]
+            nrow, ncol = header["nrow"], header["ncol"]
+            for istat, (k, i, j) in enumerate(kijlist):
+                cell = (k * nrow + i) * ncol + j
+                offsets[itim, istat] = cbb.iposarray[irec] + cell * itemsize
+        return self._map(_read_values, self._check, offsets, cbb.realtype)
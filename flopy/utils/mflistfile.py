@@ -5,11 +5,18 @@ recarrays, which can then be easily plotted.
 
 """
 
+import mmap
 import os
 import re
+import time
 import numpy as np
 import errno
 
+from ..utils.binaryfile import (
+    get_index_file_path,
+    read_index_file,
+    write_index_file,
+)
 from ..utils.utils_def import totim_to_datetime
 from ..utils.flopy_io import get_ts_sp
 from ..utils import import_optional_dependency
@@ -27,6 +34,12 @@ class ListBudget:
         the text string identifying the budget table. (default is None)
     timeunit : str
         the time unit to return in the recarray. (default is 'days')
+    index_file : bool or str
+        If True or a file name, the budgets read from the list file are
+        stored in a sidecar index file (the list file name with a ".fpidx"
+        extension appended if True).  The budgets are read from the index
+        file instead of the list file if the list file has not changed
+        since the index file was written. (default is False)
 
     Notes
     -----
@@ -42,11 +55,14 @@ class ListBudget:
 
     """
 
-    def __init__(self, file_name, budgetkey=None, timeunit="days"):
+    def __init__(
+        self, file_name, budgetkey=None, timeunit="days", index_file=False
+    ):
 
         # Set up file reading
         assert os.path.exists(file_name), f"file_name {file_name} not found"
         self.file_name = file_name
+        self.index_file = get_index_file_path(file_name, index_file)
         self.f = open(file_name, "r", encoding="ascii", errors="replace")
 
         self.tssp_lines = 0
@@ -91,6 +107,8 @@ class ListBudget:
         self._isvalid = False
         if len(self.idx_map) > 0:
             self._isvalid = True
+        self._fingerprint = self._get_fingerprint()
+        self._nreload = 0
 
         # Close the open file
         self.f.close()
@@ -608,159 +626,449 @@ class ListBudget:
 
         return get_reduced_pumping(self.f.name, structured)
 
-    def _build_index(self, maxentries):
-        self.idx_map = self._get_index(maxentries)
-        return
+    def refresh(self, threshold=None, callback=None):
+        """
+        Read the budgets that have been written to the list file since it
+        was read or last refreshed.  Reading resumes from the end of the
+        last complete budget, so only the new part of the file is read.
+        A budget is complete once its time summary has been written; a
+        partially written budget at the end of the file is read when it is
+        complete.  If the file was truncated or rewritten since it was
+        read, for example by a new model run, all of the budgets are read
+        again from the start of the file.
 
-    def _get_index(self, maxentries):
-        # --parse through the file looking for matches and parsing ts and sp
-        idxs = []
-        l_count = 1
-        while True:
-            seekpoint = self.f.tell()
-            line = self.f.readline()
-            if line == "":
-                break
-            if self.budgetkey in line:
-                for _ in range(self.tssp_lines):
-                    line = self.f.readline()
-                try:
-                    ts, sp = get_ts_sp(line)
-                except:
-                    print(
-                        "unable to cast ts,sp on line number",
-                        l_count,
-                        " line: ",
-                        line,
-                    )
-                    break
-                # print('info found for timestep stress period',ts,sp)
+        Parameters
+        ----------
+        threshold : float
+            Percent discrepancy threshold.  callback is called for each new
+            budget with an incremental or cumulative percent discrepancy
+            larger than threshold (in absolute value). (default is None)
+        callback : function
+            Function called as callback(inc, cum) with the incremental and
+            cumulative budget records of a new budget that exceeds
+            threshold. (default is None)
 
-                idxs.append([ts, sp, seekpoint])
+        Returns
+        -------
+        nbudgets : int
+            Number of new budgets, or the number of complete budgets if the
+            file was read again from the start.
 
-                if maxentries and len(idxs) >= maxentries:
-                    break
+        Examples
+        --------
+        >>> mf_list = MfListBudget('my_model.list')
+        >>> nnew = mf_list.refresh()
 
-        return idxs
+        """
+        size = os.path.getsize(self.file_name)
+        nhead = len(self._fingerprint[0])
+        if size < self._index_end or self._get_fingerprint(nhead) != (
+            self._fingerprint
+        ):
+            # the file was truncated or rewritten
+            return self._reload(threshold, callback)
+        if size <= self._index_end:
+            return 0
+        with open(self.file_name, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                budgets = list(
+                    self._read_budgets(
+                        mm, start=self._index_end, partial=False
+                    )
+                )
+            finally:
+                mm.close()
+        if len(budgets) < 1:
+            return 0
+
+        # replace a partially written budget
+        if self._partial:
+            self.idx_map = self.idx_map[:-1]
+            self.inc = self.inc[:-1]
+            self.cum = self.cum[:-1]
+            self._partial = False
+        i0 = len(self.idx_map)
+        self._append_budgets(budgets)
+        self._index_end = budgets[-1][-1]
+        self._isvalid = len(self.idx_map) > 0
+        self._fingerprint = self._get_fingerprint()
+        if self.index_file is not None:
+            self._write_index_file()
+        for i in range(i0, len(self.idx_map)):
+            self._check_discrepancy(i, threshold, callback)
+        return len(budgets)
+
+    def _reload(self, threshold=None, callback=None):
+        """
+        Read all of the budgets in the list file again, after the file was
+        truncated or rewritten.  Returns the number of complete budgets.
+
+        """
+        self.idx_map = []
+        self.entries = []
+        self.null_entries = []
+        if self._isvalid:
+            self.inc = self.inc[:0]
+            self.cum = self.cum[:0]
+        with open(
+            self.file_name, "r", encoding="ascii", errors="replace"
+        ) as self.f:
+            self._load()
+        self._isvalid = len(self.idx_map) > 0
+        self._fingerprint = self._get_fingerprint()
+        self._nreload += 1
+        nbudgets = len(self.idx_map) - int(self._partial)
+        for i in range(nbudgets):
+            self._check_discrepancy(i, threshold, callback)
+        return nbudgets
+
+    def _get_fingerprint(self, nhead=1024, nbytes=1024):
+        """
+        Get the first nhead bytes of the list file and the nbytes bytes
+        before the end of the last budget that was read.  These bytes change
+        if the file is rewritten, so refresh() can tell a file that was
+        rewritten from a file that was appended to.
 
-    def _seek_to_string(self, s):
         """
+        with open(self.file_name, "rb") as f:
+            head = f.read(nhead)
+            start = max(self._index_end - nbytes, 0)
+            f.seek(start)
+            tail = f.read(self._index_end - start)
+        return head, tail
+
+    def follow(
+        self, interval=1.0, timeout=None, threshold=None, callback=None
+    ):
+        """
+        Generator that yields each budget as it is written to the list file
+        by a running model.  The budgets that are already in the file are
+        yielded first.
+
         Parameters
         ----------
-        s : str
-            Seek through the file to the next occurrence of s.  Return the
-            seek location when found.
+        interval : float
+            Number of seconds to wait before checking the file for new
+            budgets. (default is 1.)
+        timeout : float
+            Stop if no new budgets are written for timeout seconds.  If
+            None, follow the file until the generator is closed.
+            (default is None)
+        threshold : float
+            Percent discrepancy threshold.  callback is called for each
+            budget with an incremental or cumulative percent discrepancy
+            larger than threshold (in absolute value). (default is None)
+        callback : function
+            Function called as callback(inc, cum) with the incremental and
+            cumulative budget records of a budget that exceeds threshold.
+            (default is None)
+
+        Yields
+        ------
+        inc : numpy record
+            Incremental budget record, including totim, time_step and
+            stress_period.
+        cum : numpy record
+            Cumulative budget record.
 
-        Returns
-        -------
-        seekpoint : int
-            Next location of the string
+        Examples
+        --------
+        >>> def warn(inc, cum):
+        ...     print('discrepancy', inc['totim'], inc['PERCENT_DISCREPANCY'])
+        >>> mf_list = MfListBudget('my_model.list')
+        >>> for inc, cum in mf_list.follow(timeout=600., threshold=1.,
+        ...                                callback=warn):
+        ...     print(inc['totim'], cum['PERCENT_DISCREPANCY'])
 
         """
+        ibud = 0
+        nreload = self._nreload
+        nbudgets = len(self.idx_map) - int(self._partial)
+        for i in range(nbudgets):
+            self._check_discrepancy(i, threshold, callback)
+        last = time.time()
         while True:
-            seekpoint = self.f.tell()
-            line = self.f.readline()
-            if line == "":
-                break
-            if s in line:
-                break
-        return seekpoint
-
-    def _set_entries(self):
-        if len(self.idx_map) < 1:
-            return None, None
-        if len(self.entries) > 0:
-            raise Exception(f"entries already set:{self.entries}")
-        if not self.idx_map:
-            raise Exception("must call build_index before call set_entries")
-        try:
-            incdict, cumdict = self._get_sp(
-                self.idx_map[0][0], self.idx_map[0][1], self.idx_map[0][2]
-            )
-        except:
-            raise Exception(
-                "unable to read budget information from first "
-                "entry in list file"
-            )
-        self.entries = incdict.keys()
-        null_entries = {}
-        incdict = {}
-        cumdict = {}
-        for entry in self.entries:
-            incdict[entry] = []
-            cumdict[entry] = []
-            null_entries[entry] = np.NaN
-        self.null_entries = [null_entries, null_entries]
-        return incdict, cumdict
+            if self.refresh(threshold, callback) > 0:
+                last = time.time()
+                stop = False
+            else:
+                stop = timeout is not None and time.time() - last >= timeout
+            if self._nreload != nreload:
+                # the file was rewritten, yield its budgets from the start
+                nreload = self._nreload
+                ibud = 0
+            nbudgets = len(self.idx_map) - int(self._partial)
+            while ibud < nbudgets:
+                yield self.inc[ibud], self.cum[ibud]
+                ibud += 1
+            if stop:
+                return
+            time.sleep(interval)
+
+    def _check_discrepancy(self, i, threshold, callback):
+        """
+        Call callback for budget i if its percent discrepancy is larger
+        than threshold.
+
+        """
+        if threshold is None or callback is None:
+            return
+        if "PERCENT_DISCREPANCY" not in self.entries:
+            return
+        inc, cum = self.inc[i], self.cum[i]
+        discrepancy = max(
+            abs(inc["PERCENT_DISCREPANCY"]), abs(cum["PERCENT_DISCREPANCY"])
+        )
+        if discrepancy > threshold:
+            callback(inc, cum)
+        return
 
     def _load(self, maxentries=None):
-        self._build_index(maxentries)
-        incdict, cumdict = self._set_entries()
-        if incdict is None and cumdict is None:
+        self._index_end = 0
+        self._partial = False
+        if self.index_file is not None and maxentries is None:
+            data = read_index_file(self.index_file, self.file_name)
+            if data is not None and self._set_from_index(data):
+                return
+
+        # read the budgets in a single pass through the file
+        if os.path.getsize(self.file_name) == 0:
+            return
+        mm = mmap.mmap(self.f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            budgets = list(self._read_budgets(mm, maxentries=maxentries))
+            if len(budgets) > 0:
+                # a budget that is still being written is read again by
+                # refresh()
+                seekpoint = budgets[-1][2]
+                self._partial = not self._is_complete(mm, seekpoint)
+                if self._partial:
+                    self._index_end = seekpoint
+                    if budgets[-1][3] is None:
+                        # the budget table has not been written yet
+                        budgets = budgets[:-1]
+                        self._partial = False
+                else:
+                    self._index_end = budgets[-1][-1]
+        finally:
+            mm.close()
+        if len(budgets) < 1:
             return
-        totim = []
-        for ts, sp, seekpoint in self.idx_map:
-            tinc, tcum = self._get_sp(ts, sp, seekpoint)
-            for entry in self.entries:
-                incdict[entry].append(tinc[entry])
-                cumdict[entry].append(tcum[entry])
 
-            # Get the time for this record
-            seekpoint = self._seek_to_string("TIME SUMMARY AT END")
-            tslen, sptim, tt = self._get_totim(ts, sp, seekpoint)
-            totim.append(tt)
+        self._append_budgets(budgets)
+
+        if self.index_file is not None and maxentries is None:
+            self._write_index_file()
+        return
+
+    def _append_budgets(self, budgets):
+        """
+        Append budgets read by _read_budgets() to the incremental and
+        cumulative budget recarrays.
 
-        # get kstp and kper
-        idx_array = np.array(self.idx_map)
+        """
+        if len(self.entries) == 0:
+            incdict = budgets[0][3]
+            if incdict is None:
+                raise Exception(
+                    "unable to read budget information from first "
+                    "entry in list file"
+                )
+            self.entries = list(incdict.keys())
+            null_entries = {entry: np.NaN for entry in self.entries}
+            self.null_entries = [null_entries, null_entries]
 
         # build dtype for recarray
         dtype_tups = [
-            ("totim", np.float32),
+            ("totim", np.float64),
             ("time_step", np.int32),
             ("stress_period", np.int32),
         ]
         for entry in self.entries:
-            dtype_tups.append((entry, np.float32))
+            dtype_tups.append((entry, np.float64))
         dtype = np.dtype(dtype_tups)
 
         # create recarray
-        nentries = len(incdict[entry])
-        self.inc = np.recarray(shape=(nentries,), dtype=dtype)
-        self.cum = np.recarray(shape=(nentries,), dtype=dtype)
+        nentries = len(budgets)
+        inc = np.recarray(shape=(nentries,), dtype=dtype)
+        cum = np.recarray(shape=(nentries,), dtype=dtype)
+
+        # fill each row of the recarray, including the totim, time_step,
+        # and stress_period columns (zero-based kstp,kper)
+        for i, (ts, sp, _, tinc, tcum, totim, _) in enumerate(budgets):
+            if tinc is None:
+                tinc, tcum = self.null_entries
+            inc[i] = (totim, ts - 1, sp - 1) + tuple(
+                tinc[entry] for entry in self.entries
+            )
+            cum[i] = (totim, ts - 1, sp - 1) + tuple(
+                tcum[entry] for entry in self.entries
+            )
 
-        # fill each column of the recarray
-        for entry in self.entries:
-            self.inc[entry] = incdict[entry]
-            self.cum[entry] = cumdict[entry]
+        self.idx_map += [
+            [ts, sp, seekpoint] for ts, sp, seekpoint, *_ in budgets
+        ]
+        if len(self.idx_map) > nentries:
+            inc = np.concatenate((self.inc, inc)).view(np.recarray)
+            cum = np.concatenate((self.cum, cum)).view(np.recarray)
+        self.inc = inc
+        self.cum = cum
+        return
+
+    def _write_index_file(self):
+        """
+        Write the budgets to the index file.
+
+        """
+        write_index_file(
+            self.index_file,
+            self.file_name,
+            budgetkey=np.array(self.budgetkey),
+            timeunit=np.array(self.timeunit),
+            idx_map=np.array(self.idx_map, dtype=np.int64).reshape(-1, 3),
+            indexend=self._index_end,
+            partial=self._partial,
+            inc=self.inc.view(np.ndarray),
+            cum=self.cum.view(np.ndarray),
+        )
+        return
+
+    def _set_from_index(self, data):
+        """
+        Set the budgets from the arrays read from the index file.  False is
+        returned if the index file was written for a different budget key or
+        time unit.
+
+        """
+        try:
+            if (
+                str(data["budgetkey"]) != self.budgetkey
+                or str(data["timeunit"]) != self.timeunit
+            ):
+                return False
+            self.idx_map = data["idx_map"].tolist()
+            self.inc = data["inc"].view(np.recarray)
+            self.cum = data["cum"].view(np.recarray)
+            self._index_end = int(data["indexend"])
+            self._partial = bool(data["partial"])
+        except KeyError:
+            return False
+        self.entries = list(self.inc.dtype.names[3:])
+        null_entries = {entry: np.NaN for entry in self.entries}
+        self.null_entries = [null_entries, null_entries]
+        return True
+
+    def _is_complete(self, mm, pos):
+        """
+        Determine if the budget at pos and its time summary have been
+        completely written to the file.  A budget without a time summary is
+        complete once the next budget has been written.
 
-        # file the totim, time_step, and stress_period columns for the
-        # incremental and cumulative recarrays (zero-based kstp,kper)
-        self.inc["totim"] = np.array(totim)[:]
-        self.inc["time_step"] = idx_array[:, 0] - 1
-        self.inc["stress_period"] = idx_array[:, 1] - 1
+        """
+        budgetkey = self.budgetkey.encode()
+        eol = mm.find(b"\n", pos)
+        if eol < 0:
+            return False
+        inext = mm.find(budgetkey, eol)
+        idx = mm.find(b"TIME SUMMARY AT END", eol)
+        if inext > -1 and (idx < 0 or inext < idx):
+            return True
+        if idx < 0:
+            return False
+
+        # the time summary line, two header lines, and the time step
+        # length, stress period time and total time lines (and the
+        # transport step length for SEAWAT)
+        nlines = 6
+        if isinstance(self, SwtListBudget):
+            nlines += 1
+        for _ in range(nlines):
+            idx = mm.find(b"\n", idx)
+            if idx < 0:
+                return False
+            idx += 1
+        return True
+
+    def _read_budgets(self, mm, start=0, maxentries=None, partial=True):
+        """
+        Read the budgets from a memory-mapped listing file in a single
+        forward pass.  The next budget table and time summary are found
+        with mmap.find, so only the lines of the budget tables and time
+        summaries are parsed.
 
-        self.cum["totim"] = np.array(totim)[:]
-        self.cum["time_step"] = idx_array[:, 0] - 1
-        self.cum["stress_period"] = idx_array[:, 1] - 1
+        Parameters
+        ----------
+        mm : mmap.mmap
+            Memory-mapped listing file.
+        start : int
+            Position in the file to start reading from. (default is 0)
+        maxentries : int
+            Maximum number of budgets to read. (default is None)
+        partial : bool
+            If False, stop at the first budget that has not been completely
+            written to the file. (default is True)
+
+        Yields
+        ------
+        budget : tuple
+            ts, sp, seekpoint of the budget key line, the incremental and
+            cumulative budget dictionaries (None if the budget could not be
+            read), totim, and the position after the budget.
 
+        """
+        budgetkey = self.budgetkey.encode()
+        nbudgets = 0
+        pos = start
+        while True:
+            pos = mm.find(budgetkey, pos)
+            if pos < 0:
+                break
+            seekpoint = mm.rfind(b"\n", 0, pos) + 1
+            if not partial and not self._is_complete(mm, seekpoint):
+                break
+            mm.seek(seekpoint)
+            line = mm.readline()
+            for _ in range(self.tssp_lines):
+                line = mm.readline()
+            line = line.decode("ascii", errors="replace")
+            try:
+                ts, sp = get_ts_sp(line)
+            except:
+                print(
+                    "unable to cast ts,sp on line at position",
+                    seekpoint,
+                    " line: ",
+                    line,
+                )
+                break
+
+            incdict, cumdict = self._get_sp(mm, ts, sp)
+            totim = self._get_totim(mm, ts, sp)
+            pos = mm.tell()
+            yield ts, sp, seekpoint, incdict, cumdict, totim, pos
+
+            nbudgets += 1
+            if maxentries and nbudgets >= maxentries:
+                break
         return
 
-    def _get_sp(self, ts, sp, seekpoint):
-        self.f.seek(seekpoint)
+    def _get_sp(self, mm, ts, sp):
         # --read to the start of the "in" budget information
         while True:
-            line = self.f.readline()
-            if line == "":
+            line = mm.readline()
+            if line == b"":
                 print(
                     "end of file found while seeking budget "
                     "information for ts,sp: {} {}".format(ts, sp)
                 )
-                return self.null_entries
+                return None, None
 
             # --if there are two '=' in this line, then it is a budget line
-            if len(re.findall("=", line)) == 2:
+            if line.count(b"=") == 2:
                 break
 
+        line = line.decode("ascii", errors="replace")
         tag = "IN"
         incdict = {}
         cumdict = {}
@@ -772,13 +1080,13 @@ class ListBudget:
                     "end of file found while seeking budget "
                     "information for ts,sp: {} {}".format(ts, sp)
                 )
-                return self.null_entries
-            if len(re.findall("=", line)) == 2:
+                return None, None
+            if line.count("=") == 2:
                 try:
                     entry, flux, cumu = self._parse_budget_line(line)
                 except Exception:
                     print("error parsing budget line in ts,sp", ts, sp)
-                    return self.null_entries
+                    return None, None
                 if flux is None:
                     print(
                         "error casting in flux for",
@@ -787,7 +1095,7 @@ class ListBudget:
                         ts,
                         sp,
                     )
-                    return self.null_entries
+                    return None, None
                 if cumu is None:
                     print(
                         "error casting in cumu for",
@@ -796,7 +1104,7 @@ class ListBudget:
                         ts,
                         sp,
                     )
-                    return self.null_entries
+                    return None, None
                 if entry.endswith(tag.upper()):
                     if " - " in entry.upper():
                         key = entry.replace(" ", "")
@@ -819,7 +1127,7 @@ class ListBudget:
                 if "OUT:" in line.upper():
                     tag = "OUT"
                     entrydict = {}
-            line = self.f.readline()
+            line = mm.readline().decode("ascii", errors="replace")
             if entry.upper() == "PERCENT DISCREPANCY":
                 break
 
@@ -852,19 +1160,35 @@ class ListBudget:
                 flux = np.NaN
         return entry, flux, cumu
 
-    def _get_totim(self, ts, sp, seekpoint):
-        self.f.seek(seekpoint)
+    def _get_totim(self, mm, ts, sp):
+        # --find the time summary for this budget, which is before the
+        # next budget in the file
+        pos = mm.tell()
+        idx = mm.find(b"TIME SUMMARY AT END", pos)
+        inext = mm.find(self.budgetkey.encode(), pos)
+        if idx < 0 or -1 < inext < idx:
+            print(
+                "end of file found while seeking budget "
+                "information for ts,sp: {} {}".format(ts, sp)
+            )
+            return np.NaN
+        mm.seek(mm.rfind(b"\n", 0, idx) + 1)
+        mm.readline()
+
+        def readline():
+            return mm.readline().decode("ascii", errors="replace")
+
         # --read header lines
-        ihead = 0
+        ihead = 1
         while True:
-            line = self.f.readline()
+            line = readline()
             ihead += 1
             if line == "":
                 print(
                     "end of file found while seeking budget "
                     "information for ts,sp: {} {}".format(ts, sp)
                 )
-                return np.NaN, np.NaN, np.NaN
+                return np.NaN
             elif (
                 ihead == 2
                 and "SECONDS     MINUTES      HOURS       DAYS        YEARS"
@@ -875,31 +1199,31 @@ class ListBudget:
                 "-----------------------------------------------------------"
                 in line
             ):
-                line = self.f.readline()
+                line = readline()
                 break
 
         if isinstance(self, SwtListBudget):
             translen = self._parse_time_line(line)
-            line = self.f.readline()
+            line = readline()
             if translen is None:
                 print("error parsing translen for ts,sp", ts, sp)
-                return np.NaN, np.NaN, np.NaN
+                return np.NaN
 
         tslen = self._parse_time_line(line)
         if tslen is None:
             print("error parsing tslen for ts,sp", ts, sp)
-            return np.NaN, np.NaN, np.NaN
+            return np.NaN
 
-        sptim = self._parse_time_line(self.f.readline())
+        sptim = self._parse_time_line(readline())
         if sptim is None:
             print("error parsing sptim for ts,sp", ts, sp)
-            return np.NaN, np.NaN, np.NaN
+            return np.NaN
 
-        totim = self._parse_time_line(self.f.readline())
+        totim = self._parse_time_line(readline())
         if totim is None:
             print("error parsing totim for ts,sp", ts, sp)
-            return np.NaN, np.NaN, np.NaN
-        return tslen, sptim, totim
+            return np.NaN
+        return totim
 
     def _parse_time_line(self, line):
         if line == "":
@@ -7,13 +7,276 @@ important classes that can be accessed by the user.
 
 """
 
-import itertools
+import io
+
 import numpy as np
 
 from numpy.lib.recfunctions import append_fields, stack_arrays
 
+from ..utils.binaryfile import read_index_file, write_index_file
 from ..utils.flopy_io import loadtxt
-from ..utils.recarray_utils import ra_slice
+
+
+def _get_cache_file_path(filename, cache_file):
+    """
+    Get the path of the cache file for a MODPATH output file.
+
+    Parameters
+    ----------
+    filename : str
+        Name of the MODPATH output file.
+    cache_file : bool or str
+        If True, the cache file is named filename with a ".npz" extension
+        appended.  If a string, it is the name of the cache file.  If False
+        or None, a cache file is not used.
+
+    Returns
+    -------
+    result : str or None
+        Path of the cache file or None if a cache file is not used.
+
+    """
+    if cache_file is None or cache_file is False:
+        return None
+    elif cache_file is True:
+        return f"{filename}.npz"
+    return str(cache_file)
+
+
+def _get_line_offsets(filename, skiprows=0, chunksize=2 ** 22):
+    """
+    Get the byte offsets of the lines in a text file that are not blank.
+
+    Parameters
+    ----------
+    filename : str
+        Name of the text file.
+    skiprows : int
+        Number of lines to skip at the start of the file. Default is 0.
+    chunksize : int
+        Number of bytes processed at a time. Default is 2**22.
+
+    Returns
+    -------
+    offsets : numpy array
+        Byte offset of the start of each line that is not blank.
+
+    """
+    offsets = []
+    with open(filename, "rb") as f:
+        for n in range(skiprows):
+            f.readline()
+        pos = f.tell()
+        remainder = b""
+        while True:
+            chunk = f.read(chunksize)
+            if chunk:
+                # process the complete lines and keep the last line, which
+                # may be incomplete, for the next chunk
+                lines, newline, rest = (remainder + chunk).rpartition(b"\n")
+                lines += newline
+            else:
+                lines, rest = remainder, b""
+            if lines:
+                buf = np.frombuffer(lines, dtype=np.uint8)
+                starts = np.flatnonzero(buf == 10)[:-1] + 1
+                starts = np.concatenate(([0], starts))
+                # a line is blank if all of its characters are whitespace
+                nonblank = np.logical_or.reduceat(buf > 32, starts)
+                offsets.append(starts[nonblank] + pos)
+                pos += len(lines)
+            remainder = rest
+            if not chunk:
+                break
+    return np.concatenate(offsets + [[]]).astype(np.int64)
+
+
+def _read_lines(filename, offsets):
+    """
+    Read the lines that start at a set of byte offsets in a text file.
+
+    Parameters
+    ----------
+    filename : str
+        Name of the text file.
+    offsets : numpy array
+        Byte offsets of the lines.
+
+    Returns
+    -------
+    lines : io.BytesIO
+        File object with the lines.
+
+    """
+    lines = []
+    with open(filename, "rb") as f:
+        for pos in offsets:
+            f.seek(pos)
+            lines.append(f.readline().rstrip(b"\r\n"))
+    return io.BytesIO(b"\n".join(lines))
+
+
+def _get_particle_index(particleids):
+    """
+    Get the first and last position of each particle in sorted particle
+    ids.
+
+    Parameters
+    ----------
+    particleids : numpy array
+        Particle ids sorted in ascending order.
+
+    Returns
+    -------
+    ids : numpy array
+        Unique particle ids.
+    index : numpy array
+        Array with shape (len(ids), 2) with the start and stop position of
+        each particle.
+
+    """
+    ids, start, count = np.unique(
+        particleids, return_index=True, return_counts=True
+    )
+    return ids, np.column_stack((start, start + count))
+
+
+def _get_line_index(offsets, particleids):
+    """
+    Group the byte offsets of the records in a file by particle.
+
+    Parameters
+    ----------
+    offsets : numpy array
+        Byte offset of each record.
+    particleids : numpy array
+        Particle id of each record.
+
+    Returns
+    -------
+    offsets : numpy array
+        Byte offsets sorted by particle id.  The records of each particle
+        are in the order they are in the file.
+    ids : numpy array
+        Unique particle ids.
+    index : numpy array
+        Array with shape (len(ids), 2) with the start and stop position of
+        the byte offsets of each particle.
+
+    """
+    if particleids.size != offsets.size:
+        raise ValueError("number of particle ids and records do not match")
+    order = np.argsort(particleids, kind="stable")
+    ids, index = _get_particle_index(particleids[order])
+    return offsets[order], ids, index
+
+
+def _get_ranges(index):
+    """
+    Get the positions in a set of start and stop ranges.
+
+    Parameters
+    ----------
+    index : numpy array
+        Array with shape (n, 2) with the start and stop of each range.
+
+    Returns
+    -------
+    positions : numpy array
+        Concatenated positions of the ranges.
+
+    """
+    index = np.asarray(index, dtype=np.int64).reshape(-1, 2)
+    count = index[:, 1] - index[:, 0]
+    offset = np.cumsum(count) - count
+    return np.repeat(index[:, 0] - offset, count) + np.arange(count.sum())
+
+
+def _build_cell_index(data, names):
+    """
+    Build the index of the records in each cell.
+
+    Parameters
+    ----------
+    data : numpy record array
+        MODPATH output data.
+    names : list of str
+        Names of the fields with the zero-based cell, for example
+        ["k", "i", "j"] or ["node"].
+
+    Returns
+    -------
+    cellindex : tuple
+        Shape used to convert cells to cell numbers, unique cell numbers,
+        start and stop position of each cell in the sorted records, and the
+        records sorted by cell number.
+
+    """
+    cells = [np.asarray(data[name], dtype=np.int64) for name in names]
+    shape = tuple(int(c.max()) + 1 if c.size > 0 else 0 for c in cells)
+    valid = np.ones(data.shape[0], dtype=bool)
+    for c in cells:
+        valid &= c >= 0
+    rows = np.flatnonzero(valid)
+    keys = np.ravel_multi_index(tuple(c[rows] for c in cells), shape)
+    order = np.argsort(keys, kind="stable")
+    cellnums, index = _get_particle_index(keys[order])
+    return shape, cellnums, index, rows[order]
+
+
+def _get_cell_records(cellindex, dest_cells):
+    """
+    Get the records in a set of cells.
+
+    Parameters
+    ----------
+    cellindex : tuple
+        Cell index built by _build_cell_index.
+    dest_cells : list or array of tuples
+        Zero-based (k, i, j) or node number of each cell.
+
+    Returns
+    -------
+    rows : numpy array
+        Sorted positions of the records in dest_cells.
+
+    """
+    shape, cellnums, index, order = cellindex
+    cells = np.asarray(dest_cells)
+    if cells.dtype.names is not None:
+        cells = np.column_stack([cells[name] for name in cells.dtype.names])
+    cells = np.asarray(cells, dtype=np.int64).reshape(-1, len(shape))
+    inside = np.all((cells >= 0) & (cells < shape), axis=1)
+    if cellnums.size == 0 or not np.any(inside):
+        return np.zeros(0, dtype=np.int64)
+    keys = np.unique(np.ravel_multi_index(tuple(cells[inside].T), shape))
+    pos = np.minimum(np.searchsorted(cellnums, keys), cellnums.size - 1)
+    pos = pos[cellnums[pos] == keys]
+    return np.sort(order[_get_ranges(index[pos])])
+
+
+def _sort_particle_data(data):
+    """
+    Sort pathline or timeseries data by particle id and time.  Records with
+    the same particle id and time are sorted by the remaining fields, as
+    with data.sort(order=["particleid", "time"]).
+
+    """
+    particleid = np.asarray(data["particleid"])
+    time = np.asarray(data["time"])
+    dp = np.diff(particleid)
+    dt = np.diff(time)
+    if np.all((dp > 0) | ((dp == 0) & (dt > 0))):
+        return data
+    data = data[np.lexsort((time, particleid))]
+
+    # sort the records with the same particle id and time
+    tie = (np.diff(data["particleid"]) == 0) & (np.diff(data["time"]) == 0)
+    if np.any(tie):
+        tie = np.diff(np.concatenate(([0], tie.astype(np.int8), [0])))
+        for i0, i1 in zip(np.flatnonzero(tie == 1), np.flatnonzero(tie == -1)):
+            data[i0 : i1 + 1].sort(order=["particleid", "time"])
+    return data
 
 
 class _ModpathSeries(object):
@@ -31,19 +294,149 @@ class _ModpathSeries(object):
         Write information to the screen. Default is False
     output_type : str
         pathline or timeseries file type
+    lazy : bool
+        If True, only the position of the records of each particle in the
+        file is read and the data for a particle are read when they are
+        requested. Default is False
 
     """
 
-    def __init__(self, filename, verbose=False, output_type="pathline"):
+    def __init__(
+        self, filename, verbose=False, output_type="pathline", lazy=False
+    ):
         self.fname = filename
         self.verbose = verbose
         self.output_type = output_type.upper()
+        self.lazy = lazy
+        self._alldata = None
 
         self._build_index()
 
         # set output type
         self.outdtype = self._get_outdtype()
 
+    def _load_data(self):
+        """
+        Set the data and the particle index.  Only the particle index is
+        built if lazy is True.
+
+        """
+        if self.lazy:
+            self._build_lazy_index()
+        else:
+            self._data = self._read_data()
+
+    @property
+    def _data(self):
+        """
+        Data for all particles sorted by particle id and time.  The data are
+        read the first time they are accessed if lazy is True.
+
+        """
+        if self._alldata is None:
+            self._data = self._read_data()
+        return self._alldata
+
+    @_data.setter
+    def _data(self, data):
+        self._alldata = _sort_particle_data(data)
+        self.nid, self._partidx = _get_particle_index(
+            self._alldata["particleid"]
+        )
+        self._cellindex = None
+
+    def _get_cell_index(self):
+        """
+        Get the index of the records in each cell.  The index is built the
+        first time it is needed.
+
+        """
+        if self.version < 7:
+            names = ["k", "i", "j"]
+        else:
+            names = ["node"]
+        data = self._data
+        if self._cellindex is None:
+            if not set(names).issubset(data.dtype.names):
+                if self.version < 7:
+                    raise KeyError(
+                        "could not extract 'k', 'i', and 'j' keys "
+                        "from {} data".format(self.output_type.lower())
+                    )
+                msg = "could not extract 'node' key from {} data".format(
+                    self.output_type.lower()
+                )
+                raise KeyError(msg)
+            self._cellindex = _build_cell_index(data, names)
+        return self._cellindex
+
+    def _read(self, f, skiprows=0):
+        """
+        Read the data in a file object and convert the indices to zero-based.
+
+        """
+        data = self._loadtxt(f, skiprows=skiprows)
+        for n in self.kijnames:
+            if n in data.dtype.names:
+                data[n] -= 1
+        return data
+
+    def _loadtxt(self, f, skiprows=0):
+        return loadtxt(f, dtype=self.dtype, skiprows=skiprows)
+
+    def _read_data(self):
+        """
+        Read the data for all particles.
+
+        """
+        with open(self.fname, "r") as f:
+            return self._read(f, skiprows=self.skiprows)
+
+    def _get_line_particleids(self):
+        """
+        Get the zero-based particle id of each record in the file.
+
+        """
+        ra = loadtxt(
+            self.fname,
+            dtype=np.float64,
+            skiprows=self.skiprows,
+            header=None,
+            names=list(self.dtype.names),
+            usecols=["particleid"],
+        )
+        return ra["particleid"].astype(np.int64) - 1
+
+    def _build_lazy_index(self):
+        """
+        Build the index of the byte offsets of the records of each particle.
+
+        """
+        offsets = _get_line_offsets(self.fname, self.skiprows)
+        particleids = self._get_line_particleids()
+        self._lineoffsets, self.nid, self._lineidx = _get_line_index(
+            offsets, particleids
+        )
+
+    def _get_particle_data(self, partid):
+        """
+        Get the data for a particle sorted by time.  The data are read from
+        the file if lazy is True and the data for all particles have not
+        been read.
+
+        """
+        i = np.searchsorted(self.nid, partid)
+        found = i < self.nid.size and self.nid[i] == partid
+        if self._alldata is not None:
+            if not found:
+                return self._alldata[np.arange(0)]
+            return self._alldata[np.arange(*self._partidx[i])]
+        if not found:
+            return np.zeros(0, dtype=self.dtype).view(np.recarray)
+        i0, i1 = self._lineidx[i]
+        f = _read_lines(self.fname, self._lineoffsets[i0:i1])
+        return _sort_particle_data(self._read(f))
+
     def _build_index(self):
         """
         Set position of the start of the pathline data.
@@ -112,7 +505,7 @@ class _ModpathSeries(object):
             Maximum pathline number.
 
         """
-        return self._data["particleid"].max()
+        return self.nid.max()
 
     def get_maxtime(self):
         """
@@ -146,20 +539,13 @@ class _ModpathSeries(object):
             Recarray with the x, y, z, time, k, and particleid.
 
         """
-        ra = self._data
-        ra.sort(order=["particleid", "time"])
+        ra = self._get_particle_data(partid)
         if totim is not None:
             if ge:
-                idx = np.where(
-                    (ra["time"] >= totim) & (ra["particleid"] == partid)
-                )[0]
+                idx = np.where(ra["time"] >= totim)[0]
             else:
-                idx = np.where(
-                    (ra["time"] <= totim) & (ra["particleid"] == partid)
-                )[0]
-        else:
-            idx = np.where(ra["particleid"] == partid)[0]
-        ra = ra[idx]
+                idx = np.where(ra["time"] <= totim)[0]
+            ra = ra[idx]
         return ra[["x", "y", "z", "time", "k", "particleid"]]
 
     def get_alldata(self, totim=None, ge=True):
@@ -181,7 +567,6 @@ class _ModpathSeries(object):
 
         """
         ra = self._data
-        ra.sort(order=["particleid", "time"])
         if totim is not None:
             if ge:
                 idx = np.where(ra["time"] >= totim)[0]
@@ -190,7 +575,38 @@ class _ModpathSeries(object):
             if len(idx) > 0:
                 ra = ra[idx]
         ra = ra[["x", "y", "z", "time", "k", "particleid"]]
-        return [ra[ra["particleid"] == i] for i in range(self.nid.size)]
+        idx = np.searchsorted(ra["particleid"], np.arange(self.nid.size + 1))
+        return [
+            ra[np.arange(idx[i], idx[i + 1])] for i in range(self.nid.size)
+        ]
+
+    def get_destination_particleids(self, dest_cells):
+        """
+        Get the particle ids of the particles that pass through a set of
+        destination cells.
+
+        Parameters
+        ----------
+        dest_cells : list or array of tuples, or dict
+            (k, i, j) of each destination cell for MODPATH versions less than
+            MODPATH 7 or node number of each destination cell. (zero based)
+            If a dictionary, the particle ids are determined for each set of
+            destination cells in the dictionary.
+
+        Returns
+        -------
+        partids : numpy array or dict
+            Sorted particle ids, or a dictionary with the particle ids for
+            each set of destination cells if dest_cells is a dictionary.
+
+        """
+        if isinstance(dest_cells, dict):
+            return {
+                key: self.get_destination_particleids(cells)
+                for key, cells in dest_cells.items()
+            }
+        rows = _get_cell_records(self._get_cell_index(), dest_cells)
+        return np.unique(self._data["particleid"][rows])
 
     def get_destination_data(self, dest_cells, to_recarray=True):
         """
@@ -198,9 +614,11 @@ class _ModpathSeries(object):
 
         Parameters
         ----------
-        dest_cells : list or array of tuples
+        dest_cells : list or array of tuples, or dict
             (k, i, j) of each destination cell for MODPATH versions less than
             MODPATH 7 or node number of each destination cell. (zero based)
+            If a dictionary, the data are determined for each set of
+            destination cells in the dictionary.
         to_recarray : bool
             Boolean that controls returned series. If to_recarray is True,
             a single recarray with all of the pathlines that intersect
@@ -213,55 +631,24 @@ class _ModpathSeries(object):
         series : np.recarray
             Slice of data array (e.g. PathlineFile._data, TimeseriesFile._data)
             containing endpoint, pathline, or timeseries data that intersect
-            (k,i,j) or (node) dest_cells.
+            (k,i,j) or (node) dest_cells. A dictionary with the data for each
+            set of destination cells is returned if dest_cells is a
+            dictionary.
 
         """
 
-        # create local copy of _data
-        ra = np.array(self._data)
-
-        # find the intersection of pathlines and dest_cells
-        # convert dest_cells to same dtype for comparison
-        if self.version < 7:
-            try:
-                raslice = ra[["k", "i", "j"]]
-            except (KeyError, ValueError):
-                raise KeyError(
-                    "could not extract 'k', 'i', and 'j' keys "
-                    "from {} data".format(self.output_type.lower())
-                )
-        else:
-            try:
-                raslice = ra[["node"]]
-            except (KeyError, ValueError):
-                msg = "could not extract 'node' key from {} data".format(
-                    self.output_type.lower()
-                )
-                raise KeyError(msg)
-            if isinstance(dest_cells, (list, tuple)):
-                allint = all(isinstance(el, int) for el in dest_cells)
-                # convert to a list of tuples
-                if allint:
-                    t = []
-                    for el in dest_cells:
-                        t.append((el,))
-                        dest_cells = t
-
-        dest_cells = np.array(dest_cells, dtype=raslice.dtype)
-        inds = np.in1d(raslice, dest_cells)
-        epdest = ra[inds].copy().view(np.recarray)
+        if isinstance(dest_cells, dict):
+            return {
+                key: self.get_destination_data(cells, to_recarray)
+                for key, cells in dest_cells.items()
+            }
 
+        partids = self.get_destination_particleids(dest_cells)
         if to_recarray:
             # use particle ids to get the rest of the paths
-            inds = np.in1d(ra["particleid"], epdest.particleid)
-            series = ra[inds].copy()
-            series.sort(order=["particleid", "time"])
-            series = series.view(np.recarray)
+            idx = self._partidx[np.searchsorted(self.nid, partids)]
+            series = self._data[_get_ranges(idx)].view(np.recarray)
         else:
-
-            # get list of unique particleids in selection
-            partids = np.unique(epdest["particleid"])
-
             # build list of unique particleids in selection
             series = [self.get_data(partid) for partid in partids]
 
@@ -422,6 +809,18 @@ class PathlineFile(_ModpathSeries):
         Name of the pathline file
     verbose : bool
         Write information to the screen.  Default is False.
+    cache_file : bool or str
+        If True, the pathline data are stored in a cache file named
+        filename with a ".npz" extension appended after they are read, and
+        are read from the cache file instead of the pathline file if the
+        pathline file has not changed.  If a string, it is the name of the
+        cache file. Default is False.
+    lazy : bool
+        If True, only the position of the pathline points of each particle
+        in the pathline file is read when the file is opened, and the
+        pathline points for a particle are read by get_data().  The data for
+        all particles are read the first time they are needed by another
+        method. Default is False.
 
     Examples
     --------
@@ -444,35 +843,71 @@ class PathlineFile(_ModpathSeries):
         "sequencenumber",
     ]
 
-    def __init__(self, filename, verbose=False):
+    def __init__(self, filename, verbose=False, cache_file=False, lazy=False):
         """
         Class constructor.
 
         """
 
-        super().__init__(filename, verbose=verbose, output_type="pathline")
+        super().__init__(
+            filename, verbose=verbose, output_type="pathline", lazy=lazy
+        )
+        self.cache_file = _get_cache_file_path(filename, cache_file)
 
         # set data dtype and read pathline data
         if self.version == 7:
-            self.dtype, self._data = self._get_mp7data()
+            self.dtype = self._get_mp7dtypes()[1]
         else:
             self.dtype = self._get_dtypes()
-            self._data = loadtxt(
-                self.file, dtype=self.dtype, skiprows=self.skiprows
-            )
-
-        # convert layer, row, and column indices; particle id and group; and
-        #  line segment indices to zero-based
-        for n in self.kijnames:
-            if n in self._data.dtype.names:
-                self._data[n] -= 1
-
-        # set number of particle ids
-        self.nid = np.unique(self._data["particleid"])
+        self._load_data()
 
         # close the input file
         self.file.close()
 
+    def _read_data(self):
+        """
+        Read the pathline data for all particles from the cache file, if it
+        is up to date, or from the pathline file.
+
+        """
+        if self.cache_file is not None:
+            cache = read_index_file(self.cache_file, self.fname)
+            if cache is not None and "data" in cache:
+                data = cache["data"]
+                if self.version != 7:
+                    data = data.view(np.recarray)
+                return data
+        data = _sort_particle_data(super()._read_data())
+        if self.cache_file is not None:
+            write_index_file(self.cache_file, self.fname, data=data)
+        return data
+
+    def _loadtxt(self, f, skiprows=0):
+        if self.version == 7:
+            return self._get_mp7data(f, skiprows)
+        return super()._loadtxt(f, skiprows)
+
+    def _get_line_particleids(self):
+        if self.version != 7:
+            return super()._get_line_particleids()
+
+        # the pathline points follow the header line of each particle
+        dtyper = self._get_mp7dtypes()[0]
+        names = list(dtyper.names)
+        ra = loadtxt(
+            self.fname,
+            dtype=np.float64,
+            skiprows=self.skiprows,
+            header=None,
+            names=names,
+            usecols=[names[0], names[3], names[-1]],
+        )
+        header = np.isnan(ra[names[-1]])
+        sequencenumber = ra[names[0]][header].astype(np.int64)
+        pathlinecount = ra[names[3]][header].astype(np.int64)
+        self._check_pathlinecount(header, pathlinecount)
+        return np.repeat(sequencenumber - 1, pathlinecount + 1)
+
     def _get_dtypes(self):
         """
         Build numpy dtype for the MODPATH 6 pathline file.
@@ -520,7 +955,7 @@ class PathlineFile(_ModpathSeries):
             )
         return dtype
 
-    def _get_mp7data(self):
+    def _get_mp7dtypes(self):
         dtyper = np.dtype(
             [
                 ("node", np.int32),
@@ -555,56 +990,63 @@ class PathlineFile(_ModpathSeries):
                 ("timestep", np.int32),
             ]
         )
-        idx = 0
-        part_dict = {}
-        ndata = 0
-        while True:
-            if idx == 0:
-                for n in range(self.skiprows):
-                    line = self.file.readline()
-            # read header line
-            try:
-                line = self.file.readline().strip()
-                if self.verbose:
-                    print(line)
-                if len(line) < 1:
-                    break
-            except:
-                break
-            t = [int(s) for j, s in enumerate(line.split()) if j < 4]
-            sequencenumber, group, particleid, pathlinecount = t[0:4]
-            ndata += pathlinecount
-            # read in the particle data
-            d = np.loadtxt(
-                itertools.islice(self.file, 0, pathlinecount), dtype=dtyper
+        return dtyper, dtype
+
+    def _check_pathlinecount(self, header, pathlinecount):
+        """
+        Check that the number of points following each header line matches
+        the point count in the header line.
+
+        """
+        npoints = np.diff(np.append(np.flatnonzero(header), header.size)) - 1
+        if not np.array_equal(npoints, pathlinecount):
+            raise ValueError(
+                f"number of pathline points in {self.fname} does not match "
+                "the pathline point count in the pathline headers"
             )
-            key = (idx, sequencenumber, group, particleid, pathlinecount)
-            part_dict[key] = d.copy()
-            idx += 1
-
-        # create data array
-        data = np.zeros(ndata, dtype=dtype)
-
-        # fill data
-        ipos0 = 0
-        for key, value in part_dict.items():
-            idx, sequencenumber, group, particleid, pathlinecount = key[0:5]
-            ipos1 = ipos0 + pathlinecount
-            # fill constant items for particle
-            # particleid is not necessarily unique for all pathlines - use
-            # sequencenumber which is unique
-            data["particleid"][ipos0:ipos1] = sequencenumber
-            # set particlegroup and sequence number
-            data["particlegroup"][ipos0:ipos1] = group
-            data["sequencenumber"][ipos0:ipos1] = sequencenumber
-            # save particleidloc to particleid
-            data["particleidloc"][ipos0:ipos1] = particleid
-            # fill particle data
-            for name in value.dtype.names:
-                data[name][ipos0:ipos1] = value[name]
-            ipos0 = ipos1
-
-        return dtype, data
+
+    def _get_mp7data(self, f, skiprows=0):
+        dtyper, dtype = self._get_mp7dtypes()
+
+        # read the header and pathline point lines in a single pass, the
+        # values that are not on the header lines are nan
+        ra = loadtxt(
+            f,
+            dtype=np.float64,
+            skiprows=skiprows,
+            header=None,
+            names=list(dtyper.names),
+        )
+
+        # process the header lines (sequencenumber, group, particleid,
+        # pathlinecount)
+        header = np.isnan(ra[dtyper.names[-1]])
+        sequencenumber, group, particleid, pathlinecount = [
+            ra[name][header].astype(np.int32) for name in dtyper.names[:4]
+        ]
+        self._check_pathlinecount(header, pathlinecount)
+        if self.verbose:
+            print(
+                f"read {pathlinecount.size} pathlines with "
+                f"{pathlinecount.sum()} points from {self.fname}"
+            )
+
+        # create and fill the data array
+        ra = ra[~header]
+        data = np.zeros(ra.size, dtype=dtype)
+        # particleid is not necessarily unique for all pathlines - use
+        # sequencenumber which is unique
+        data["particleid"] = np.repeat(sequencenumber, pathlinecount)
+        # set particlegroup and sequence number
+        data["particlegroup"] = np.repeat(group, pathlinecount)
+        data["sequencenumber"] = data["particleid"]
+        # save particleidloc to particleid
+        data["particleidloc"] = np.repeat(particleid, pathlinecount)
+        # fill particle data
+        for name in dtyper.names:
+            data[name] = ra[name]
+
+        return data
 
     def get_maxid(self):
         """
@@ -707,9 +1149,11 @@ class PathlineFile(_ModpathSeries):
 
         Parameters
         ----------
-        dest_cells : list or array of tuples
+        dest_cells : list or array of tuples, or dict
             (k, i, j) of each destination cell for MODPATH versions less than
             MODPATH 7 or node number of each destination cell. (zero based)
+            If a dictionary, the pathline data are determined for each set
+            of destination cells in the dictionary.
         to_recarray : bool
             Boolean that controls returned pthldest. If to_recarray is True,
             a single recarray with all of the pathlines that intersect
@@ -722,7 +1166,8 @@ class PathlineFile(_ModpathSeries):
         pthldest : np.recarray
             Slice of pathline data array (e.g. PathlineFile._data)
             containing only pathlines that pass through (k,i,j) or (node)
-            dest_cells.
+            dest_cells. A dictionary with the pathline data for each set of
+            destination cells is returned if dest_cells is a dictionary.
 
         Examples
         --------
@@ -731,6 +1176,8 @@ class PathlineFile(_ModpathSeries):
         >>> p = flopy.utils.PathlineFile('modpath.pathline')
         >>> p0 = p.get_destination_pathline_data([(0, 0, 0),
         ...                                       (1, 0, 0)])
+        >>> pwells = p.get_destination_pathline_data({'well1': [(0, 0, 0)],
+        ...                                           'well2': [(1, 0, 0)]})
 
         """
         return super().get_destination_data(
@@ -797,6 +1244,12 @@ class EndpointFile:
         Name of the endpoint file
     verbose : bool
         Write information to the screen.  Default is False.
+    lazy : bool
+        If True, only the position of the endpoint record of each particle
+        in the endpoint file is read when the file is opened, and the record
+        for a particle is read by get_data().  The data for all particles
+        are read the first time they are needed by another method. Default
+        is False.
 
     Examples
     --------
@@ -824,33 +1277,129 @@ class EndpointFile:
         "zone",
     ]
 
-    def __init__(self, filename, verbose=False):
+    def __init__(self, filename, verbose=False, lazy=False):
         """
         Class constructor.
 
         """
         self.fname = filename
         self.verbose = verbose
+        self.lazy = lazy
+        self._alldata = None
         self._build_index()
         self.dtype = self._get_dtypes()
-        self._data = loadtxt(
-            self.file, dtype=self.dtype, skiprows=self.skiprows
+        if lazy:
+            self._build_lazy_index()
+        else:
+            self._data = self._read_data()
+
+        # close the input file
+        self.file.close()
+        return
+
+    @property
+    def _data(self):
+        """
+        Endpoint data for all particles.  The data are read the first time
+        they are accessed if lazy is True.
+
+        """
+        if self._alldata is None:
+            self._data = self._read_data()
+        return self._alldata
+
+    @_data.setter
+    def _data(self, data):
+        self._alldata = data
+        particleids = np.asarray(data["particleid"])
+        self._sortidx = np.argsort(particleids, kind="stable")
+        self._particleids, self._partidx = _get_particle_index(
+            particleids[self._sortidx]
         )
+        self._cellindex = {}
+
+        # set number of particle ids
+        self.nid = self._particleids.shape[0]
+
+    def _get_cell_index(self, source=False):
+        """
+        Get the index of the endpoint records in each starting (source is
+        True) or ending cell.  The index is built the first time it is
+        needed.
+
+        """
+        if self.version < 7:
+            if source:
+                keys = ["k0", "i0", "j0"]
+            else:
+                keys = ["k", "i", "j"]
+        else:
+            if source:
+                keys = ["node0"]
+            else:
+                keys = ["node"]
+        data = self._data
+        if source not in self._cellindex:
+            if not set(keys).issubset(data.dtype.names):
+                if self.version < 7:
+                    raise KeyError(
+                        "could not extract "
+                        + "', '".join(keys)
+                        + " from endpoint data."
+                    )
+                msg = f"could not extract '{keys[0]}' key from endpoint data"
+                raise KeyError(msg)
+            self._cellindex[source] = _build_cell_index(data, keys)
+        return self._cellindex[source]
+
+    def _read(self, f, skiprows=0):
+        """
+        Read the endpoint data in a file object, add particle ids if
+        required, and convert the indices to zero-based.
+
+        """
+        data = loadtxt(f, dtype=self.dtype, skiprows=skiprows)
         # add particleid if required
-        self._add_particleid()
+        data = self._add_particleid(data)
 
         # convert layer, row, and column indices; particle id and group; and
         #  line segment indices to zero-based
         for n in self.kijnames:
-            if n in self._data.dtype.names:
-                self._data[n] -= 1
+            if n in data.dtype.names:
+                data[n] -= 1
+        return data
 
-        # set number of particle ids
-        self.nid = np.unique(self._data["particleid"]).shape[0]
+    def _read_data(self):
+        """
+        Read the endpoint data for all particles.
 
-        # close the input file
-        self.file.close()
-        return
+        """
+        with open(self.fname, "r") as f:
+            return self._read(f, skiprows=self.skiprows)
+
+    def _build_lazy_index(self):
+        """
+        Build the index of the byte offset of the endpoint record of each
+        particle.
+
+        """
+        offsets = _get_line_offsets(self.fname, self.skiprows)
+        if self.version < 6:
+            particleids = np.arange(offsets.size)
+        else:
+            ra = loadtxt(
+                self.fname,
+                dtype=np.float64,
+                skiprows=self.skiprows,
+                header=None,
+                names=list(self.dtype.names),
+                usecols=["particleid"],
+            )
+            particleids = ra["particleid"].astype(np.int64) - 1
+        self._lineoffsets, self._particleids, self._lineidx = _get_line_index(
+            offsets, particleids
+        )
+        self.nid = self._particleids.shape[0]
 
     def _build_index(self):
         """
@@ -998,17 +1547,17 @@ class EndpointFile:
         ]
         return np.dtype(dtype)
 
-    def _add_particleid(self):
+    def _add_particleid(self, data):
 
         # add particle ids for earlier version of MODPATH
         if self.version < 6:
             # create particle ids
-            shaped = self._data.shape[0]
+            shaped = data.shape[0]
             pids = np.arange(1, shaped + 1, 1, dtype=np.int32)
 
             # for numpy version 1.14 and higher
-            self._data = append_fields(self._data, "particleid", pids)
-        return
+            data = append_fields(data, "particleid", pids)
+        return data
 
     def get_maxid(self):
         """
@@ -1020,7 +1569,7 @@ class EndpointFile:
             Maximum endpoint particle id.
 
         """
-        return np.unique(self._data["particleid"]).max()
+        return self._particleids.max()
 
     def get_maxtime(self):
         """
@@ -1077,8 +1626,20 @@ class EndpointFile:
         >>> e1 = endobj.get_data(partid=1)
 
         """
-        idx = self._data["particleid"] == partid
-        ra = self._data[idx]
+        i = np.searchsorted(self._particleids, partid)
+        found = i < self._particleids.size and self._particleids[i] == partid
+        if self._alldata is not None:
+            if not found:
+                return self._alldata[np.arange(0)]
+            i0, i1 = self._partidx[i]
+            return self._alldata[self._sortidx[i0:i1]]
+        if not found:
+            ra = np.zeros(0, dtype=self.dtype).view(np.recarray)
+            return self._add_particleid(ra)
+        i0, i1 = self._lineidx[i]
+        ra = self._read(_read_lines(self.fname, self._lineoffsets[i0:i1]))
+        if self.version < 6:
+            ra["particleid"] = partid
         return ra
 
     def get_alldata(self):
@@ -1116,9 +1677,11 @@ class EndpointFile:
 
         Parameters
         ----------
-        dest_cells : list or array of tuples
+        dest_cells : list or array of tuples, or dict
             (k, i, j) of each destination cell for MODPATH versions less than
             MODPATH 7 or node number of each destination cell. (zero based)
+            If a dictionary, the endpoint data are determined for each set
+            of destination cells in the dictionary.
         source : bool
             Boolean to specify is dest_cells applies to source or
             destination cells (default is False).
@@ -1128,7 +1691,9 @@ class EndpointFile:
         epdest : np.recarray
             Slice of endpoint data array (e.g. EndpointFile.get_alldata)
             containing only endpoint data with final locations in (k,i,j) or
-            (node) dest_cells.
+            (node) dest_cells. A dictionary with the endpoint data for each
+            set of destination cells is returned if dest_cells is a
+            dictionary.
 
         Examples
         --------
@@ -1140,52 +1705,55 @@ class EndpointFile:
 
         """
 
-        # create local copy of _data
-        ra = self.get_alldata()
+        if isinstance(dest_cells, dict):
+            return {
+                key: self.get_destination_endpoint_data(cells, source)
+                for key, cells in dest_cells.items()
+            }
 
-        # find the intersection of endpoints and dest_cells
-        # convert dest_cells to same dtype for comparison
-        if self.version < 7:
-            if source:
-                keys = ["k0", "i0", "j0"]
-            else:
-                keys = ["k", "i", "j"]
-            try:
-                raslice = ra_slice(ra, keys)
-            except (KeyError, ValueError):
-                raise KeyError(
-                    "could not extract "
-                    + "', '".join(keys)
-                    + " from endpoint data."
-                )
-        else:
-            if source:
-                keys = ["node0"]
-            else:
-                keys = ["node"]
-            try:
-                raslice = ra_slice(ra, keys)
-            except (KeyError, ValueError):
-                msg = f"could not extract '{keys[0]}' key from endpoint data"
-                raise KeyError(msg)
-            if isinstance(dest_cells, (list, tuple)):
-                allint = all(isinstance(el, int) for el in dest_cells)
-                # convert to a list of tuples
-                if allint:
-                    t = []
-                    for el in dest_cells:
-                        t.append((el,))
-                        dest_cells = t
-        dtype = []
-        for key in keys:
-            dtype.append((key, np.int32))
-        dtype = np.dtype(dtype)
-        dest_cells = np.array(dest_cells, dtype=dtype)
-
-        inds = np.in1d(raslice, dest_cells)
-        epdest = ra[inds].copy().view(np.recarray)
+        rows = _get_cell_records(self._get_cell_index(source), dest_cells)
+        epdest = self._data.view(np.recarray)[rows].view(np.recarray)
         return epdest
 
+    def get_destination_particleids(self, dest_cells, source=False):
+        """
+        Get the particle ids of the particles that terminate in (or start
+        in) a set of destination cells.
+
+        Parameters
+        ----------
+        dest_cells : list or array of tuples, or dict
+            (k, i, j) of each destination cell for MODPATH versions less than
+            MODPATH 7 or node number of each destination cell. (zero based)
+            If a dictionary, the particle ids are determined for each set of
+            destination cells in the dictionary.
+        source : bool
+            Boolean to specify is dest_cells applies to source or
+            destination cells (default is False).
+
+        Returns
+        -------
+        partids : numpy array or dict
+            Sorted particle ids, or a dictionary with the particle ids for
+            each set of destination cells if dest_cells is a dictionary.
+
+        Examples
+        --------
+
+        >>> import flopy
+        >>> e = flopy.utils.EndpointFile('modpath.endpoint')
+        >>> wells = {'well1': [(0, 0, 0)], 'well2': [(1, 0, 0), (1, 1, 0)]}
+        >>> partids = e.get_destination_particleids(wells)
+
+        """
+        if isinstance(dest_cells, dict):
+            return {
+                key: self.get_destination_particleids(cells, source)
+                for key, cells in dest_cells.items()
+            }
+        rows = _get_cell_records(self._get_cell_index(source), dest_cells)
+        return np.unique(np.asarray(self._data["particleid"])[rows])
+
     def write_shapefile(
         self,
         endpoint_data=None,
@@ -1269,6 +1837,12 @@ class TimeseriesFile(_ModpathSeries):
         Name of the timeseries file
     verbose : bool
         Write information to the screen.  Default is False.
+    lazy : bool
+        If True, only the position of the timeseries records of each
+        particle in the timeseries file is read when the file is opened, and
+        the records for a particle are read by get_data().  The data for all
+        particles are read the first time they are needed by another method.
+        Default is False.
 
     Examples
     --------
@@ -1291,29 +1865,21 @@ class TimeseriesFile(_ModpathSeries):
         "timepointindex",
     ]
 
-    def __init__(self, filename, verbose=False):
+    def __init__(self, filename, verbose=False, lazy=False):
         """
         Class constructor.
 
         """
-        super().__init__(filename, verbose=verbose, output_type="timeseries")
+        super().__init__(
+            filename, verbose=verbose, output_type="timeseries", lazy=lazy
+        )
 
         # set dtype
         self.dtype = self._get_dtypes()
 
-        # read data
-        self._data = loadtxt(
-            self.file, dtype=self.dtype, skiprows=self.skiprows
-        )
-
-        # convert layer, row, and column indices; particle id and group; and
-        #  line segment indices to zero-based
-        for n in self.kijnames:
-            if n in self._data.dtype.names:
-                self._data[n] -= 1
-
-        # set number of particle ids
-        self.nid = np.unique(self._data["particleid"])
+        # read data and convert layer, row, and column indices; particle id
+        # and group; and line segment indices to zero-based
+        self._load_data()
 
         # close the input file
         self.file.close()
@@ -1552,16 +2118,20 @@ class TimeseriesFile(_ModpathSeries):
 
         Parameters
         ----------
-        dest_cells : list or array of tuples
+        dest_cells : list or array of tuples, or dict
             (k, i, j) of each destination cell for MODPATH versions less than
             MODPATH 7 or node number of each destination cell. (zero based)
+            If a dictionary, the timeseries data are determined for each set
+            of destination cells in the dictionary.
 
         Returns
         -------
         tsdest : np.recarray
             Slice of timeseries data array (e.g. TmeseriesFile._data)
             containing only timeseries that pass through (k,i,j) or
-            (node) dest_cells.
+            (node) dest_cells. A dictionary with the timeseries data for
+            each set of destination cells is returned if dest_cells is a
+            dictionary.
 
         Examples
         --------
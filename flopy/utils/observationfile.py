@@ -1,6 +1,9 @@
 import numpy as np
 import io
+import itertools
+import os
 from ..utils.utils_def import FlopyBinaryData
+from ..utils.datafile import _running_stats
 from ..utils.flopy_io import get_ts_sp
 from ..utils import import_optional_dependency
 
@@ -216,6 +219,106 @@ class ObsFiles(FlopyBinaryData):
         df = pd.DataFrame(self.data[i0:i1], index=dti, columns=obsname)
         return df
 
+    def iter_chunks(self, chunksize=10000, obsname=None):
+        """
+        Iterate over the observation data in blocks of simulation times.
+
+        Parameters
+        ----------
+        chunksize : int
+            The maximum number of simulation times in each block.
+            (default is 10000)
+        obsname : string or list of strings
+            The name of the observations to return. If obsname is None, all
+            observations are returned. (default is None)
+
+        Yields
+        ------
+        data : numpy record array
+            Array with up to chunksize simulation times, with totim and the
+            selected observations.
+
+        Examples
+        --------
+        >>> obs = Mf6Obs("my_model.obs.head.csv")
+        >>> for data in obs.iter_chunks(chunksize=1000, obsname="H1"):
+        ...     print(data["totim"][-1], data["H1"].max())
+
+        """
+        names = ["totim"] + _select_obsnames(self.get_obsnames(), obsname)
+        for i0 in range(0, self.data.shape[0], chunksize):
+            yield get_selection(self.data[i0 : i0 + chunksize], names)
+
+    def iter_records(self, obsname=None):
+        """
+        Iterate over the observation data one simulation time at a time.
+
+        Parameters
+        ----------
+        obsname : string or list of strings
+            The name of the observations to return. If obsname is None, all
+            observations are returned. (default is None)
+
+        Yields
+        ------
+        totim : float
+            The simulation time.
+        values : numpy array
+            Array with the value of each selected observation at totim.
+
+        Examples
+        --------
+        >>> obs = Mf6Obs("my_model.obs.head.csv")
+        >>> for totim, values in obs.iter_records():
+        ...     print(totim, values.max())
+
+        """
+        if obsname is None:
+            obsname = self.get_obsnames()
+        elif not isinstance(obsname, list):
+            obsname = [obsname]
+        for data in self.iter_chunks(obsname=obsname):
+            values = np.column_stack([data[name] for name in obsname])
+            values = values.astype(float)
+            for totim, row in zip(data["totim"], values):
+                yield float(totim), row
+
+    def get_stats(self, obsname=None, nodata=None, threshold=None):
+        """
+        Get statistics for each observation over all of the simulation
+        times, computed one simulation time at a time.
+
+        Parameters
+        ----------
+        obsname : string or list of strings
+            The name of the observations to include. If obsname is None, all
+            observations are included. (default is None)
+        nodata : float
+            The nodata value.  Values that have the nodata value are
+            excluded from the statistics. (default is None)
+        threshold : float
+            If not None, the number of times each observation is greater
+            than threshold is also returned. (default is None)
+
+        Returns
+        -------
+        stats : dict
+            Dictionary with 'min', 'max', 'mean' and 'count' arrays and, if
+            threshold is not None, an 'exceedance' array.  Arrays are
+            ordered like obsname or get_obsnames() if obsname is None.
+
+        Examples
+        --------
+        >>> obs = Mf6Obs("my_model.obs.head.csv")
+        >>> stats = obs.get_stats(threshold=10.)
+
+        """
+        return _running_stats(
+            (values for _, values in self.iter_records(obsname=obsname)),
+            nodata=nodata,
+            threshold=threshold,
+        )
+
     def _read_data(self):
 
         if self.data is not None:
@@ -270,14 +373,35 @@ class Mf6Obs(ObsFiles):
         default is "auto", code will attempt to automatically check if
         file is binary. User can change this to True or False if the auto
         check fails to work
+    obsname : string or list of strings
+        The name of the observations to read. Only the selected columns are
+        read from the file. If obsname is None, all observations are read.
+        (default is None)
+    mmap : bool
+        Map a binary file into memory using numpy.memmap.  The data
+        attribute is a read-only view into the mapped file if obsname is
+        None. (default is False)
 
     Returns
     -------
     None
 
+    Notes
+    -----
+    The data are read the first time they are used.  iter_chunks() and
+    iter_records() read the file in blocks of simulation times if the data
+    have not been read, so only one block is held in memory.
+
     """
 
-    def __init__(self, filename, verbose=False, isBinary="auto"):
+    def __init__(
+        self,
+        filename,
+        verbose=False,
+        isBinary="auto",
+        obsname=None,
+        mmap=False,
+    ):
         """
         Class constructor.
 
@@ -285,6 +409,10 @@ class Mf6Obs(ObsFiles):
         super().__init__()
         # initialize class information
         self.verbose = verbose
+        self.filename = filename
+        self.mmap = mmap
+        self._csv = None
+        self._data = None
 
         # check if this is a binary file
         if isBinary == "auto":
@@ -309,33 +437,104 @@ class Mf6Obs(ObsFiles):
             lenobsname = int(cline[11:])
 
             # get number of observations
-            self.nobs = self.read_integer()
-
-            # # continue reading the file
-            # self.v = np.empty(self.nobs, dtype=float)
-            # self.v.fill(1.0E+32)
+            nobs = self.read_integer()
 
             # read obsnames
             obsnames = []
-            for idx in range(0, self.nobs):
+            for idx in range(0, nobs):
                 cid = self.read_text(lenobsname)
                 obsnames.append(cid)
-            self.obsnames = np.array(obsnames)
 
-            # build dtype
-            self.dtype = _build_dtype(self.obsnames, self.floattype)
+            # dtype of the records in the file and of the selected data
+            self._offset = self.file.tell()
+            self._recdtype = _build_dtype(obsnames, self.floattype)
+            obsnames = _select_obsnames(self._recdtype.names[1:], obsname)
+            self.obsnames = np.array(obsnames)
+            self.nobs = len(obsnames)
+            self.dtype = np.dtype(
+                [(name, self.floattype) for name in ["totim"] + obsnames]
+            )
 
             # build index
             self._build_index()
+        else:
+            # read ascii data
+            self._csv = CsvFile(filename, obsname=obsname)
+            self.obsnames = self._csv.obsnames
+            self.nobs = self._csv.nobs
+            self.dtype = self._csv.dtype
 
-            self.data = None
+    @property
+    def data(self):
+        """
+        The observation data, read from the file the first time they are
+        used.
+
+        """
+        if self._data is None:
             self._read_data()
+        return self._data
+
+    @data.setter
+    def data(self, data):
+        self._data = data
+
+    def get_obsnames(self):
+        """
+        Get a list of observation names in the file
+
+        Returns
+        ----------
+        out : list of strings
+            List of observation names in the file. totim is not included in
+            the list of observation names.
+
+        """
+        return list(self.dtype.names[1:])
+
+    def iter_chunks(self, chunksize=10000, obsname=None):
+        if self._data is not None:
+            yield from super().iter_chunks(chunksize, obsname)
+        elif self._csv is not None:
+            yield from self._csv.iter_chunks(chunksize, obsname)
         else:
-            # read ascii data
-            csv = CsvFile(filename)
-            self.obsnames = csv.obsnames
-            self.nobs = csv.nobs
-            self.data = csv.data
+            names = ["totim"] + _select_obsnames(self.get_obsnames(), obsname)
+            records = self._get_memmap()
+            for i0 in range(0, records.shape[0], chunksize):
+                yield _copy_fields(records[i0 : i0 + chunksize], names)
+
+    iter_chunks.__doc__ = ObsFiles.iter_chunks.__doc__
+
+    def _get_memmap(self):
+        """
+        Map the records in a binary file into memory.
+
+        """
+        nrec = (
+            os.path.getsize(self.filename) - self._offset
+        ) // self._recdtype.itemsize
+        if nrec == 0:
+            return np.empty(0, dtype=self._recdtype)
+        return np.memmap(
+            self.filename,
+            dtype=self._recdtype,
+            mode="r",
+            offset=self._offset,
+            shape=(nrec,),
+        )
+
+    def _read_data(self):
+        if self._csv is not None:
+            self._data = self._csv.data
+            return
+        records = self._get_memmap()
+        if self.dtype.names != self._recdtype.names:
+            self._data = _copy_fields(records, self.dtype.names)
+        elif self.mmap:
+            self._data = records
+        else:
+            self._data = np.array(records)
+        return
 
     def _build_index(self):
         return
@@ -494,21 +693,54 @@ class CsvFile:
     delimiter : str
         optional delimiter for the csv or formatted text file,
         defaults to ","
+    obsname : str or list of str
+        optional observation names to read. Only the selected columns are
+        parsed. Defaults to None (all columns are read)
 
     """
 
-    def __init__(self, csvfile, delimiter=","):
+    def __init__(self, csvfile, delimiter=",", obsname=None):
 
         self.file = open(csvfile, "r")
+        self.filename = csvfile
         self.delimiter = delimiter
 
         # read header line
         line = self.file.readline()
-        self._header = line.rstrip().split(delimiter)
+        # column names are validated the same way as numpy.genfromtxt
+        # validates them, for example "EXT-INFLOW" becomes "EXTINFLOW"
+        self._header = _validate_names(line.rstrip().split(delimiter))
         self.floattype = "f8"
         self.dtype = _build_dtype(self._header, self.floattype)
+        if len(self.dtype) != len(self._header):
+            raise ValueError(
+                f"{csvfile} has {len(self._header)} columns, but "
+                f"{len(self.dtype)} fields are read: the file has no time "
+                "or totim column"
+            )
 
-        self.data = self.read_csv(self.file, self.dtype, delimiter)
+        # select the columns to read
+        self._usecols = None
+        if obsname is not None:
+            self._usecols = self._get_usecols(obsname)
+            self.dtype = self._get_dtype(self._usecols)
+        self._data = None
+
+    @property
+    def data(self):
+        """
+        The data in the selected columns, read from the file the first time
+        they are used.
+
+        Returns
+        -------
+        np.recarray
+        """
+        if self._data is None:
+            self._data = self.read_csv(
+                self.file, self.dtype, self.delimiter, self._usecols
+            )
+        return self._data
 
     @property
     def obsnames(self):
@@ -519,7 +751,7 @@ class CsvFile:
         -------
         list
         """
-        return [i for i in self._header if i.lower() != "totim"]
+        return [i for i in self.dtype.names if i.lower() != "totim"]
 
     @property
     def nobs(self):
@@ -532,8 +764,61 @@ class CsvFile:
         """
         return len(self.obsnames)
 
+    def _get_usecols(self, obsname):
+        """
+        Get the positions of totim and the selected observations in the
+        file.
+
+        """
+        names = set(_select_obsnames(self.obsnames, obsname))
+        return [
+            icol
+            for icol, name in enumerate(self._header)
+            if name.lower() == "totim" or name in names
+        ]
+
+    def _get_dtype(self, usecols):
+        """
+        Get the dtype of the selected columns.
+
+        """
+        names = [self._header[icol] for icol in usecols]
+        return np.dtype([(name, self.dtype.fields[name][0]) for name in names])
+
+    def iter_chunks(self, chunksize=10000, obsname=None):
+        """
+        Iterate over the rows of the file in blocks, so only one block is
+        held in memory.
+
+        Parameters
+        ----------
+        chunksize : int
+            The maximum number of rows in each block. (default is 10000)
+        obsname : str or list of str
+            The name of the observations to return. If obsname is None, the
+            observations selected when the file was opened are returned.
+            (default is None)
+
+        Yields
+        ------
+        np.recarray
+            Array with up to chunksize rows, with totim and the selected
+            observations.
+
+        """
+        usecols = self._usecols
+        dtype = self.dtype
+        if obsname is not None:
+            usecols = self._get_usecols(obsname)
+            dtype = self._get_dtype(usecols)
+        with open(self.filename, "r") as fobj:
+            fobj.readline()
+            yield from _iter_csv(
+                fobj, dtype, self.delimiter, usecols, chunksize
+            )
+
     @staticmethod
-    def read_csv(fobj, dtype, delimiter=","):
+    def read_csv(fobj, dtype, delimiter=",", usecols=None):
         """
 
         Parameters
@@ -544,13 +829,125 @@ class CsvFile:
         delimiter : str
             optional delimiter for the csv or formatted text file,
             defaults to ","
+        usecols : list of int
+            optional zero-based positions of the columns to read, in the
+            order of the fields in dtype. Defaults to None (all columns)
 
         Returns
         -------
         np.recarray
         """
-        arr = np.genfromtxt(fobj, dtype=dtype, delimiter=delimiter)
-        return arr.view(np.recarray)
+        pd = import_optional_dependency("pandas", errors="ignore")
+        if pd is None:
+            arr = np.genfromtxt(
+                fobj, dtype=dtype, delimiter=delimiter, usecols=usecols
+            )
+            return arr.view(np.recarray)
+        df = pd.read_csv(fobj, **_read_csv_kwargs(dtype, delimiter, usecols))
+        return _to_records(pd, df, dtype)
+
+
+def _read_csv_kwargs(dtype, delimiter, usecols):
+    """
+    Get the pandas.read_csv() arguments used to read csv files without a
+    header line.
+
+    """
+    kwargs = {
+        "header": None,
+        "names": list(dtype.names),
+        "usecols": usecols,
+        "float_precision": "round_trip",
+    }
+    if delimiter.isspace():
+        kwargs["delim_whitespace"] = True
+    else:
+        kwargs["sep"] = delimiter
+    return kwargs
+
+
+def _to_records(pd, df, dtype):
+    """
+    Convert a pandas DataFrame to a recarray with dtype.  Values that could
+    not be parsed as numbers are set to nan.
+
+    """
+    for name in df.columns:
+        if df[name].dtype == object:
+            df[name] = pd.to_numeric(df[name], errors="coerce")
+    arr = np.empty(len(df), dtype=dtype)
+    for name in dtype.names:
+        arr[name] = df[name].to_numpy()
+    return arr.view(np.recarray)
+
+
+def _iter_csv(fobj, dtype, delimiter=",", usecols=None, chunksize=10000):
+    """
+    Read the rows of a csv file in blocks of chunksize rows.
+
+    """
+    pd = import_optional_dependency("pandas", errors="ignore")
+    if pd is None:
+        while True:
+            lines = list(itertools.islice(fobj, chunksize))
+            if len(lines) == 0:
+                break
+            arr = np.genfromtxt(
+                lines, dtype=dtype, delimiter=delimiter, usecols=usecols
+            )
+            yield np.atleast_1d(arr).view(np.recarray)
+        return
+    reader = pd.read_csv(
+        fobj,
+        chunksize=chunksize,
+        **_read_csv_kwargs(dtype, delimiter, usecols),
+    )
+    for df in reader:
+        yield _to_records(pd, df, dtype)
+
+
+def _select_obsnames(obsnames, obsname=None):
+    """
+    Get the list of observation names to read from a file, in the order of
+    the observations in the file.
+
+    Parameters
+    ----------
+    obsnames : list of strings
+        The observation names in the file.
+    obsname : string or list of strings
+        The selected observation names.  All observations are selected if
+        obsname is None.
+
+    Returns
+    -------
+    out : list of strings
+
+    """
+    obsnames = list(obsnames)
+    if obsname is None:
+        return obsnames
+    if not isinstance(obsname, (list, tuple, np.ndarray)):
+        obsname = [obsname]
+    missing = [name for name in obsname if name not in obsnames]
+    if len(missing) > 0:
+        raise ValueError(f"observations {missing} are not in the file")
+    obsname = set(obsname)
+    return [name for name in obsnames if name in obsname]
+
+
+def _copy_fields(data, names):
+    """
+    Copy fields of a structured array to a new array with only these
+    fields.
+
+    """
+    arr = np.empty(
+        data.shape, dtype=np.dtype([(n, data.dtype[n]) for n in names])
+    )
+    for name in names:
+        arr[name] = data[name]
+    return arr
 
 
 def get_selection(data, names):
@@ -584,6 +981,48 @@ def get_selection(data, names):
     return np.ndarray(data.shape, dtype2, data, 0, data.strides)
 
 
+def _validate_names(names):
+    """
+    Validate column names the same way numpy.genfromtxt does: spaces are
+    replaced with underscores, characters that are not valid in field names
+    are removed, empty names are replaced with "f0", "f1", ..., and
+    duplicate names get a "_1", "_2", ... suffix.
+
+    Parameters
+    ----------
+    names : list of str
+        column names
+
+    Returns
+    -------
+    list of str
+
+    """
+    deletechars = set(r"""~!@#$%^&*()-=+~\|]}[{';: /?.>,<""")
+    excludelist = ("return", "file", "print")
+    validated = []
+    seen = {}
+    nempty = 0
+    for name in names:
+        name = name.strip().replace(" ", "_")
+        name = "".join(c for c in name if c not in deletechars)
+        if name == "":
+            name = f"f{nempty}"
+            while name in names:
+                nempty += 1
+                name = f"f{nempty}"
+            nempty += 1
+        elif name in excludelist:
+            name += "_"
+        count = seen.get(name, 0)
+        if count > 0:
+            validated.append(f"{name}_{count}")
+        else:
+            validated.append(name)
+        seen[name] = count + 1
+    return validated
+
+
 def _build_dtype(obsnames, floattype="f4"):
     """
     Generic method to build observation file dtypes
@@ -1,7 +1,8 @@
 import os
 import copy
 import numpy as np
-from itertools import groupby
+from concurrent.futures import ProcessPoolExecutor
+from itertools import groupby, repeat
 from .utils_def import totim_to_datetime
 from . import import_optional_dependency
 
@@ -28,6 +29,13 @@ class ZoneBudget:
         When using this option in conjunction with a list of zones, the
         zone(s) passed may either be all strings (aliases), all integers,
         or mixed.
+    n_workers : int
+        Number of processes used to compute the budgets. The time steps are
+        partitioned across the processes and each process opens its own
+        CellBudgetFile with the model grid of cbc_file. The budgets are
+        identical to the budgets computed with a single process. Budgets
+        of cell budget files opened with a model or dis object are
+        computed with a single process. (Default is 1.)
 
     Returns
     -------
@@ -51,8 +59,51 @@ class ZoneBudget:
         totim=None,
         aliases=None,
         verbose=False,
+        n_workers=1,
         **kwargs,
     ):
+        self._setup(cbc_file, z, kstpkper, totim, aliases, **kwargs)
+
+        # Update budget record array
+        if self.kstpkper is not None:
+            nsteps = len(self.kstpkper)
+        else:
+            nsteps = len(self.totim)
+        # the discretization object of the cell budget file can not be
+        # passed to other processes, so these budgets are computed in this
+        # process
+        if n_workers > 1 and nsteps > 1 and self.cbc.dis is None:
+            if verbose:
+                print(
+                    f"Computing the budget for {nsteps} times "
+                    f"using {min(n_workers, nsteps)} processes"
+                )
+            self._compute_budget_parallel(aliases, n_workers)
+        elif self.kstpkper is not None:
+            for kk in self.kstpkper:
+                if verbose:
+                    s = (
+                        "Computing the budget for"
+                        " time step {} in stress period {}".format(
+                            kk[0] + 1, kk[1] + 1
+                        )
+                    )
+                    print(s)
+                self._compute_budget(kstpkper=kk)
+        elif self.totim is not None:
+            for t in self.totim:
+                if verbose:
+                    s = f"Computing the budget for time {t}"
+                    print(s)
+                self._compute_budget(totim=t)
+
+    def _setup(self, cbc_file, z, kstpkper, totim, aliases, **kwargs):
+        """
+        Check the cell budget file and zone array, and initialize the
+        budget record array and the zone-interface index without computing
+        the budget.
+
+        """
         from .binaryfile import CellBudgetFile
 
         if isinstance(cbc_file, CellBudgetFile):
@@ -213,28 +264,148 @@ class ZoneBudget:
                     kstpkper=None, totim=t
                 )
                 array_list.append(recordarray)
+        self._nrows = array_list[0].shape[0]
         self._budget = np.concatenate(array_list, axis=0)
 
-        # Update budget record array
+        # Build the zone-interface index used for all of the time steps
+        self._build_zone_index()
+        return
+
+    def _build_zone_index(self):
+        """
+        Build the zone-interface index that is used to compute the budget
+        for each time step.  The index only depends on the zone array, so it
+        is built once and each time step only gathers the face flows on the
+        zone interfaces and sums them by zone pair.
+
+        """
+        nzones = len(self.allzones)
+        self._nzones = nzones
+        self._zoneidx = np.searchsorted(self.allzones, self.izone)
+        self._nonzero = (self.allzones != 0).astype(np.float64)
+
+        # row of each budget term in the budget of a time step
+        names = self._budget["name"][: self._nrows]
+        self._rowidx = {name: i for i, name in enumerate(names)}
+        zonenames = ["_".join(n.split()) for n in self._zonenamedict.values()]
+        self._from_rows = np.array(
+            [self._rowidx[f"FROM_{n}"] for n in zonenames], dtype=int
+        )
+        self._to_rows = np.array(
+            [self._rowidx[f"TO_{n}"] for n in zonenames], dtype=int
+        )
+
+        # faces between cells in different zones for the face flows along
+        # each axis (0 is FLOW LOWER FACE, 1 is FLOW FRONT FACE and 2 is
+        # FLOW RIGHT FACE).  The face flow is stored in the first cell (a)
+        # and is positive for flow from cell a to cell b.
+        cells = np.arange(self.izone.size).reshape(self.cbc_shape)
+        zoneidx = self._zoneidx.ravel()
+        self._faces = {}
+        for axis in range(3):
+            if self.cbc_shape[axis] < 2:
+                continue
+            sa = [slice(None)] * 3
+            sb = [slice(None)] * 3
+            sa[axis] = slice(None, -1)
+            sb[axis] = slice(1, None)
+            sa, sb = tuple(sa), tuple(sb)
+            fa = cells[sa].ravel()
+            fb = cells[sb].ravel()
+            za = zoneidx[fa]
+            zb = zoneidx[fb]
+            iface = np.where(za != zb)[0]
+            self._faces[axis] = (
+                sa,
+                sb,
+                fa[iface],
+                fb[iface],
+                za[iface] * nzones + zb[iface],
+                zb[iface] * nzones + za[iface],
+            )
+        return
+
+    def _compute_budget_parallel(self, aliases, n_workers):
+        """
+        Compute the budgets with a pool of processes. The time steps are
+        split into contiguous blocks, one for each process, and the budget
+        record arrays of the blocks are concatenated in order.
+
+        Parameters
+        ----------
+        aliases : dict
+            A dictionary with key, value pairs of zones and aliases.
+        n_workers : int
+            Number of processes.
+
+        Returns
+        -------
+        None
+
+        """
         if self.kstpkper is not None:
-            for kk in self.kstpkper:
-                if verbose:
-                    s = (
-                        "Computing the budget for"
-                        " time step {} in stress period {}".format(
-                            kk[0] + 1, kk[1] + 1
-                        )
-                    )
-                    print(s)
-                self._compute_budget(kstpkper=kk)
-        elif self.totim is not None:
-            for t in self.totim:
-                if verbose:
-                    s = f"Computing the budget for time {t}"
-                    print(s)
-                self._compute_budget(totim=t)
+            key, steps = "kstpkper", self.kstpkper
+        else:
+            key, steps = "totim", self.totim
+        n_workers = min(n_workers, len(steps))
+        blocks = [
+            {key: [steps[i] for i in block]}
+            for block in np.array_split(np.arange(len(steps)), n_workers)
+        ]
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            budgets = list(
+                pool.map(
+                    _compute_budget_worker,
+                    repeat(self.cbc.filename),
+                    repeat(self.cbc.precision),
+                    repeat(self.cbc.modelgrid),
+                    repeat(self.izone),
+                    repeat(aliases),
+                    blocks,
+                )
+            )
+        self._budget = np.concatenate(budgets, axis=0)
+        return
+
+    def _read_budget_records(self, kstpkper=None, totim=None):
+        """
+        Read the cell-by-cell budget records that are used to compute the
+        budget for a single time step/stress period or time.  The records
+        do not depend on the zone array, so they can be used to compute the
+        budget for more than one zone array.
+
+        Parameters
+        ----------
+        kstpkper : tuple
+            Tuple of kstp and kper to read the records for (default is
+            None).
+        totim : float
+            Totim to read the records for (default is None).
+
+        Returns
+        -------
+        records : dict
+            Dictionary of record names and data.  Constant-head records
+            are full 3D arrays and the data is None for source/sink terms
+            that are not in the file for the time step.
 
-    def _compute_budget(self, kstpkper=None, totim=None):
+        """
+        records = {}
+        for recname in self.record_names:
+            full3D = recname in ("CONSTANT HEAD", "SWIADDTOCH")
+            data = self.cbc.get_data(
+                text=recname, full3D=full3D, kstpkper=kstpkper, totim=totim
+            )
+            if len(data) == 0:
+                # Empty data, can occur during the first time step of a
+                # transient model when storage terms are zero and not in
+                # the cell-budget file.
+                records[recname] = None
+            else:
+                records[recname] = data[0]
+        return records
+
+    def _compute_budget(self, kstpkper=None, totim=None, records=None):
         """
         Creates a budget for the specified zone array. This function only
         supports the use of a single time step/stress period or time.
@@ -245,18 +416,26 @@ class ZoneBudget:
             Tuple of kstp and kper to compute budget for (default is None).
         totim : float
             Totim to compute budget for (default is None).
+        records : dict
+            Cell-by-cell budget records from _read_budget_records(). If None,
+            the records are read from the cell budget file (default is
+            None).
 
         Returns
         -------
         None
 
         """
+        if records is None:
+            records = self._read_budget_records(kstpkper, totim)
+        budget = np.zeros((self._nrows, self._nzones), dtype=np.float64)
+
         # Initialize an array to track where the constant head cells
         # are located.
-        ich = np.zeros(self.cbc_shape, self.int_type)
-        swiich = np.zeros(self.cbc_shape, self.int_type)
+        ich = np.zeros(self.cbc_shape, dtype=bool)
+        swiich = np.zeros(self.cbc_shape, dtype=bool)
 
-        if "CONSTANT HEAD" in self.record_names:
+        if records.get("CONSTANT HEAD") is not None:
             """
             C-----CONSTANT-HEAD FLOW -- DON'T ACCUMULATE THE CELL-BY-CELL VALUES FOR
             C-----CONSTANT-HEAD FLOW BECAUSE THEY MAY INCLUDE PARTIALLY CANCELING
@@ -264,39 +443,35 @@ class ZoneBudget:
             C-----HEAD CELLS ARE AND THEN USE FACE FLOWS TO DETERMINE THE AMOUNT OF
             C-----FLOW.  STORE CONSTANT-HEAD LOCATIONS IN ICH ARRAY.
             """
-            chd = self.cbc.get_data(
-                text="CONSTANT HEAD",
-                full3D=True,
-                kstpkper=kstpkper,
-                totim=totim,
-            )[0]
-            ich[np.ma.where(chd != 0.0)] = 1
-        if "FLOW RIGHT FACE" in self.record_names:
-            self._accumulate_flow_frf("FLOW RIGHT FACE", ich, kstpkper, totim)
-        if "FLOW FRONT FACE" in self.record_names:
-            self._accumulate_flow_fff("FLOW FRONT FACE", ich, kstpkper, totim)
-        if "FLOW LOWER FACE" in self.record_names:
-            self._accumulate_flow_flf("FLOW LOWER FACE", ich, kstpkper, totim)
-        if "SWIADDTOCH" in self.record_names:
-            swichd = self.cbc.get_data(
-                text="SWIADDTOCH", full3D=True, kstpkper=kstpkper, totim=totim
-            )[0]
-            swiich[swichd != 0] = 1
-        if "SWIADDTOFRF" in self.record_names:
-            self._accumulate_flow_frf("SWIADDTOFRF", swiich, kstpkper, totim)
-        if "SWIADDTOFFF" in self.record_names:
-            self._accumulate_flow_fff("SWIADDTOFFF", swiich, kstpkper, totim)
-        if "SWIADDTOFLF" in self.record_names:
-            self._accumulate_flow_flf("SWIADDTOFLF", swiich, kstpkper, totim)
+            ich = np.ma.filled(records["CONSTANT HEAD"] != 0.0, False)
+        for recname, axis in (
+            ("FLOW RIGHT FACE", 2),
+            ("FLOW FRONT FACE", 1),
+            ("FLOW LOWER FACE", 0),
+        ):
+            if records.get(recname) is not None:
+                self._accumulate_faceflow(budget, records[recname], axis, ich)
+        if records.get("SWIADDTOCH") is not None:
+            swiich = np.ma.filled(records["SWIADDTOCH"] != 0, False)
+        for recname, axis in (
+            ("SWIADDTOFRF", 2),
+            ("SWIADDTOFFF", 1),
+            ("SWIADDTOFLF", 0),
+        ):
+            if records.get(recname) is not None:
+                self._accumulate_faceflow(
+                    budget, records[recname], axis, swiich
+                )
 
         # NOT AN INTERNAL FLOW TERM, SO MUST BE A SOURCE TERM OR STORAGE
         # ACCUMULATE THE FLOW BY ZONE
         # iterate over remaining items in the list
         for recname in self.ssst_record_names:
-            self._accumulate_flow_ssst(recname, kstpkper, totim)
+            if records.get(recname) is not None:
+                self._accumulate_flow_ssst(budget, recname, records[recname])
 
-        # Compute mass balance terms
-        self._compute_mass_balance(kstpkper, totim)
+        # Compute mass balance terms and store the budget
+        self._compute_mass_balance(budget, kstpkper, totim)
 
         return
 
@@ -434,732 +609,152 @@ class ZoneBudget:
         )
         return recordarray
 
-    @staticmethod
-    def _filter_circular_flow(fz, tz, f):
+    def _add_to_row(self, budget, name, flux):
         """
-
-        Parameters
-        ----------
-        fz
-        tz
-        f
-
-        Returns
-        -------
+        Add the flux for each zone to a row of the budget of a time step.
+        Rows that are not part of the budget are skipped.
 
         """
-        e = np.equal(fz, tz)
-        fz = fz[np.logical_not(e)]
-        tz = tz[np.logical_not(e)]
-        f = f[np.logical_not(e)]
-        return fz, tz, f
-
-    def _update_budget_fromfaceflow(
-        self, fz, tz, f, kstpkper=None, totim=None
-    ):
-        """
-
-        Parameters
-        ----------
-        fz
-        tz
-        f
-        kstpkper
-        totim
-
-        Returns
-        -------
-
-        """
-
-        # No circular flow within zones
-        fz, tz, f = self._filter_circular_flow(fz, tz, f)
-
-        if len(f) == 0:
-            return
-
-        # Inflows
-        idx = tz != 0
-        fzi = fz[idx]
-        tzi = tz[idx]
-        rownames = ["FROM_" + self._zonenamedict[z] for z in fzi]
-        colnames = [self._zonenamedict[z] for z in tzi]
-        fluxes = f[idx]
-        self._update_budget_recordarray(
-            rownames, colnames, fluxes, kstpkper, totim
-        )
-
-        # Outflows
-        idx = fz != 0
-        fzi = fz[idx]
-        tzi = tz[idx]
-        rownames = ["TO_" + self._zonenamedict[z] for z in tzi]
-        colnames = [self._zonenamedict[z] for z in fzi]
-        fluxes = f[idx]
-        self._update_budget_recordarray(
-            rownames, colnames, fluxes, kstpkper, totim
-        )
+        irow = self._rowidx.get(name)
+        if irow is not None:
+            budget[irow] += flux
         return
 
-    def _update_budget_fromssst(self, fz, tz, f, kstpkper=None, totim=None):
+    def _accumulate_faceflow(self, budget, data, axis, ich):
         """
+        Accumulate the face flows between zones and the flows to and from
+        constant-head cells for a face flow record.
 
         Parameters
         ----------
-        fz
-        tz
-        f
-        kstpkper
-        totim
-
-        Returns
-        -------
-
-        """
-        if len(f) == 0:
-            return
-        self._update_budget_recordarray(fz, tz, f, kstpkper, totim)
-        return
-
-    def _update_budget_recordarray(
-        self, rownames, colnames, fluxes, kstpkper=None, totim=None
-    ):
-        """
-        Update the budget record array with the flux for the specified
-        flow direction (in/out), record name, and column.
-
-        Parameters
-        ----------
-        rownames
-        colnames
-        fluxes
-        kstpkper
-        totim
+        budget : numpy array
+            Budget of the time step, with a row for each budget term and a
+            column for each zone.
+        data : numpy array
+            Face flow record.
+        axis : int
+            Axis of the face flow record.
+        ich : numpy array
+            Boolean array that is True for constant-head cells.
 
         Returns
         -------
         None
 
         """
-        try:
-
-            if kstpkper is not None:
-                for rn, cn, flux in zip(rownames, colnames, fluxes):
-                    rowidx = np.where(
-                        (self._budget["time_step"] == kstpkper[0])
-                        & (self._budget["stress_period"] == kstpkper[1])
-                        & (self._budget["name"] == rn)
-                    )
-                    self._budget[cn][rowidx] += flux
-            elif totim is not None:
-                for rn, cn, flux in zip(rownames, colnames, fluxes):
-                    rowidx = np.where(
-                        (self._budget["totim"] == totim)
-                        & (self._budget["name"] == rn)
-                    )
-                    self._budget[cn][rowidx] += flux
-
-        except Exception as e:
-            print(e)
-            raise
-        return
-
-    def _accumulate_flow_frf(self, recname, ich, kstpkper, totim):
-        """
-
-        Parameters
-        ----------
-        recname
-        ich
-        kstpkper
-        totim
-
-        Returns
-        -------
-
-        """
-        try:
-            if self.ncol >= 2:
-                data = self.cbc.get_data(
-                    text=recname, kstpkper=kstpkper, totim=totim
-                )[0]
-
-                # "FLOW RIGHT FACE"  COMPUTE FLOW BETWEEN ZONES ACROSS COLUMNS.
-                # COMPUTE FLOW ONLY BETWEEN A ZONE AND A HIGHER ZONE -- FLOW FROM
-                # ZONE 4 TO 3 IS THE NEGATIVE OF FLOW FROM 3 TO 4.
-                # 1ST, CALCULATE FLOW BETWEEN NODE J,I,K AND J-1,I,K
-
-                k, i, j = np.where(
-                    self.izone[:, :, 1:] > self.izone[:, :, :-1]
-                )
-
-                # Adjust column values to account for the starting position of "nz"
-                j += 1
-
-                # Define the zone to which flow is going
-                nz = self.izone[k, i, j]
-
-                # Define the zone from which flow is coming
-                jl = j - 1
-                nzl = self.izone[k, i, jl]
-
-                # Get the face flow
-                q = data[k, i, jl]
-
-                # Get indices where flow face values are positive (flow out of higher zone)
-                # Don't include CH to CH flow (can occur if CHTOCH option is used)
-                # Create an iterable tuple of (from zone, to zone, flux)
-                # Then group tuple by (from_zone, to_zone) and sum the flux values
-                idx = np.where(
-                    (q > 0) & ((ich[k, i, j] != 1) | (ich[k, i, jl] != 1))
-                )
-                fzi, tzi, fi = sum_flux_tuples(nzl[idx], nz[idx], q[idx])
-                self._update_budget_fromfaceflow(
-                    fzi, tzi, np.abs(fi), kstpkper, totim
-                )
-
-                # Get indices where flow face values are negative (flow into higher zone)
-                # Don't include CH to CH flow (can occur if CHTOCH option is used)
-                # Create an iterable tuple of (from zone, to zone, flux)
-                # Then group tuple by (from_zone, to_zone) and sum the flux values
-                idx = np.where(
-                    (q < 0) & ((ich[k, i, j] != 1) | (ich[k, i, jl] != 1))
-                )
-                fzi, tzi, fi = sum_flux_tuples(nz[idx], nzl[idx], q[idx])
-                self._update_budget_fromfaceflow(
-                    fzi, tzi, np.abs(fi), kstpkper, totim
-                )
-
-                # FLOW BETWEEN NODE J,I,K AND J+1,I,K
-                k, i, j = np.where(
-                    self.izone[:, :, :-1] > self.izone[:, :, 1:]
-                )
-
-                # Define the zone from which flow is coming
-                nz = self.izone[k, i, j]
-
-                # Define the zone to which flow is going
-                jr = j + 1
-                nzr = self.izone[k, i, jr]
-
-                # Get the face flow
-                q = data[k, i, j]
-
-                # Get indices where flow face values are positive (flow out of higher zone)
-                # Don't include CH to CH flow (can occur if CHTOCH option is used)
-                # Create an iterable tuple of (from zone, to zone, flux)
-                # Then group tuple by (from_zone, to_zone) and sum the flux values
-                idx = np.where(
-                    (q > 0) & ((ich[k, i, j] != 1) | (ich[k, i, jr] != 1))
-                )
-                fzi, tzi, fi = sum_flux_tuples(nz[idx], nzr[idx], q[idx])
-                self._update_budget_fromfaceflow(
-                    fzi, tzi, np.abs(fi), kstpkper, totim
-                )
-
-                # Get indices where flow face values are negative (flow into higher zone)
-                # Don't include CH to CH flow (can occur if CHTOCH option is used)
-                # Create an iterable tuple of (from zone, to zone, flux)
-                # Then group tuple by (from_zone, to_zone) and sum the flux values
-                idx = np.where(
-                    (q < 0) & ((ich[k, i, j] != 1) | (ich[k, i, jr] != 1))
-                )
-                fzi, tzi, fi = sum_flux_tuples(nzr[idx], nz[idx], q[idx])
-                self._update_budget_fromfaceflow(
-                    fzi, tzi, np.abs(fi), kstpkper, totim
-                )
-
-                # CALCULATE FLOW TO CONSTANT-HEAD CELLS IN THIS DIRECTION
-                k, i, j = np.where(ich == 1)
-                k, i, j = k[j > 0], i[j > 0], j[j > 0]
-                jl = j - 1
-                nzl = self.izone[k, i, jl]
-                nz = self.izone[k, i, j]
-                q = data[k, i, jl]
-                idx = np.where(
-                    (q > 0) & ((ich[k, i, j] != 1) | (ich[k, i, jl] != 1))
-                )
-                fzi, tzi, f = sum_flux_tuples(nzl[idx], nz[idx], q[idx])
-                fz = ["TO_CONSTANT_HEAD"] * len(tzi)
-                tz = [self._zonenamedict[z] for z in tzi]
-                self._update_budget_fromssst(
-                    fz, tz, np.abs(f), kstpkper, totim
-                )
-
-                idx = np.where(
-                    (q < 0) & ((ich[k, i, j] != 1) | (ich[k, i, jl] != 1))
-                )
-                fzi, tzi, f = sum_flux_tuples(nzl[idx], nz[idx], q[idx])
-                fz = ["FROM_CONSTANT_HEAD"] * len(fzi)
-                tz = [self._zonenamedict[z] for z in tzi[tzi != 0]]
-                self._update_budget_fromssst(
-                    fz, tz, np.abs(f), kstpkper, totim
-                )
-
-                k, i, j = np.where(ich == 1)
-                k, i, j = (
-                    k[j < self.ncol - 1],
-                    i[j < self.ncol - 1],
-                    j[j < self.ncol - 1],
-                )
-                nz = self.izone[k, i, j]
-                jr = j + 1
-                nzr = self.izone[k, i, jr]
-                q = data[k, i, j]
-                idx = np.where(
-                    (q > 0) & ((ich[k, i, j] != 1) | (ich[k, i, jr] != 1))
-                )
-                fzi, tzi, f = sum_flux_tuples(nzr[idx], nz[idx], q[idx])
-                fz = ["FROM_CONSTANT_HEAD"] * len(tzi)
-                tz = [self._zonenamedict[z] for z in tzi]
-                self._update_budget_fromssst(
-                    fz, tz, np.abs(f), kstpkper, totim
-                )
-
-                idx = np.where(
-                    (q < 0) & ((ich[k, i, j] != 1) | (ich[k, i, jr] != 1))
-                )
-                fzi, tzi, f = sum_flux_tuples(nzr[idx], nz[idx], q[idx])
-                fz = ["TO_CONSTANT_HEAD"] * len(fzi)
-                tz = [self._zonenamedict[z] for z in tzi]
-                self._update_budget_fromssst(
-                    fz, tz, np.abs(f), kstpkper, totim
-                )
-
-        except Exception as e:
-            print(e)
-            raise
-        return
-
-    def _accumulate_flow_fff(self, recname, ich, kstpkper, totim):
-        """
-
-        Parameters
-        ----------
-        recname
-        ich
-        kstpkper
-        totim
-
-        Returns
-        -------
-
-        """
-        try:
-            if self.nrow >= 2:
-                data = self.cbc.get_data(
-                    text=recname, kstpkper=kstpkper, totim=totim
-                )[0]
-
-                # "FLOW FRONT FACE"
-                # CALCULATE FLOW BETWEEN NODE J,I,K AND J,I-1,K
-                k, i, j = np.where(
-                    self.izone[:, 1:, :] < self.izone[:, :-1, :]
-                )
-                i += 1
-                ia = i - 1
-                nza = self.izone[k, ia, j]
-                nz = self.izone[k, i, j]
-                q = data[k, ia, j]
-                idx = np.where(
-                    (q > 0) & ((ich[k, i, j] != 1) | (ich[k, ia, j] != 1))
-                )
-                fzi, tzi, fi = sum_flux_tuples(nza[idx], nz[idx], q[idx])
-                self._update_budget_fromfaceflow(
-                    fzi, tzi, np.abs(fi), kstpkper, totim
-                )
-
-                idx = np.where(
-                    (q < 0) & ((ich[k, i, j] != 1) | (ich[k, ia, j] != 1))
-                )
-                fzi, tzi, fi = sum_flux_tuples(nz[idx], nza[idx], q[idx])
-                self._update_budget_fromfaceflow(
-                    fzi, tzi, np.abs(fi), kstpkper, totim
-                )
-
-                # CALCULATE FLOW BETWEEN NODE J,I,K AND J,I+1,K.
-                k, i, j = np.where(
-                    self.izone[:, :-1, :] < self.izone[:, 1:, :]
-                )
-                nz = self.izone[k, i, j]
-                ib = i + 1
-                nzb = self.izone[k, ib, j]
-                q = data[k, i, j]
-                idx = np.where(
-                    (q > 0) & ((ich[k, i, j] != 1) | (ich[k, ib, j] != 1))
-                )
-                fzi, tzi, fi = sum_flux_tuples(nz[idx], nzb[idx], q[idx])
-                self._update_budget_fromfaceflow(
-                    fzi, tzi, np.abs(fi), kstpkper, totim
-                )
-
-                idx = np.where(
-                    (q < 0) & ((ich[k, i, j] != 1) | (ich[k, ib, j] != 1))
-                )
-                fzi, tzi, fi = sum_flux_tuples(nzb[idx], nz[idx], q[idx])
-                self._update_budget_fromfaceflow(
-                    fzi, tzi, np.abs(fi), kstpkper, totim
-                )
-
-                # CALCULATE FLOW TO CONSTANT-HEAD CELLS IN THIS DIRECTION
-                k, i, j = np.where(ich == 1)
-                k, i, j = k[i > 0], i[i > 0], j[i > 0]
-                ia = i - 1
-                nza = self.izone[k, ia, j]
-                nz = self.izone[k, i, j]
-                q = data[k, ia, j]
-                idx = np.where(
-                    (q > 0) & ((ich[k, i, j] != 1) | (ich[k, ia, j] != 1))
-                )
-                fzi, tzi, f = sum_flux_tuples(nza[idx], nz[idx], q[idx])
-                fz = ["TO_CONSTANT_HEAD"] * len(tzi)
-                tz = [self._zonenamedict[z] for z in tzi]
-                self._update_budget_fromssst(
-                    fz, tz, np.abs(f), kstpkper, totim
-                )
-
-                idx = np.where(
-                    (q < 0) & ((ich[k, i, j] != 1) | (ich[k, ia, j] != 1))
-                )
-                fzi, tzi, f = sum_flux_tuples(nza[idx], nz[idx], q[idx])
-                fz = ["FROM_CONSTANT_HEAD"] * len(fzi)
-                tz = [self._zonenamedict[z] for z in tzi]
-                self._update_budget_fromssst(
-                    fz, tz, np.abs(f), kstpkper, totim
-                )
-
-                k, i, j = np.where(ich == 1)
-                k, i, j = (
-                    k[i < self.nrow - 1],
-                    i[i < self.nrow - 1],
-                    j[i < self.nrow - 1],
-                )
-                nz = self.izone[k, i, j]
-                ib = i + 1
-                nzb = self.izone[k, ib, j]
-                q = data[k, i, j]
-                idx = np.where(
-                    (q > 0) & ((ich[k, i, j] != 1) | (ich[k, ib, j] != 1))
-                )
-                fzi, tzi, f = sum_flux_tuples(nzb[idx], nz[idx], q[idx])
-                fz = ["FROM_CONSTANT_HEAD"] * len(tzi)
-                tz = [self._zonenamedict[z] for z in tzi]
-                self._update_budget_fromssst(
-                    fz, tz, np.abs(f), kstpkper, totim
-                )
-
-                idx = np.where(
-                    (q < 0) & ((ich[k, i, j] != 1) | (ich[k, ib, j] != 1))
-                )
-                fzi, tzi, f = sum_flux_tuples(nzb[idx], nz[idx], q[idx])
-                fz = ["TO_CONSTANT_HEAD"] * len(fzi)
-                tz = [self._zonenamedict[z] for z in tzi]
-                self._update_budget_fromssst(
-                    fz, tz, np.abs(f), kstpkper, totim
-                )
-
-        except Exception as e:
-            print(e)
-            raise
-        return
-
-    def _accumulate_flow_flf(self, recname, ich, kstpkper, totim):
-        """
-
-        Parameters
-        ----------
-        recname
-        ich
-        kstpkper
-        totim
-
-        Returns
-        -------
-
-        """
-        try:
-            if self.nlay >= 2:
-                data = self.cbc.get_data(
-                    text=recname, kstpkper=kstpkper, totim=totim
-                )[0]
-
-                # "FLOW LOWER FACE"
-                # CALCULATE FLOW BETWEEN NODE J,I,K AND J,I,K-1
-                k, i, j = np.where(
-                    self.izone[1:, :, :] < self.izone[:-1, :, :]
-                )
-                k += 1
-                ka = k - 1
-                nza = self.izone[ka, i, j]
-                nz = self.izone[k, i, j]
-                q = data[ka, i, j]
-                idx = np.where(
-                    (q > 0) & ((ich[k, i, j] != 1) | (ich[ka, i, j] != 1))
-                )
-                fzi, tzi, fi = sum_flux_tuples(nza[idx], nz[idx], q[idx])
-                self._update_budget_fromfaceflow(
-                    fzi, tzi, np.abs(fi), kstpkper, totim
-                )
-
-                idx = np.where(
-                    (q < 0) & ((ich[k, i, j] != 1) | (ich[ka, i, j] != 1))
-                )
-                fzi, tzi, fi = sum_flux_tuples(nz[idx], nza[idx], q[idx])
-                self._update_budget_fromfaceflow(
-                    fzi, tzi, np.abs(fi), kstpkper, totim
-                )
-
-                # CALCULATE FLOW BETWEEN NODE J,I,K AND J,I,K+1
-                k, i, j = np.where(
-                    self.izone[:-1, :, :] < self.izone[1:, :, :]
-                )
-                nz = self.izone[k, i, j]
-                kb = k + 1
-                nzb = self.izone[kb, i, j]
-                q = data[k, i, j]
-                idx = np.where(
-                    (q > 0) & ((ich[k, i, j] != 1) | (ich[kb, i, j] != 1))
-                )
-                fzi, tzi, fi = sum_flux_tuples(nz[idx], nzb[idx], q[idx])
-                self._update_budget_fromfaceflow(
-                    fzi, tzi, np.abs(fi), kstpkper, totim
-                )
-
-                idx = np.where(
-                    (q < 0) & ((ich[k, i, j] != 1) | (ich[kb, i, j] != 1))
-                )
-                fzi, tzi, fi = sum_flux_tuples(nzb[idx], nz[idx], q[idx])
-                self._update_budget_fromfaceflow(
-                    fzi, tzi, np.abs(fi), kstpkper, totim
-                )
-
-                # CALCULATE FLOW TO CONSTANT-HEAD CELLS IN THIS DIRECTION
-                k, i, j = np.where(ich == 1)
-                k, i, j = k[k > 0], i[k > 0], j[k > 0]
-                ka = k - 1
-                nza = self.izone[ka, i, j]
-                nz = self.izone[k, i, j]
-                q = data[ka, i, j]
-                idx = np.where(
-                    (q > 0) & ((ich[k, i, j] != 1) | (ich[ka, i, j] != 1))
-                )
-                fzi, tzi, f = sum_flux_tuples(nza[idx], nz[idx], q[idx])
-                fz = ["TO_CONSTANT_HEAD"] * len(tzi)
-                tz = [self._zonenamedict[z] for z in tzi]
-                self._update_budget_fromssst(
-                    fz, tz, np.abs(f), kstpkper, totim
-                )
-
-                idx = np.where(
-                    (q < 0) & ((ich[k, i, j] != 1) | (ich[ka, i, j] != 1))
-                )
-                fzi, tzi, f = sum_flux_tuples(nza[idx], nz[idx], q[idx])
-                fz = ["FROM_CONSTANT_HEAD"] * len(fzi)
-                tz = [self._zonenamedict[z] for z in tzi]
-                self._update_budget_fromssst(
-                    fz, tz, np.abs(f), kstpkper, totim
-                )
-
-                k, i, j = np.where(ich == 1)
-                k, i, j = (
-                    k[k < self.nlay - 1],
-                    i[k < self.nlay - 1],
-                    j[k < self.nlay - 1],
-                )
-                nz = self.izone[k, i, j]
-                kb = k + 1
-                nzb = self.izone[kb, i, j]
-                q = data[k, i, j]
-                idx = np.where(
-                    (q > 0) & ((ich[k, i, j] != 1) | (ich[kb, i, j] != 1))
-                )
-                fzi, tzi, f = sum_flux_tuples(nzb[idx], nz[idx], q[idx])
-                fz = ["FROM_CONSTANT_HEAD"] * len(tzi)
-                tz = [self._zonenamedict[z] for z in tzi]
-                self._update_budget_fromssst(
-                    fz, tz, np.abs(f), kstpkper, totim
-                )
-
-                idx = np.where(
-                    (q < 0) & ((ich[k, i, j] != 1) | (ich[kb, i, j] != 1))
-                )
-                fzi, tzi, f = sum_flux_tuples(nzb[idx], nz[idx], q[idx])
-                fz = ["TO_CONSTANT_HEAD"] * len(fzi)
-                tz = [self._zonenamedict[z] for z in tzi]
-                self._update_budget_fromssst(
-                    fz, tz, np.abs(f), kstpkper, totim
-                )
-
-        except Exception as e:
-            print(e)
-            raise
+        if axis not in self._faces:
+            return
+        sa, sb, fa, fb, code_ab, code_ba = self._faces[axis]
+        nzones = self._nzones
+        data = np.ma.filled(data, 0.0)
+
+        # FLOW BETWEEN ZONES.  Don't include CH to CH flow (can occur if
+        # CHTOCH option is used).  Positive face flows are from the zone of
+        # cell a to the zone of cell b.
+        q = data.ravel()[fa]
+        ichf = ich.ravel()
+        valid = ~(ichf[fa] & ichf[fb])
+        pos = valid & (q > 0)
+        neg = valid & (q < 0)
+        flow = np.bincount(
+            np.concatenate((code_ab[pos], code_ba[neg])),
+            weights=np.concatenate((q[pos], -q[neg])),
+            minlength=nzones * nzones,
+        ).reshape(nzones, nzones)
+        # Inflows to each zone from the other zones and outflows from each
+        # zone to the other zones.  There are no inflows to zone 0.
+        budget[self._from_rows] += flow * self._nonzero
+        budget[self._to_rows] += flow.T * self._nonzero
+
+        # CALCULATE FLOW TO AND FROM CONSTANT-HEAD CELLS IN THIS DIRECTION
+        if not np.any(ich):
+            return
+        icha = ich[sa]
+        ichb = ich[sb]
+        qa = data[sa]
+        to_ch = np.zeros(nzones)
+        from_ch = np.zeros(nzones)
+        for ichcell, zone, sign in (
+            (ichb & ~icha, self._zoneidx[sb], 1.0),
+            (icha & ~ichb, self._zoneidx[sa], -1.0),
+        ):
+            qc = sign * qa[ichcell]
+            zc = zone[ichcell]
+            to_ch += np.bincount(zc[qc > 0], qc[qc > 0], minlength=nzones)
+            from_ch -= np.bincount(zc[qc < 0], qc[qc < 0], minlength=nzones)
+        self._add_to_row(budget, "TO_CONSTANT_HEAD", to_ch)
+        self._add_to_row(budget, "FROM_CONSTANT_HEAD", from_ch)
         return
 
-    def _accumulate_flow_ssst(self, recname, kstpkper, totim):
+    def _accumulate_flow_ssst(self, budget, recname, data):
 
         # NOT AN INTERNAL FLOW TERM, SO MUST BE A SOURCE TERM OR STORAGE
         # ACCUMULATE THE FLOW BY ZONE
 
         imeth = self.imeth[recname]
 
-        data = self.cbc.get_data(text=recname, kstpkper=kstpkper, totim=totim)
-        if len(data) == 0:
-            # Empty data, can occur during the first time step of a transient
-            # model when storage terms are zero and not in the cell-budget
-            # file.
-            return
-        else:
-            data = data[0]
-
         if imeth == 2 or imeth == 5:
             # LIST
-            qin = np.ma.zeros(
-                (self.nlay * self.nrow * self.ncol), self.float_type
-            )
-            qout = np.ma.zeros(
-                (self.nlay * self.nrow * self.ncol), self.float_type
-            )
-            for [node, q] in zip(data["node"], data["q"]):
-                idx = node - 1
-                if q > 0:
-                    qin.data[idx] += q
-                elif q < 0:
-                    qout.data[idx] += q
-            qin = np.ma.reshape(qin, (self.nlay, self.nrow, self.ncol))
-            qout = np.ma.reshape(qout, (self.nlay, self.nrow, self.ncol))
+            zone = self._zoneidx.ravel()[data["node"] - 1]
+            q = data["q"]
         elif imeth == 0 or imeth == 1:
             # FULL 3-D ARRAY
-            qin = np.ma.zeros(self.cbc_shape, self.float_type)
-            qout = np.ma.zeros(self.cbc_shape, self.float_type)
-            qin[data > 0] = data[data > 0]
-            qout[data < 0] = data[data < 0]
+            zone = self._zoneidx.ravel()
+            q = np.ma.filled(data, 0.0).ravel()
         elif imeth == 3:
             # 1-LAYER ARRAY WITH LAYER INDICATOR ARRAY
             rlay, rdata = data[0], data[1]
-            data = np.ma.zeros(self.cbc_shape, self.float_type)
-            for (r, c), l in np.ndenumerate(rlay):
-                data[l - 1, r, c] = rdata[r, c]
-            qin = np.ma.zeros(self.cbc_shape, self.float_type)
-            qout = np.ma.zeros(self.cbc_shape, self.float_type)
-            qin[data > 0] = data[data > 0]
-            qout[data < 0] = data[data < 0]
+            r, c = np.indices(rlay.shape)
+            zone = self._zoneidx[rlay - 1, r, c].ravel()
+            q = rdata.ravel()
         elif imeth == 4:
             # 1-LAYER ARRAY THAT DEFINES LAYER 1
-            qin = np.ma.zeros(self.cbc_shape, self.float_type)
-            qout = np.ma.zeros(self.cbc_shape, self.float_type)
-            r, c = np.where(data > 0)
-            qin[0, r, c] = data[r, c]
-            r, c = np.where(data < 0)
-            qout[0, r, c] = data[r, c]
+            zone = self._zoneidx[0].ravel()
+            q = data.ravel()
         else:
             # Should not happen
             raise Exception(
                 f'Unrecognized "imeth" for {recname} record: {imeth}'
             )
 
-        # Inflows
-        fz = []
-        tz = []
-        f = []
-        for z in self.allzones:
-            if z != 0:
-                flux = qin[(self.izone == z)].sum()
-                if type(flux) == np.ma.core.MaskedConstant:
-                    flux = 0.0
-                fz.append("FROM_" + "_".join(recname.split()))
-                tz.append(self._zonenamedict[z])
-                f.append(flux)
-        fz = np.array(fz)
-        tz = np.array(tz)
-        f = np.array(f)
-        self._update_budget_fromssst(fz, tz, np.abs(f), kstpkper, totim)
-
-        # Outflows
-        fz = []
-        tz = []
-        f = []
-        for z in self.allzones:
-            if z != 0:
-                flux = qout[(self.izone == z)].sum()
-                if type(flux) == np.ma.core.MaskedConstant:
-                    flux = 0.0
-                fz.append("TO_" + "_".join(recname.split()))
-                tz.append(self._zonenamedict[z])
-                f.append(flux)
-        fz = np.array(fz)
-        tz = np.array(tz)
-        f = np.array(f)
-        self._update_budget_fromssst(fz, tz, np.abs(f), kstpkper, totim)
-
-    def _compute_mass_balance(self, kstpkper, totim):
-        # Returns a record array with total inflow, total outflow,
-        # and percent error summed by column.
-        skipcols = ["time_step", "stress_period", "totim", "name"]
-
-        # Compute inflows
-        recnames = self.get_record_names()
-        innames = [n for n in recnames if n.startswith("FROM_")]
-        outnames = [n for n in recnames if n.startswith("TO_")]
-        if kstpkper is not None:
-            rowidx = np.where(
-                (self._budget["time_step"] == kstpkper[0])
-                & (self._budget["stress_period"] == kstpkper[1])
-                & np.in1d(self._budget["name"], innames)
-            )
-        elif totim is not None:
-            rowidx = np.where(
-                (self._budget["totim"] == totim)
-                & np.in1d(self._budget["name"], innames)
-            )
-        a = _numpyvoid2numeric(
-            self._budget[list(self._zonenamedict.values())][rowidx]
-        )
-        intot = np.array(a.sum(axis=0))
-        tz = np.array(
-            list([n for n in self._budget.dtype.names if n not in skipcols])
-        )
-        fz = np.array(["TOTAL_IN"] * len(tz))
-        self._update_budget_fromssst(fz, tz, intot, kstpkper, totim)
+        # Inflows and outflows for each zone, zone 0 is not included
+        nzones = self._nzones
+        qin = np.bincount(zone[q > 0], q[q > 0], minlength=nzones)
+        qout = np.bincount(zone[q < 0], q[q < 0], minlength=nzones)
+        name = "_".join(recname.split())
+        self._add_to_row(budget, f"FROM_{name}", np.abs(qin) * self._nonzero)
+        self._add_to_row(budget, f"TO_{name}", np.abs(qout) * self._nonzero)
+        return
+
+    def _compute_mass_balance(self, budget, kstpkper, totim):
+        # Computes the total inflow, total outflow, and percent error for
+        # each zone and stores the budget of the time step in the budget
+        # record array.
+        budget = budget.astype(self.float_type).astype(np.float64)
+        names = list(self._rowidx.keys())
+        inrows = [self._rowidx[n] for n in names if n.startswith("FROM_")]
+        outrows = [self._rowidx[n] for n in names if n.startswith("TO_")]
+        intot = budget[inrows].sum(axis=0)
+        outot = budget[outrows].sum(axis=0)
+        budget[self._rowidx["TOTAL_IN"]] = intot
+        budget[self._rowidx["TOTAL_OUT"]] = outot
+        budget[self._rowidx["IN-OUT"]] = np.abs(intot - outot)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            f = 100 * (intot - outot) / ((intot + outot) / 2.0)
+        budget[self._rowidx["PERCENT_DISCREPANCY"]] = np.abs(f)
 
-        # Compute outflows
         if kstpkper is not None:
             rowidx = np.where(
                 (self._budget["time_step"] == kstpkper[0])
                 & (self._budget["stress_period"] == kstpkper[1])
-                & np.in1d(self._budget["name"], outnames)
-            )
-        elif totim is not None:
-            rowidx = np.where(
-                (self._budget["totim"] == totim)
-                & np.in1d(self._budget["name"], outnames)
-            )
-        a = _numpyvoid2numeric(
-            self._budget[list(self._zonenamedict.values())][rowidx]
-        )
-        outot = np.array(a.sum(axis=0))
-        tz = np.array(
-            list([n for n in self._budget.dtype.names if n not in skipcols])
-        )
-        fz = np.array(["TOTAL_OUT"] * len(tz))
-        self._update_budget_fromssst(fz, tz, outot, kstpkper, totim)
-
-        # Compute IN-OUT
-        tz = np.array(
-            list([n for n in self._budget.dtype.names if n not in skipcols])
-        )
-        f = intot - outot
-        fz = np.array(["IN-OUT"] * len(tz))
-        self._update_budget_fromssst(fz, tz, np.abs(f), kstpkper, totim)
-
-        # Compute percent discrepancy
-        tz = np.array(
-            list([n for n in self._budget.dtype.names if n not in skipcols])
-        )
-        fz = np.array(["PERCENT_DISCREPANCY"] * len(tz))
-        in_minus_out = intot - outot
-        in_plus_out = intot + outot
-        f = 100 * in_minus_out / (in_plus_out / 2.0)
-        self._update_budget_fromssst(fz, tz, np.abs(f), kstpkper, totim)
+            )[0]
+        else:
+            rowidx = np.where(self._budget["totim"] == totim)[0]
+        for i0 in range(0, len(rowidx), self._nrows):
+            rows = rowidx[i0 : i0 + self._nrows]
+            for iz, colname in enumerate(self._zonenamedict.values()):
+                self._budget[colname][rows] = budget[:, iz]
+        return
 
     def get_model_shape(self):
         """Get model shape
@@ -1755,6 +1350,205 @@ class ZoneBudget:
         return newobj
 
 
+class ZoneBudgetBatch:
+    """
+    Compute the budgets for several zone arrays from a single pass over a
+    cell budget file.  The cell-by-cell budget records for each time step
+    are read once and used to compute the budget of every zone array.
+
+    Parameters
+    ----------
+    cbc_file : str or CellBudgetFile object
+        The file name or CellBudgetFile object for which budgets will be
+        computed.
+    zones : dict, list or ndarray
+        The zone arrays to be used.  A dictionary of zonation names and
+        zone arrays, or a list or stacked ndarray of zone arrays.  The
+        zonations in a list or stacked array are named by their index.
+    kstpkper : tuple of ints
+        A tuple containing the time step and stress period (kstp, kper).
+        The kstp and kper values are zero based.
+    totim : float
+        The simulation time.
+    aliases : dict
+        A dictionary with key, value pairs of zones and aliases that is
+        used for all of the zone arrays.
+
+    Examples
+    --------
+
+    >>> from flopy.utils.zonbud import ZoneBudgetBatch
+    >>> zones = {'well1': zon1, 'well2': zon2}
+    >>> zbb = ZoneBudgetBatch('zonebudtest.cbc', zones, kstpkper=(0, 0))
+    >>> df = zbb.get_dataframes()
+    >>> bud = zbb['well1'].get_budget()
+    """
+
+    def __init__(
+        self,
+        cbc_file,
+        zones,
+        kstpkper=None,
+        totim=None,
+        aliases=None,
+        verbose=False,
+        **kwargs,
+    ):
+        from .binaryfile import CellBudgetFile
+
+        if isinstance(cbc_file, str) and os.path.isfile(cbc_file):
+            cbc_file = CellBudgetFile(cbc_file)
+
+        if isinstance(zones, dict):
+            zones = dict(zones)
+        elif isinstance(zones, (list, tuple, np.ndarray)):
+            zones = {i: z for i, z in enumerate(zones)}
+        else:
+            raise Exception(
+                "Please pass zones as a dictionary, list or stacked numpy "
+                "ndarray of zone arrays."
+            )
+        if len(zones) == 0:
+            raise Exception("No zone arrays were passed.")
+
+        # Check the zone arrays and initialize the budget of each zonation.
+        # All of the zonations share the CellBudgetFile object.
+        self.zonebudgets = {}
+        for name, z in zones.items():
+            zb = ZoneBudget.__new__(ZoneBudget)
+            zb._setup(cbc_file, z, kstpkper, totim, aliases, **kwargs)
+            self.zonebudgets[name] = zb
+        zb0 = next(iter(self.zonebudgets.values()))
+        self.cbc = zb0.cbc
+        self.kstpkper = zb0.kstpkper
+        self.totim = zb0.totim
+
+        # Read the records for each time step once and compute the budget
+        # of each zonation
+        if self.kstpkper is not None:
+            steps = [{"kstpkper": kk} for kk in self.kstpkper]
+        else:
+            steps = [{"totim": t} for t in self.totim]
+        for step in steps:
+            if verbose:
+                if "kstpkper" in step:
+                    kk = step["kstpkper"]
+                    s = (
+                        "Computing the budgets for"
+                        " time step {} in stress period {}".format(
+                            kk[0] + 1, kk[1] + 1
+                        )
+                    )
+                else:
+                    s = f"Computing the budgets for time {step['totim']}"
+                print(s)
+            records = zb0._read_budget_records(**step)
+            for zb in self.zonebudgets.values():
+                zb._compute_budget(records=records, **step)
+
+    def __getitem__(self, name):
+        return self.zonebudgets[name]
+
+    def __iter__(self):
+        return iter(self.zonebudgets)
+
+    def __len__(self):
+        return len(self.zonebudgets)
+
+    @property
+    def names(self):
+        """
+        List of the zonation names.
+
+        """
+        return list(self.zonebudgets.keys())
+
+    def get_budget(self, names=None, zones=None, net=False, pivot=False):
+        """
+        Get the zonebudget record array of each zonation.
+
+        Parameters
+        ----------
+
+        names : list of strings
+            A list of strings containing the names of the records desired.
+        zones : list of ints or strings
+            A list of integer zone numbers or zone names desired.
+        net : boolean
+            If True, returns net IN-OUT for each record.
+        pivot : boolean
+            If True, returns data in a more user friendly format
+
+        Returns
+        -------
+        budgets : dict
+            Dictionary of zonation names and zonebudget record arrays.
+
+        """
+        return {
+            name: zb.get_budget(names=names, zones=zones, net=net, pivot=pivot)
+            for name, zb in self.zonebudgets.items()
+        }
+
+    def get_dataframes(
+        self,
+        start_datetime=None,
+        timeunit="D",
+        index_key="totim",
+        names=None,
+        zones=None,
+        net=False,
+        pivot=False,
+    ):
+        """
+        Get a pandas dataframe with the budgets of all of the zonations.
+
+        Parameters
+        ----------
+
+        start_datetime : str
+            Datetime string indicating the time at which the simulation starts.
+        timeunit : str
+            String that indicates the time units used in the model.
+        index_key : str
+            Indicates the fields to be used (in addition to "record") in the
+            resulting DataFrame multi-index.
+        names : list of strings
+            A list of strings containing the names of the records desired.
+        zones : list of ints or strings
+            A list of integer zone numbers or zone names desired.
+        net : boolean
+            If True, returns net IN-OUT for each record.
+        pivot : bool
+            If True, returns dataframe in a more user friendly format
+
+        Returns
+        -------
+        df : Pandas DataFrame
+            Pandas DataFrame with the budget information.  The first level
+            of the index is the zonation name.  Zones that are not in a
+            zonation are NaN.
+
+        """
+        pd = import_optional_dependency(
+            "pandas",
+            error_message="ZoneBudgetBatch.get_dataframes() requires pandas.",
+        )
+        dfs = [
+            zb.get_dataframes(
+                start_datetime=start_datetime,
+                timeunit=timeunit,
+                index_key=index_key,
+                names=names,
+                zones=zones,
+                net=net,
+                pivot=pivot,
+            )
+            for zb in self.zonebudgets.values()
+        ]
+        return pd.concat(dfs, keys=self.names, names=["zonation"])
+
+
 class ZoneBudget6:
     """
     Model class for building, editing and running MODFLOW 6 zonebuget
@@ -2028,6 +1822,40 @@ class ZoneBudget6:
 
         return recarray
 
+    def compute_budget(self):
+        """
+        Method to compute the zonebudget in python from the FLOW-JA-FACE
+        and package records in the cell budget file and the IA and JA
+        arrays in the binary grid file, without running the zonebudget
+        executable. The budget is available from get_budget() and
+        get_dataframes() in the same form as the zonebudget output.
+
+        Returns
+        -------
+            None
+
+        Examples
+        --------
+        >>> from flopy.utils.zonbud import ZoneBudget6, ZoneFile6
+        >>> zb6 = ZoneBudget6(model_ws="my_model_ws")
+        >>> zf = ZoneFile6(zb6, izone)
+        >>> zb6.grb = "my_model.dis.grb"
+        >>> zb6.cbc = "my_model.cbc"
+        >>> zb6.compute_budget()
+        >>> df = zb6.get_dataframes()
+
+        """
+        for pkg_name in ("zon", "bud", "grb"):
+            if pkg_name not in self.package_dict:
+                raise Exception(
+                    f"{pkg_name} package must be added before computing "
+                    "the zonebudget"
+                )
+        aliases = self._zon.aliases
+        self._recarray = _zb6_compute_budget(
+            self._zon.izone, self._bud, self._grb.ia, self._grb.ja, aliases
+        )
+
     def get_volumetric_budget(
         self, modeltime, recarray=None, extrapolate_kper=False
     ):
@@ -2298,6 +2126,22 @@ class ZoneFile6:
         return zon
 
 
+def _compute_budget_worker(filename, precision, modelgrid, z, aliases, steps):
+    """
+    Compute the budget record array for a block of time steps in a worker
+    process.  The cell budget file is opened with the model grid of the
+    cell budget file in the main process, so the records have the same
+    shape.
+
+    """
+    from .binaryfile import CellBudgetFile
+
+    cbc = CellBudgetFile(filename, precision=precision, modelgrid=modelgrid)
+    zb = ZoneBudget(cbc, z, aliases=aliases, **steps)
+    cbc.close()
+    return zb._budget
+
+
 def _numpyvoid2numeric(a):
     # The budget record array has multiple dtypes and a slice returns
     # the flexible-type numpy.void which must be converted to a numeric
@@ -2848,6 +2692,128 @@ def _read_zb_csv2(fname, add_prefix=True, aliases=None):
         return _zb_dict_to_recarray(data, aliases=aliases)
 
 
+def _zb6_compute_budget(izone, cbc, ia, ja, aliases=None):
+    """
+    Method to compute a MODFLOW 6 zonebudget from a cell budget file
+
+    Parameters
+    ----------
+    izone : np.array
+        numpy array of zone numbers for each cell
+    cbc : CellBudgetFile object
+        MODFLOW 6 cell budget file
+    ia : np.array
+        zero based CSR row pointers from the binary grid file
+    ja : np.array
+        zero based CSR column indices from the binary grid file
+    aliases : dict
+        optional dictionary of zone aliases
+
+    Returns
+    -------
+        np.recarray
+    """
+    izone = np.asarray(izone).ravel()
+    ncells = len(ia) - 1
+    if izone.size != ncells:
+        raise Exception(
+            f"zone array size {izone.size} does not match the number of "
+            f"cells in the binary grid file {ncells}"
+        )
+
+    # zone index of each cell, zone 0 is always included in the flows
+    # between zones
+    allzones = np.unique(np.append(0, izone))
+    nzones = len(allzones)
+    zoneidx = np.searchsorted(allzones, izone)
+    outzones = allzones[allzones != 0]
+    outidx = np.searchsorted(allzones, outzones)
+
+    # connections between cells in different zones. FLOW-JA-FACE is
+    # positive for flow into the cell of the row (n) from the cell of the
+    # column (m).
+    n = np.repeat(np.arange(ncells), np.diff(ia))
+    iface = np.where(zoneidx[n] != zoneidx[ja])[0]
+    zonepair = zoneidx[n[iface]] * nzones + zoneidx[ja[iface]]
+
+    # the name of each budget term, with the package name for terms that
+    # are written by more than one package
+    textpaks = {}
+    for rec in cbc.recordarray:
+        text = rec["text"].decode().strip()
+        if text == "FLOW-JA-FACE" or text.startswith("DATA-"):
+            continue
+        paknam = rec["paknam2"].decode().strip()
+        textpaks.setdefault(text, [])
+        if paknam not in textpaks[text]:
+            textpaks[text].append(paknam)
+    termnames = {}
+    for text, paknams in textpaks.items():
+        for paknam in paknams:
+            if len(paknams) > 1:
+                termnames[(text, paknam)] = f"{paknam}-{text}"
+            else:
+                termnames[(text, paknam)] = text
+
+    kstpkper = cbc.get_kstpkper()
+    times = cbc.get_times()
+    nsteps = len(kstpkper)
+    terms = {
+        name: np.zeros((nsteps, 2, nzones)) for name in termnames.values()
+    }
+    interzone = np.zeros((nsteps, 2, nzones, nzones))
+    for istep, kk in enumerate(kstpkper):
+        for idx in np.where(
+            (cbc.recordarray["kstp"] == kk[0] + 1)
+            & (cbc.recordarray["kper"] == kk[1] + 1)
+        )[0]:
+            rec = cbc.recordarray[idx]
+            text = rec["text"].decode().strip()
+            if text.startswith("DATA-"):
+                continue
+            data = cbc.get_record(idx)
+            if text == "FLOW-JA-FACE":
+                q = np.asarray(data).ravel()[iface]
+                for iflow, sel in enumerate((q > 0, q < 0)):
+                    interzone[istep, iflow] += np.bincount(
+                        zonepair[sel],
+                        weights=np.abs(q[sel]),
+                        minlength=nzones * nzones,
+                    ).reshape(nzones, nzones)
+                continue
+            paknam = rec["paknam2"].decode().strip()
+            if rec["imeth"] == 6:
+                zone = zoneidx[data["node"] - 1]
+                q = data["q"]
+            else:
+                zone = zoneidx
+                q = np.ma.filled(np.asarray(data), 0.0).ravel()
+            name = termnames[(text, paknam)]
+            for iflow, sel in enumerate((q > 0, q < 0)):
+                terms[name][istep, iflow] += np.bincount(
+                    zone[sel], weights=np.abs(q[sel]), minlength=nzones
+                )
+
+    # build the columns of the zonebudget csv file
+    nout = len(outzones)
+    data = {
+        "TOTIM": list(np.repeat(times, nout)),
+        "KSTP": [kk[0] for kk in kstpkper for _ in outzones],
+        "KPER": [kk[1] for kk in kstpkper for _ in outzones],
+        "ZONE": [int(z) for z in outzones] * nsteps,
+    }
+    for iflow, suffix in enumerate(("IN", "OUT")):
+        for name, values in terms.items():
+            col = f"{name}-{suffix}".upper().replace("-", "_")
+            col = "_".join(col.split())
+            data[col] = list(values[:, iflow, outidx].ravel())
+    for iflow, prefix in enumerate(("FROM", "TO")):
+        for iz, z in enumerate(allzones):
+            col = f"{prefix}_ZONE_{z}"
+            data[col] = list(interzone[:, iflow][:, outidx, iz].ravel())
+    return _zb_dict_to_recarray(data, aliases=aliases)
+
+
 def _zb_dict_to_recarray(data, aliases=None):
     """
     Method to check the zonebudget dictionary and convert it to a